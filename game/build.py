@@ -6,9 +6,65 @@ This script handles building the game for web deployment.
 
 import os
 import sys
+import json
+import hashlib
+import io
+import math
+from fnmatch import fnmatch
 import subprocess
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Source sprites; the repo root folder keeps its historical spelling
+ASSET_DIRS = (Path("assets"), Path("../assests"))
+ATLAS_MAX_SIZE = 4096
+ATLAS_PADDING = 2
+ATLAS_MANIFEST = "atlas.json"
+# Unhashed entry point mapping logical asset paths to content-hashed files
+ASSET_MANIFEST = "asset-manifest.json"
+# Unhashed load plan for the runtime AssetManager
+PRELOAD_MANIFEST = "preload.json"
+# (pattern on logical path, group, priority); first match wins. The "menu"
+# group is loaded before the first frame, the rest streams lowest priority first.
+# Atlas pages take the group of the sprites packed on them
+ASSET_GROUPS = (
+    (ATLAS_MANIFEST, "menu", 0),
+    ("*.ogg", "gameplay", 10),
+    ("*.wav", "gameplay", 10),
+    ("*", "extra", 100),
+)
+# (pattern on sprite name, group); first match wins. Each group is packed onto
+# its own atlas pages, so preloading the menu never decodes gameplay sprites
+SPRITE_GROUPS = (
+    ("bg_*", "menu"),
+    ("bird_*", "menu"),
+    ("*", "gameplay"),
+)
+# Load priority of each sprite group's pages; pages are numbered in this order
+ATLAS_PRIORITIES = {"menu": 0, "gameplay": 5}
+ASSET_KINDS = {
+    ".png": "image",
+    ".jpg": "image",
+    ".ogg": "audio",
+    ".wav": "audio",
+    ".json": "data",
+}
+# Kept outside build/web so it is never deployed; bump the version to
+# invalidate every cached stage after changing how a stage works
+BUILD_CACHE = Path("build/.cache/build-cache.json")
+BUILD_CACHE_VERSION = 3
+# FR-019: everything under build/web/assets must fit in 2 MB
+ASSET_BUDGET_BYTES = 2 * 1024 * 1024
+# Palette conversion counts as visually lossless at or above this PSNR
+QUANTIZE_MIN_PSNR = 40.0
+# Optional per-sprite target resolutions, e.g. {"pipe_top": (96, 768)}
+IMAGE_TARGETS: Dict[str, Tuple[int, int]] = {}
+
+
+class AssetBudgetExceeded(Exception):
+    """The optimized assets are larger than the download budget."""
 
 
 def clean_build():
@@ -17,54 +73,573 @@ def clean_build():
     if build_dir.exists():
         print("🧹 Cleaning previous build...")
         shutil.rmtree(build_dir)
+    if BUILD_CACHE.exists():
+        BUILD_CACHE.unlink()
     build_dir.mkdir(parents=True, exist_ok=True)
 
 
-def build_web():
+def hash_file(path: Path) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 16), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def hash_inputs(paths: Iterable[Path], params=None) -> str:
+    """Cache key for a stage: its input files (by name and content) and params."""
+    digest = hashlib.sha256(
+        json.dumps([BUILD_CACHE_VERSION, params], sort_keys=True).encode()
+    )
+    for path in sorted(paths):
+        digest.update(path.as_posix().encode() + b"\0" + hash_file(path).encode())
+    return digest.hexdigest()
+
+
+def hashed_name(name: str, digest: str) -> str:
+    """``bird.png`` -> ``bird.<hash>.png`` so browsers can cache it forever."""
+    stem, dot, suffix = name.partition(".")
+    return f"{stem}.{digest[:12]}{dot}{suffix}"
+
+
+def load_build_cache() -> Dict:
+    try:
+        with open(BUILD_CACHE) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {"version": BUILD_CACHE_VERSION, "stages": {}}
+    if cache.get("version") != BUILD_CACHE_VERSION:
+        return {"version": BUILD_CACHE_VERSION, "stages": {}}
+    return cache
+
+
+def save_build_cache(cache: Dict) -> None:
+    BUILD_CACHE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = BUILD_CACHE.with_suffix(".tmp")
+    with open(tmp, "w") as f:
+        json.dump(cache, f, indent=2, sort_keys=True)
+    os.replace(tmp, BUILD_CACHE)
+
+
+def stage_is_fresh(cache: Dict, stage: str, key: str, root: Path) -> bool:
+    """True when ``stage`` last ran with ``key`` and its outputs still exist."""
+    entry = cache["stages"].get(stage)
+    return (
+        bool(entry and entry["outputs"])
+        and entry["key"] == key
+        and all((root / out).exists() for out in entry["outputs"])
+    )
+
+
+def _encode_png(image) -> bytes:
+    # No pnginfo/exif is passed, so metadata chunks are dropped
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def _psnr(a, b) -> float:
+    from PIL import ImageChops, ImageStat
+
+    rms = ImageStat.Stat(ImageChops.difference(a, b)).rms
+    error = math.sqrt(sum(r * r for r in rms) / len(rms))
+    return math.inf if error == 0 else 20 * math.log10(255 / error)
+
+
+def optimize_image(data: bytes, target: Optional[Tuple[int, int]] = None) -> bytes:
+    """Smallest visually lossless PNG encoding of ``data``.
+
+    Resizes to ``target`` if given, drops an all-opaque alpha channel, and
+    tries 256-colour palettes, keeping one only if it scores at least
+    ``QUANTIZE_MIN_PSNR`` against the full-colour image.
+    """
+    from PIL import Image
+
+    with Image.open(io.BytesIO(data)) as source:
+        image = (
+            source.convert("RGBA")
+            if source.mode not in ("RGB", "RGBA")
+            else source.copy()
+        )
+    if target is not None and image.size != tuple(target):
+        image = image.resize(tuple(target), Image.Resampling.LANCZOS)
+    if image.mode == "RGBA" and image.getextrema()[3] == (255, 255):
+        image = image.convert("RGB")
+
+    candidates = [_encode_png(image)]
+    methods = [Image.Quantize.FASTOCTREE]
+    if image.mode == "RGB":
+        methods.append(Image.Quantize.MEDIANCUT)
+    for method in methods:
+        palette = image.quantize(256, method=method, dither=Image.Dither.NONE)
+        if _psnr(palette.convert(image.mode), image) >= QUANTIZE_MIN_PSNR:
+            candidates.append(_encode_png(palette))
+    best = min(candidates, key=len)
+    # Re-encoding can lose to an already tight file; keep the original then
+    return best if target is not None or len(best) < len(data) else data
+
+
+def _optimize_job(job):
+    name, data, target = job
+    return name, optimize_image(data, target)
+
+
+def optimize_images(
+    jobs: Dict[str, Tuple[bytes, Optional[Tuple[int, int]]]],
+    workers: Optional[int] = None,
+) -> Dict[str, bytes]:
+    """Run ``optimize_image`` over ``{name: (data, target)}`` on a process pool.
+
+    ``workers=0`` runs in-process (no pool start-up for tiny batches).
+    """
+    items = [(name, data, target) for name, (data, target) in jobs.items()]
+    if workers == 0 or len(items) <= 1:
+        return dict(map(_optimize_job, items))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return dict(pool.map(_optimize_job, items))
+
+
+def size_report(
+    rows: List[Tuple[str, int, int]], budget: int = ASSET_BUDGET_BYTES
+) -> int:
+    """Print per-asset before/after sizes; returns the total after bytes."""
+    before = sum(row[1] for row in rows)
+    after = sum(row[2] for row in rows)
+    width = max([len(row[0]) for row in rows] + [5])
+    print(f"{'asset':<{width}}  {'before':>10}  {'after':>10}")
+    for name, old, new in rows:
+        print(f"{name:<{width}}  {old:>10,}  {new:>10,}")
+    print(f"{'total':<{width}}  {before:>10,}  {after:>10,}  (budget {budget:,})")
+    return after
+
+
+def package_version(name: str) -> Optional[str]:
+    """Installed version of ``name``, or None when it is not installed."""
+    from importlib import metadata
+
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def web_inputs() -> List[Path]:
+    """Everything pygbag packs: sources, its config and the icon and assets."""
+    inputs = list(Path("src").rglob("*.py"))
+    inputs += [
+        path
+        for path in (Path("pygbag.toml"), Path("assets/icon.png"))
+        if path.is_file()
+    ]
+    assets = find_assets_dir()
+    if assets is not None:
+        inputs += [path for path in assets.rglob("*") if path.is_file()]
+    return sorted(set(inputs))
+
+
+def build_web(cache: Optional[Dict] = None):
     """Build the game for web using pygbag."""
+    key = hash_inputs(web_inputs(), {"pygbag": package_version("pygbag")})
+    if cache is not None and stage_is_fresh(cache, "web", key, Path("build/web")):
+        print("⏭️  Sources, config and assets unchanged, skipping pygbag build")
+        return
     print("🔨 Building game for web...")
-    
+
     try:
         # Run pygbag build
         cmd = [
-            sys.executable, "-m", "pygbag",
+            sys.executable,
+            "-m",
+            "pygbag",
             "--build",
-            "--template", "default",
-            "--title", "Rialo Bird",
-            "--icon", "assets/icon.png" if Path("assets/icon.png").exists() else None,
-            "src/main.py"
+            "--template",
+            "default",
+            "--title",
+            "Rialo Bird",
+            "--icon",
+            "assets/icon.png" if Path("assets/icon.png").exists() else None,
+            "src/main.py",
         ]
-        
+
         # Remove None values
         cmd = [arg for arg in cmd if arg is not None]
-        
+
         result = subprocess.run(cmd, check=True, capture_output=True, text=True)
         print("✅ Build completed successfully!")
         print(result.stdout)
-        
+        if cache is not None:
+            outputs = [
+                p.relative_to("build/web").as_posix()
+                for p in Path("build/web").rglob("*")
+                if p.is_file() and "assets" not in p.relative_to("build/web").parts[:1]
+            ]
+            cache["stages"]["web"] = {"key": key, "outputs": outputs}
+
     except subprocess.CalledProcessError as e:
         print(f"❌ Build failed: {e}")
         print(f"Error output: {e.stderr}")
         sys.exit(1)
 
 
-def optimize_assets():
-    """Optimize assets for web deployment."""
+def find_assets_dir():
+    """Return the first existing asset source directory, or None."""
+    for candidate in ASSET_DIRS:
+        if candidate.is_dir():
+            return candidate
+    return None
+
+
+def sprite_name(path: Path) -> str:
+    """Manifest key for a sprite file: its name up to the first dot."""
+    return path.name.split(".", 1)[0]
+
+
+def sprite_group(name: str) -> str:
+    return next(group for pattern, group in SPRITE_GROUPS if fnmatch(name, pattern))
+
+
+def _pot_sizes(max_size: int) -> List[int]:
+    return [1 << k for k in range(max_size.bit_length()) if 1 << k <= max_size]
+
+
+def _shelf_pack(names, sizes, width, height, padding):
+    """Place ``names`` (tallest first) on shelves; returns (placements, leftover)."""
+    placements, leftover = {}, []
+    x = y = shelf_height = 0
+    for name in names:
+        w, h = sizes[name]
+        cell_w, cell_h = w + 2 * padding, h + 2 * padding
+        if x + cell_w > width:
+            x, y, shelf_height = 0, y + shelf_height, 0
+        if x + cell_w > width or y + cell_h > height:
+            leftover.append(name)
+            continue
+        placements[name] = (x + padding, y + padding, w, h)
+        x += cell_w
+        shelf_height = max(shelf_height, cell_h)
+    return placements, leftover
+
+
+def pack_sprites(
+    sizes: Dict[str, Tuple[int, int]],
+    max_size: int = ATLAS_MAX_SIZE,
+    padding: int = ATLAS_PADDING,
+) -> List[Dict]:
+    """Shelf-pack sprite sizes into power-of-two pages.
+
+    Each page is the smallest POT rectangle (up to ``max_size``) that holds
+    every remaining sprite; when none does, a full-size page is filled and
+    the rest spill onto further pages.
+    """
+    for name, (w, h) in sizes.items():
+        if w + 2 * padding > max_size or h + 2 * padding > max_size:
+            raise ValueError(
+                f"sprite {name!r} ({w}x{h}) does not fit a {max_size}px atlas"
+            )
+    remaining = sorted(sizes, key=lambda n: (-sizes[n][1], -sizes[n][0], n))
+    # Smallest area first; squarer pages win ties
+    candidates = sorted(
+        ((w, h) for w in _pot_sizes(max_size) for h in _pot_sizes(max_size)),
+        key=lambda wh: (
+            wh[0] * wh[1],
+            abs(wh[0].bit_length() - wh[1].bit_length()),
+            -wh[0],
+        ),
+    )
+    pages = []
+    while remaining:
+        for width, height in candidates:
+            placements, leftover = _shelf_pack(remaining, sizes, width, height, padding)
+            if not leftover:
+                break
+        else:
+            width = height = max_size
+            placements, leftover = _shelf_pack(remaining, sizes, width, height, padding)
+        pages.append({"width": width, "height": height, "sprites": placements})
+        remaining = leftover
+    return pages
+
+
+def _extrude(page, image, x, y, padding):
+    """Repeat the sprite's edge pixels into its padding to stop filter bleed."""
+    w, h = image.size
+    for i in range(1, padding + 1):
+        page.paste(image.crop((0, 0, w, 1)), (x, y - i))
+        page.paste(image.crop((0, h - 1, w, h)), (x, y + h - 1 + i))
+        page.paste(image.crop((0, 0, 1, h)), (x - i, y))
+        page.paste(image.crop((w - 1, 0, w, h)), (x + w - 1 + i, y))
+
+
+def build_atlases(
+    sprite_paths: List[Path],
+    output_dir: Path,
+    max_size: int = ATLAS_MAX_SIZE,
+    padding: int = ATLAS_PADDING,
+    targets: Optional[Dict[str, Tuple[int, int]]] = None,
+    workers: Optional[int] = None,
+) -> Dict:
+    """Pack PNG sprites into POT atlas pages and write a UV manifest.
+
+    The manifest maps each sprite name to its page, pixel rect and UVs
+    (origin top-left) so the runtime can draw sub-rectangles of one texture.
+    Each ``SPRITE_GROUPS`` group is packed onto its own pages, tagged with
+    the group. Pages and the manifest get content-hashed names; the returned
+    manifest's ``file`` is the manifest's own name. Sprites listed in
+    ``targets`` are resized first; pages go through ``optimize_images``.
+    """
+    from PIL import Image
+
+    targets = targets or {}
+    images = {}
+    for path in sprite_paths:
+        name = sprite_name(path)
+        with Image.open(path) as image:
+            images[name] = image.convert("RGBA")
+        if name in targets:
+            images[name] = images[name].resize(targets[name], Image.Resampling.LANCZOS)
+    groups: Dict[str, Dict[str, Tuple[int, int]]] = {}
+    for name, image in images.items():
+        groups.setdefault(sprite_group(name), {})[name] = image.size
+    pages = []
+    for group in sorted(groups, key=lambda g: (ATLAS_PRIORITIES.get(g, 100), g)):
+        for page in pack_sprites(groups[group], max_size, padding):
+            pages.append(dict(page, group=group))
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "version": 1,
+        "origin": "top-left",
+        "padding": padding,
+        "atlases": [],
+        "sprites": {},
+    }
+    encoded = {}
+    for index, page in enumerate(pages):
+        width, height = page["width"], page["height"]
+        canvas = Image.new("RGBA", (width, height), (0, 0, 0, 0))
+        for name, (x, y, w, h) in page["sprites"].items():
+            canvas.paste(images[name], (x, y))
+            _extrude(canvas, images[name], x, y, padding)
+            manifest["sprites"][name] = {
+                "atlas": index,
+                "x": x,
+                "y": y,
+                "w": w,
+                "h": h,
+                "u0": x / width,
+                "v0": y / height,
+                "u1": (x + w) / width,
+                "v1": (y + h) / height,
+            }
+        encoded[index] = (_encode_png(canvas), None)
+
+    for index, data in sorted(optimize_images(encoded, workers).items()):
+        filename = hashed_name(f"atlas_{index}.png", hashlib.sha256(data).hexdigest())
+        (output_dir / filename).write_bytes(data)
+        page = pages[index]
+        manifest["atlases"].append(
+            {
+                "file": filename,
+                "width": page["width"],
+                "height": page["height"],
+                "group": page["group"],
+            }
+        )
+
+    data = json.dumps(manifest, indent=2, sort_keys=True).encode()
+    manifest_name = hashed_name(ATLAS_MANIFEST, hashlib.sha256(data).hexdigest())
+    (output_dir / manifest_name).write_bytes(data)
+    manifest["file"] = manifest_name
+    return manifest
+
+
+def write_preload_manifest(
+    build_assets_dir: Path, asset_manifest: Dict[str, str]
+) -> Dict:
+    """Write the runtime load plan: size, kind, group and priority per asset."""
+    files = dict(asset_manifest)
+    page_groups = {}
+    if ATLAS_MANIFEST in asset_manifest:
+        with open(build_assets_dir / asset_manifest[ATLAS_MANIFEST]) as f:
+            for index, page in enumerate(json.load(f)["atlases"]):
+                files[f"atlas_{index}.png"] = page["file"]
+                page_groups[f"atlas_{index}.png"] = page["group"]
+    entries = []
+    for name, file in files.items():
+        if name in page_groups:
+            group = page_groups[name]
+            priority = ATLAS_PRIORITIES.get(group, 100)
+        else:
+            group, priority = next(
+                (g, p) for pattern, g, p in ASSET_GROUPS if fnmatch(name, pattern)
+            )
+        entries.append(
+            {
+                "name": name,
+                "file": file,
+                "size": (build_assets_dir / file).stat().st_size,
+                "kind": ASSET_KINDS.get(Path(name).suffix.lower(), "binary"),
+                "group": group,
+                "priority": priority,
+            }
+        )
+    entries.sort(key=lambda e: (e["priority"], e["size"], e["name"]))
+    preload = {"version": 1, "assets": entries}
+    with open(build_assets_dir / PRELOAD_MANIFEST, "w") as f:
+        json.dump(preload, f, indent=2)
+    return preload
+
+
+def optimize_assets(
+    cache: Optional[Dict] = None,
+    workers: Optional[int] = None,
+    budget: int = ASSET_BUDGET_BYTES,
+    targets: Optional[Dict[str, Tuple[int, int]]] = None,
+) -> Dict[str, str]:
+    """Optimize assets for web deployment.
+
+    Incremental: every output is content-hashed, stages whose inputs are
+    unchanged (per the build cache) are skipped, and files no longer produced
+    are pruned. PNGs are recompressed on a process pool, a per-asset size
+    report is printed, and ``AssetBudgetExceeded`` is raised when the output
+    is over ``budget``. Returns the logical-path -> hashed-file asset manifest.
+    """
     print("🎨 Optimizing assets...")
-    
-    assets_dir = Path("assets")
+
+    assets_dir = find_assets_dir()
     build_assets_dir = Path("build/web/assets")
-    
-    if not assets_dir.exists():
+    cache = cache if cache is not None else load_build_cache()
+    targets = IMAGE_TARGETS if targets is None else targets
+
+    if assets_dir is None:
         print("⚠️  No assets directory found, skipping optimization")
-        return
-    
-    # Copy assets to build directory
-    if build_assets_dir.exists():
-        shutil.rmtree(build_assets_dir)
-    shutil.copytree(assets_dir, build_assets_dir)
-    
-    print("✅ Assets copied to build directory")
+        return {}
+
+    build_assets_dir.mkdir(parents=True, exist_ok=True)
+    asset_manifest: Dict[str, str] = {}
+    report: List[Tuple[str, int, int]] = []
+    copied = skipped = 0
+
+    # Top-level PNG sprites go into atlases; anything else is copied as-is
+    sprites = sorted(assets_dir.glob("*.png"))
+    others = sorted(
+        p
+        for p in assets_dir.rglob("*")
+        if p.is_file()
+        and p not in sprites
+        and not any(part.startswith(".") for part in p.relative_to(assets_dir).parts)
+    )
+    png_jobs, png_keys = {}, {}
+    for path in others:
+        rel = path.relative_to(assets_dir)
+        if path.suffix.lower() == ".png":
+            stage = "file:" + rel.as_posix()
+            key = hash_inputs([path], {"target": targets.get(sprite_name(path))})
+            if stage_is_fresh(cache, stage, key, build_assets_dir):
+                asset_manifest[rel.as_posix()] = cache["stages"][stage]["outputs"][0]
+                skipped += 1
+            else:
+                png_jobs[rel.as_posix()] = (
+                    path.read_bytes(),
+                    targets.get(sprite_name(path)),
+                )
+                png_keys[rel.as_posix()] = (stage, key)
+            continue
+        target = rel.with_name(hashed_name(rel.name, hash_file(path)))
+        # Same hash means same bytes; nothing to do
+        if (build_assets_dir / target).exists():
+            skipped += 1
+        else:
+            (build_assets_dir / target).parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(path, build_assets_dir / target)
+            copied += 1
+        asset_manifest[rel.as_posix()] = target.as_posix()
+
+    for rel, data in optimize_images(png_jobs, workers).items():
+        target = Path(rel).with_name(
+            hashed_name(Path(rel).name, hashlib.sha256(data).hexdigest())
+        )
+        (build_assets_dir / target).parent.mkdir(parents=True, exist_ok=True)
+        (build_assets_dir / target).write_bytes(data)
+        stage, key = png_keys[rel]
+        cache["stages"][stage] = {"key": key, "outputs": [target.as_posix()]}
+        asset_manifest[rel] = target.as_posix()
+        copied += 1
+
+    for path in others:
+        rel = path.relative_to(assets_dir).as_posix()
+        report.append(
+            (
+                rel,
+                path.stat().st_size,
+                (build_assets_dir / asset_manifest[rel]).stat().st_size,
+            )
+        )
+
+    if sprites:
+        atlas_params = {
+            "max_size": ATLAS_MAX_SIZE,
+            "padding": ATLAS_PADDING,
+            "groups": [list(rule) for rule in SPRITE_GROUPS],
+            "priorities": ATLAS_PRIORITIES,
+            "targets": {n: list(t) for n, t in sorted(targets.items())},
+        }
+        key = hash_inputs(sprites, atlas_params)
+        if stage_is_fresh(cache, "atlas", key, build_assets_dir):
+            print("⏭️  Sprites unchanged, reusing atlases")
+        else:
+            manifest = build_atlases(
+                sprites, build_assets_dir, targets=targets, workers=workers
+            )
+            outputs = [manifest["file"]] + [
+                page["file"] for page in manifest["atlases"]
+            ]
+            cache["stages"]["atlas"] = {"key": key, "outputs": outputs}
+            print(
+                f"✅ Packed {len(manifest['sprites'])} sprites into "
+                f"{len(manifest['atlases'])} atlas(es)"
+            )
+        outputs = cache["stages"]["atlas"]["outputs"]
+        asset_manifest[ATLAS_MANIFEST] = outputs[0]
+        report.append(
+            (
+                f"atlas ({len(sprites)} sprites)",
+                sum(p.stat().st_size for p in sprites),
+                sum((build_assets_dir / out).stat().st_size for out in outputs),
+            )
+        )
+
+    # Drop outputs and cache entries from previous builds that nothing references
+    live_stages = {"atlas", "web"} | {"file:" + rel for rel in asset_manifest}
+    cache["stages"] = {k: v for k, v in cache["stages"].items() if k in live_stages}
+    keep = set(asset_manifest.values()) | set(
+        cache["stages"].get("atlas", {}).get("outputs", [])
+    )
+    for path in sorted(build_assets_dir.rglob("*"), reverse=True):
+        rel = path.relative_to(build_assets_dir).as_posix()
+        if (
+            path.is_file()
+            and rel not in keep
+            and rel not in (ASSET_MANIFEST, PRELOAD_MANIFEST)
+        ):
+            path.unlink()
+        elif path.is_dir() and not any(path.iterdir()):
+            path.rmdir()
+
+    with open(build_assets_dir / ASSET_MANIFEST, "w") as f:
+        json.dump(asset_manifest, f, indent=2, sort_keys=True)
+    write_preload_manifest(build_assets_dir, asset_manifest)
+    save_build_cache(cache)
+
+    print(f"✅ Assets up to date ({copied} written, {skipped} unchanged)")
+    size_report(report, budget)
+    total = sum(p.stat().st_size for p in build_assets_dir.rglob("*") if p.is_file())
+    if total > budget:
+        raise AssetBudgetExceeded(
+            f"assets are {total:,} bytes, over the {budget:,} byte budget"
+        )
+    return asset_manifest
 
 
 def create_index_html():
@@ -109,32 +684,39 @@ def create_index_html():
     <script type="module" src="./main.py"></script>
 </body>
 </html>"""
-    
+
+    Path("build/web").mkdir(parents=True, exist_ok=True)
     with open("build/web/index.html", "w") as f:
         f.write(index_content)
-    
+
     print("✅ Custom index.html created")
 
 
 def main():
     """Main build process."""
     print("🚀 Starting Rialo Bird build process...")
-    
+
     # Change to game directory
     os.chdir(Path(__file__).parent)
-    
-    # Clean previous build
-    clean_build()
-    
+
+    # Builds are incremental; --clean forces everything to be rebuilt
+    if "--clean" in sys.argv[1:]:
+        clean_build()
+    cache = load_build_cache()
+
     # Build for web
-    build_web()
-    
+    build_web(cache)
+
     # Optimize assets
-    optimize_assets()
-    
+    try:
+        optimize_assets(cache)
+    except AssetBudgetExceeded as e:
+        print(f"❌ Build failed: {e}")
+        sys.exit(1)
+
     # Create custom index.html
     create_index_html()
-    
+
     print("🎉 Build process completed!")
     print("📁 Build output: build/web/")
     print("🌐 To test locally: cd build/web && python -m http.server 8000")
@@ -142,4 +724,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-
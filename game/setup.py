@@ -12,6 +12,7 @@ setup(
         "pygbag>=0.6.0",
         "httpx>=0.28.1",
         "python-dotenv>=1.1.1",
+        "numpy>=1.24.0",
     ],
     extras_require={
         "dev": [
@@ -20,6 +21,7 @@ setup(
             "pytest>=8.3.4",
             "pytest-asyncio>=0.24.0",
             "playwright>=1.48.0",
+            "Pillow>=10.0.0",
         ]
     },
     python_requires=">=3.8",
@@ -35,4 +37,3 @@ setup(
         "Programming Language :: Python :: 3.12",
     ],
 )
-
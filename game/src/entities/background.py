@@ -2,9 +2,7 @@ from dataclasses import dataclass, field
 from game.src.models.vector import Vector2
 
 
-@dataclass
+@dataclass(slots=True)
 class Background:
     position: Vector2 = field(default_factory=Vector2)
     scroll_speed: float = 0.0
-
-
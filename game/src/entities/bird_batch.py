@@ -0,0 +1,66 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from game.src.entities.views import BirdView
+
+
+class BirdBatch:
+    """Struct-of-arrays storage for many birds stepped together.
+
+    Each field of ``Bird`` is a contiguous float64 column so PhysicsSystem can
+    advance every bird in one vectorized step; row ``i`` is one bird and
+    ``view(i)`` gives a Bird-compatible object for code that reads
+    ``bird.position.y``.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        x: float = 0.0,
+        y: float = 0.0,
+        width: float = 64.0,
+        height: float = 64.0,
+    ) -> None:
+        self.x = np.full(count, x, dtype=np.float64)
+        self.y = np.full(count, y, dtype=np.float64)
+        self.vx = np.zeros(count, dtype=np.float64)
+        self.vy = np.zeros(count, dtype=np.float64)
+        self.rotation = np.zeros(count, dtype=np.float64)
+        self.width = np.full(count, width, dtype=np.float64)
+        self.height = np.full(count, height, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __iter__(self) -> Iterator[BirdView]:
+        return (BirdView(self, i) for i in range(len(self)))
+
+    def view(self, i: int) -> BirdView:
+        return BirdView(self, i)
+
+    @classmethod
+    def from_birds(cls, birds: Iterable) -> "BirdBatch":
+        birds = list(birds)
+        batch = cls(len(birds))
+        for i, bird in enumerate(birds):
+            batch.x[i] = bird.position.x
+            batch.y[i] = bird.position.y
+            batch.vx[i] = bird.velocity.x
+            batch.vy[i] = bird.velocity.y
+            batch.rotation[i] = bird.rotation
+            batch.width[i] = bird.width
+            batch.height[i] = bird.height
+        return batch
+
+    def write_back(self, birds: Iterable) -> None:
+        # Copy columns back onto Bird objects as plain Python floats
+        xs, ys = self.x.tolist(), self.y.tolist()
+        vxs, vys = self.vx.tolist(), self.vy.tolist()
+        rotations = self.rotation.tolist()
+        for i, bird in enumerate(birds):
+            bird.position.x = xs[i]
+            bird.position.y = ys[i]
+            bird.velocity.x = vxs[i]
+            bird.velocity.y = vys[i]
+            bird.rotation = rotations[i]
@@ -0,0 +1,50 @@
+from typing import Iterable, Iterator
+
+import numpy as np
+
+from game.src.entities.views import PipeView
+
+
+class PipeBatch:
+    """Struct-of-arrays storage for pipes, one contiguous float64 column per field.
+
+    Row ``i`` mirrors the fields of ``Pipe``; ``view(i)`` gives a Pipe-compatible
+    object for code that reads ``pipe.position.x``.
+    """
+
+    def __init__(
+        self,
+        count: int,
+        gap_y: float = 300.0,
+        gap_size: float = 150.0,
+        width: float = 80.0,
+        height: float = 600.0,
+    ) -> None:
+        self.x = np.zeros(count, dtype=np.float64)
+        self.y = np.zeros(count, dtype=np.float64)
+        self.gap_y = np.full(count, gap_y, dtype=np.float64)
+        self.gap_size = np.full(count, gap_size, dtype=np.float64)
+        self.width = np.full(count, width, dtype=np.float64)
+        self.height = np.full(count, height, dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self.x)
+
+    def __iter__(self) -> Iterator[PipeView]:
+        return (PipeView(self, i) for i in range(len(self)))
+
+    def view(self, i: int) -> PipeView:
+        return PipeView(self, i)
+
+    @classmethod
+    def from_pipes(cls, pipes: Iterable) -> "PipeBatch":
+        pipes = list(pipes)
+        batch = cls(len(pipes))
+        for i, pipe in enumerate(pipes):
+            batch.x[i] = pipe.position.x
+            batch.y[i] = pipe.position.y
+            batch.gap_y[i] = pipe.gap_y
+            batch.gap_size[i] = pipe.gap_size
+            batch.width[i] = pipe.width
+            batch.height[i] = pipe.height
+        return batch
@@ -0,0 +1,95 @@
+class VectorView:
+    """Vector2-compatible view onto one row of two column arrays."""
+
+    __slots__ = ("_xs", "_ys", "_i")
+
+    def __init__(self, xs, ys, i: int) -> None:
+        self._xs = xs
+        self._ys = ys
+        self._i = i
+
+    @property
+    def x(self) -> float:
+        return float(self._xs[self._i])
+
+    @x.setter
+    def x(self, value: float) -> None:
+        self._xs[self._i] = value
+
+    @property
+    def y(self) -> float:
+        return float(self._ys[self._i])
+
+    @y.setter
+    def y(self, value: float) -> None:
+        self._ys[self._i] = value
+
+    def __iter__(self):
+        yield self.x
+        yield self.y
+
+    def __repr__(self) -> str:
+        return f"VectorView(x={self.x}, y={self.y})"
+
+
+class BirdView:
+    """Bird-compatible view onto row ``i`` of a BirdBatch."""
+
+    __slots__ = ("_batch", "_i", "position", "velocity")
+
+    def __init__(self, batch, i: int) -> None:
+        self._batch = batch
+        self._i = i
+        self.position = VectorView(batch.x, batch.y, i)
+        self.velocity = VectorView(batch.vx, batch.vy, i)
+
+    @property
+    def rotation(self) -> float:
+        return float(self._batch.rotation[self._i])
+
+    @rotation.setter
+    def rotation(self, value: float) -> None:
+        self._batch.rotation[self._i] = value
+
+    @property
+    def width(self) -> float:
+        return float(self._batch.width[self._i])
+
+    @property
+    def height(self) -> float:
+        return float(self._batch.height[self._i])
+
+
+class PipeView:
+    """Pipe-compatible view onto row ``i`` of a PipeBatch."""
+
+    __slots__ = ("_batch", "_i", "position")
+
+    def __init__(self, batch, i: int) -> None:
+        self._batch = batch
+        self._i = i
+        self.position = VectorView(batch.x, batch.y, i)
+
+    @property
+    def gap_y(self) -> float:
+        return float(self._batch.gap_y[self._i])
+
+    @gap_y.setter
+    def gap_y(self, value: float) -> None:
+        self._batch.gap_y[self._i] = value
+
+    @property
+    def gap_size(self) -> float:
+        return float(self._batch.gap_size[self._i])
+
+    @gap_size.setter
+    def gap_size(self, value: float) -> None:
+        self._batch.gap_size[self._i] = value
+
+    @property
+    def width(self) -> float:
+        return float(self._batch.width[self._i])
+
+    @property
+    def height(self) -> float:
+        return float(self._batch.height[self._i])
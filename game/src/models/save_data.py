@@ -1,4 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, fields
+
+SAVE_FILE = "save.json"
 
 
 @dataclass
@@ -6,4 +8,11 @@ class SaveData:
     high_score: int = 0
     last_score: int = 0
 
+    @classmethod
+    def load(cls, storage) -> "SaveData":
+        data = storage.load_json(SAVE_FILE, {})
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in data.items() if k in known})
 
+    def save(self, storage) -> None:
+        storage.save_json(SAVE_FILE, asdict(self))
@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Vector2:
     x: float = 0.0
     y: float = 0.0
@@ -9,5 +9,3 @@ class Vector2:
     def __iter__(self):
         yield self.x
         yield self.y
-
-
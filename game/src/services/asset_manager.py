@@ -0,0 +1,214 @@
+import heapq
+import io
+import json
+import sys
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+PRELOAD_MANIFEST = "preload.json"
+MENU_GROUP = "menu"
+# pygbag's CPython has no usable threads; decoding then runs from pump()
+THREADS_AVAILABLE = sys.platform != "emscripten"
+
+
+def _decode_image(data: bytes) -> Tuple[Any, int]:
+    from PIL import Image
+
+    image = Image.open(io.BytesIO(data))
+    image.load()
+    return image, image.width * image.height * 4
+
+
+def _decode_data(data: bytes) -> Tuple[Any, int]:
+    return json.loads(data), len(data)
+
+
+def _decode_raw(data: bytes) -> Tuple[Any, int]:
+    return data, len(data)
+
+
+DECODERS: Dict[str, Callable[[bytes], Tuple[Any, int]]] = {
+    "image": _decode_image,
+    "data": _decode_data,
+    "audio": _decode_raw,
+    "binary": _decode_raw,
+}
+
+
+class AssetManager:
+    """Loads assets listed in the build's ``preload.json`` on demand.
+
+    ``preload()`` blocks only for the menu group; ``stream()`` queues the rest
+    by manifest priority for worker threads (or for ``pump()`` on platforms
+    without threads). Decoded assets sit in an LRU cache bounded by their
+    decoded size, and anything evicted is simply reloaded on the next ``get``.
+    """
+
+    def __init__(
+        self,
+        root: str = "assets",
+        max_bytes: int = 64 * 1024 * 1024,
+        workers: int = 2,
+        threaded: Optional[bool] = None,
+        fetch: Optional[Callable[[str], bytes]] = None,
+        decoders: Optional[Dict[str, Callable[[bytes], Tuple[Any, int]]]] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.fetch = fetch or (lambda file: (self.root / file).read_bytes())
+        self.decoders = dict(DECODERS, **(decoders or {}))
+        self.threaded = THREADS_AVAILABLE if threaded is None else threaded
+        self.entries: Dict[str, Dict] = {}
+        self.cache: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self.cached_bytes = 0
+        self.loads = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Condition(self._lock)
+        self._queue: List[Tuple[int, int, str]] = []
+        self._order = 0
+        self._pending: Dict[str, Future] = {}
+        self._claimed = set()
+        self._closed = False
+        self._workers = []
+        if self.threaded:
+            for _ in range(workers):
+                worker = threading.Thread(target=self._work, daemon=True)
+                worker.start()
+                self._workers.append(worker)
+
+    def load_manifest(self, name: str = PRELOAD_MANIFEST) -> None:
+        for entry in json.loads(self.fetch(name))["assets"]:
+            self.entries[entry["name"]] = entry
+
+    def group(self, group: str) -> List[str]:
+        return [name for name, entry in self.entries.items() if entry["group"] == group]
+
+    def _load(self, name: str) -> Any:
+        entry = self.entries[name]
+        value, size = self.decoders[entry["kind"]](self.fetch(entry["file"]))
+        with self._lock:
+            self.loads += 1
+            self._store(name, value, size)
+        return value
+
+    def _store(self, name: str, value: Any, size: int) -> None:
+        # Caller holds the lock
+        if name in self.cache:
+            self.cached_bytes -= self.cache.pop(name)[1]
+        self.cache[name] = (value, size)
+        self.cached_bytes += size
+        while self.cached_bytes > self.max_bytes and len(self.cache) > 1:
+            _, (_, evicted) = self.cache.popitem(last=False)
+            self.cached_bytes -= evicted
+            self.evictions += 1
+
+    def _claim(self, name: str) -> Optional[Future]:
+        # Caller holds the lock; whoever claims a pending load performs it
+        future = self._pending.get(name)
+        if future is None or name in self._claimed:
+            return None
+        self._claimed.add(name)
+        return future
+
+    def _run(self, name: str, future: Future) -> None:
+        try:
+            future.set_result(self._load(name))
+        except Exception as e:
+            future.set_exception(e)
+        finally:
+            with self._lock:
+                self._pending.pop(name, None)
+                self._claimed.discard(name)
+
+    def _work(self) -> None:
+        while True:
+            with self._wake:
+                while not self._queue and not self._closed:
+                    self._wake.wait()
+                if self._closed:
+                    return
+                _, _, name = heapq.heappop(self._queue)
+                future = self._claim(name)
+            if future is not None:
+                self._run(name, future)
+
+    def request(self, name: str, priority: Optional[int] = None) -> Future:
+        """Queue ``name`` for background loading; lower ``priority`` goes first.
+
+        Re-requesting a queued asset with a lower priority moves it forward.
+        """
+        with self._wake:
+            if name in self.cache:
+                self.cache.move_to_end(name)
+                future = Future()
+                future.set_result(self.cache[name][0])
+                return future
+            future = self._pending.get(name)
+            if future is None:
+                future = self._pending[name] = Future()
+            if priority is None:
+                priority = self.entries[name]["priority"]
+            self._order += 1
+            # Stale heap items for the same name are skipped once it is loaded
+            heapq.heappush(self._queue, (priority, self._order, name))
+            self._wake.notify()
+            return future
+
+    def get(self, name: str) -> Any:
+        """Decoded asset, loading it on this thread if it is not cached."""
+        with self._lock:
+            if name in self.cache:
+                self.cache.move_to_end(name)
+                return self.cache[name][0]
+            pending = self._pending.get(name)
+            future = self._claim(name)
+        if future is not None:
+            # Still queued: load it now instead of waiting for its turn
+            self._run(name, future)
+            return future.result()
+        if pending is not None:
+            # A worker is already decoding it
+            return pending.result()
+        return self._load(name)
+
+    def preload(self, group: str = MENU_GROUP) -> None:
+        """Load every asset in ``group`` now; call before the first frame."""
+        for name in self.group(group):
+            self.get(name)
+
+    def stream(self, groups: Optional[Iterable[str]] = None) -> None:
+        """Queue every not-yet-loaded asset (optionally only ``groups``) by priority."""
+        for name, entry in self.entries.items():
+            if (groups is None or entry["group"] in groups) and name not in self.cache:
+                self.request(name)
+
+    def pump(self, budget: float = 0.004) -> int:
+        """Without threads, decode queued assets for up to ``budget`` seconds."""
+        if self.threaded:
+            return 0
+        done = 0
+        deadline = time.perf_counter() + budget
+        while self._queue and (done == 0 or time.perf_counter() < deadline):
+            _, _, name = heapq.heappop(self._queue)
+            future = self._claim(name)
+            if future is not None:
+                self._run(name, future)
+                done += 1
+        return done
+
+    def sprite(self, name: str, atlas: str = "atlas.json") -> Tuple[Any, Dict]:
+        """(atlas page image, rect/UV entry) for a packed sprite."""
+        entry = self.get(atlas)["sprites"][name]
+        return self.get(f"atlas_{entry['atlas']}.png"), entry
+
+    def close(self) -> None:
+        with self._wake:
+            self._closed = True
+            self._wake.notify_all()
+        for worker in self._workers:
+            worker.join()
@@ -0,0 +1,112 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+Loader = Callable[[], Awaitable[Any]]
+
+
+class _Entry:
+    __slots__ = ("value", "fetched_at")
+
+    def __init__(self, value: Any, fetched_at: float) -> None:
+        self.value = value
+        self.fetched_at = fetched_at
+
+
+class SWRCache:
+    """Async TTL cache with stale-while-revalidate and request coalescing.
+
+    Entries younger than ``ttl`` are served directly. Entries up to
+    ``ttl + stale_ttl`` old are served immediately while one background
+    refresh runs. Concurrent callers for the same key share a single in-flight
+    load, and ``invalidate`` discards entries and any load started before it.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        stale_ttl: float = 300.0,
+        max_entries: int = 64,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._generation = 0
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def peek(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value (fresh or stale) without loading, else None."""
+        entry = self._entries.get(key)
+        if (
+            entry is None
+            or self._clock() - entry.fetched_at > self.ttl + self.stale_ttl
+        ):
+            return None
+        return entry.value
+
+    async def get(self, key: Hashable, loader: Loader) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.fetched_at
+            if age <= self.ttl:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if age <= self.ttl + self.stale_ttl:
+                self.stale_hits += 1
+                self._load(key, loader)
+                return entry.value
+        self.misses += 1
+        # Shield so one cancelled caller does not cancel the shared load
+        return await asyncio.shield(self._load(key, loader))
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop ``key`` (or everything) and ignore results of loads in flight.
+
+        Loads in flight are detached too, so the next ``get`` starts a fresh
+        load instead of joining one that began before a write.
+        """
+        if key is None:
+            self._entries.clear()
+            self._inflight.clear()
+        else:
+            self._entries.pop(key, None)
+            self._inflight.pop(key, None)
+        self._generation += 1
+
+    def _load(self, key: Hashable, loader: Loader) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._run(key, loader, self._generation))
+            task.add_done_callback(_consume_exception)
+            self._inflight[key] = task
+        return task
+
+    async def _run(self, key: Hashable, loader: Loader, generation: int) -> Any:
+        try:
+            self.loads += 1
+            value = await loader()
+            if generation == self._generation:
+                self._entries[key] = _Entry(value, self._clock())
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return value
+        finally:
+            # A load detached by invalidate must not drop its replacement
+            if self._inflight.get(key) is asyncio.current_task():
+                del self._inflight[key]
+
+
+def _consume_exception(task: asyncio.Task) -> None:
+    # Background refresh failures keep the stale value; waiters still see them
+    if not task.cancelled():
+        task.exception()
@@ -1,16 +1,251 @@
-from typing import List, Dict
+import base64
+import uuid
+from typing import AsyncIterator, List, Dict, Optional
+
+import httpx
+
+from game.src.services.cache import SWRCache
+from game.src.services.rank_index import RankIndex
+
+LEADERBOARD_PATH = "/leaderboard"
+LEADERBOARD_FIELDS = "id,name,score,created_at"
+# Total order used for keyset paging: ties on score broken by age, then id
+KEYSET_ORDER = "score.desc,created_at.asc,id.asc"
+MAX_PAGE_SIZE = 50
+
+
+def _quote(value) -> str:
+    # PostgREST needs reserved characters (e.g. ':' and '.' in timestamps) quoted
+    return '"' + str(value).replace('"', '\\"') + '"'
+
+
+def keyset_filter(after: Dict) -> str:
+    """PostgREST ``or`` filter selecting rows that sort after ``after``."""
+    score, created_at, row_id = (
+        int(after["score"]),
+        _quote(after["created_at"]),
+        _quote(after["id"]),
+    )
+    return (
+        f"(score.lt.{score},"
+        f"and(score.eq.{score},created_at.gt.{created_at}),"
+        f"and(score.eq.{score},created_at.eq.{created_at},id.gt.{row_id}))"
+    )
+
+
+def _encode_replay(replay: Optional[bytes]) -> Optional[str]:
+    # Replays travel as base64 text in the nullable ``replay`` column
+    return None if replay is None else base64.b64encode(replay).decode("ascii")
+
+
+def _content_range_total(response: httpx.Response) -> int:
+    # "0-0/123" or "*/0" with Prefer: count=exact
+    return int(response.headers["Content-Range"].rsplit("/", 1)[1])
 
 
 class LeaderboardService:
-    def __init__(self, client) -> None:
+    def __init__(self, client, cache: Optional[SWRCache] = None, outbox=None) -> None:
         self.client = client
+        self.cache = cache if cache is not None else SWRCache(ttl=30.0, stale_ttl=300.0)
+        self.outbox = outbox
+        # Every row fetched or submitted feeds local rank estimates
+        self.rank_index = RankIndex()
+
+    @staticmethod
+    def _top_key(limit: int, offset: int, filters: Optional[Dict[str, str]]):
+        return ("top", limit, offset, tuple(sorted((filters or {}).items())))
 
     def fetch_top(self, limit: int = 10) -> List[Dict]:
-        # Return empty list to satisfy contract shape without hitting network
-        return []
+        # Serve whatever is cached without hitting network; empty until loaded
+        cached = self.cache.peek(self._top_key(limit, 0, None))
+        return list(cached) if cached is not None else []
 
-    def submit_score(self, name: str, score: int) -> Dict:
+    def submit_score(
+        self, name: str, score: int, replay: Optional[bytes] = None
+    ) -> Dict:
+        # Queue durably for the next sync when an outbox is configured
+        if self.outbox is not None:
+            return self._enqueue(name, score, replay)
         # Return a stub record
-        return {"id": "stub", "name": name, "score": int(score), "created_at": "1970-01-01T00:00:00Z"}
+        return {
+            "id": "stub",
+            "name": name,
+            "score": int(score),
+            "created_at": "1970-01-01T00:00:00Z",
+        }
+
+    def _enqueue(
+        self,
+        name: str,
+        score: int,
+        replay: Optional[bytes],
+        record_id: Optional[str] = None,
+    ) -> Dict:
+        record = self.outbox.enqueue(name, score, _encode_replay(replay), record_id)
+        self.rank_index.add(record)
+        return record
+
+    async def _cached_get(self, key, params: Dict) -> List[Dict]:
+        async def load() -> List[Dict]:
+            response = await self.client.get(LEADERBOARD_PATH, params=params)
+            response.raise_for_status()
+            rows = response.json()
+            self.rank_index.update(rows)
+            return rows
+
+        return await self.cache.get(key, load)
+
+    def estimate_rank(self, score: int) -> int:
+        """Instant rank for ``score`` from rows seen so far; no network."""
+        return self.rank_index.rank(score)
+
+    async def afetch_rank(self, score: int) -> int:
+        """Authoritative rank: one exact count of strictly higher scores.
+
+        Also refreshes the index's total so later estimates extrapolate.
+        """
+        headers = {"Prefer": "count=exact"}
+        higher = await self.client.get(
+            LEADERBOARD_PATH,
+            params={"select": "id", "score": f"gt.{int(score)}", "limit": 1},
+            headers=headers,
+        )
+        higher.raise_for_status()
+        total = await self.client.get(
+            LEADERBOARD_PATH, params={"select": "id", "limit": 1}, headers=headers
+        )
+        total.raise_for_status()
+        self.rank_index.total = _content_range_total(total)
+        return _content_range_total(higher) + 1
+
+    async def afetch_top(
+        self,
+        limit: int = 10,
+        offset: int = 0,
+        filters: Optional[Dict[str, str]] = None,
+    ) -> List[Dict]:
+        """Top scores through the cache; misses GET over the pooled connection.
+
+        ``filters`` are extra PostgREST column filters, e.g. ``{"score": "gte.10"}``.
+        """
+        params = {"select": LEADERBOARD_FIELDS, "order": KEYSET_ORDER, "limit": limit}
+        if offset:
+            params["offset"] = offset
+        params.update(filters or {})
+        return await self._cached_get(self._top_key(limit, offset, filters), params)
+
+    async def afetch_page(
+        self, limit: int = MAX_PAGE_SIZE, after: Optional[Dict] = None
+    ) -> List[Dict]:
+        """One keyset page in rank order, starting after the row ``after``.
+
+        Unlike ``offset`` paging, each page costs the same however deep it is.
+        """
+        params = {
+            "select": LEADERBOARD_FIELDS,
+            "order": KEYSET_ORDER,
+            "limit": min(limit, MAX_PAGE_SIZE),
+        }
+        cursor = None
+        if after is not None:
+            params["or"] = keyset_filter(after)
+            cursor = (after["score"], after["created_at"], after["id"])
+        return await self._cached_get(("page", params["limit"], cursor), params)
+
+    async def aiter_leaderboard(
+        self, page_size: int = MAX_PAGE_SIZE
+    ) -> AsyncIterator[List[Dict]]:
+        """Stream the whole leaderboard page by page using keyset cursors."""
+        after = None
+        while True:
+            page = await self.afetch_page(page_size, after)
+            if page:
+                yield page
+            if len(page) < min(page_size, MAX_PAGE_SIZE):
+                return
+            after = page[-1]
+
+    async def afetch_around_score(
+        self, score: int, above: int = 5, below: int = 5
+    ) -> List[Dict]:
+        """Rows ranked just above and at-or-below ``score``, in rank order."""
+        rows: List[Dict] = []
+        if above:
+            params = {
+                "select": LEADERBOARD_FIELDS,
+                "order": "score.asc,created_at.desc,id.desc",
+                "limit": min(above, MAX_PAGE_SIZE),
+                "score": f"gt.{int(score)}",
+            }
+            rows.extend(
+                reversed(await self._cached_get(("above", score, above), params))
+            )
+        if below:
+            params = {
+                "select": LEADERBOARD_FIELDS,
+                "order": KEYSET_ORDER,
+                "limit": min(below, MAX_PAGE_SIZE),
+                "score": f"lte.{int(score)}",
+            }
+            rows.extend(await self._cached_get(("below", score, below), params))
+        return rows
+
+    async def afetch_around_rank(self, rank: int, radius: int = 5) -> List[Dict]:
+        """Rows from rank ``rank - radius`` to ``rank + radius`` (1-based)."""
+        start = max(0, rank - 1 - radius)
+        limit = min(rank - 1 - start + radius + 1, MAX_PAGE_SIZE)
+        params = {
+            "select": LEADERBOARD_FIELDS,
+            "order": KEYSET_ORDER,
+            "limit": limit,
+            "offset": start,
+        }
+        return await self._cached_get(("rank", start, limit), params)
+
+    async def asubmit_score(
+        self, name: str, score: int, replay: Optional[bytes] = None
+    ) -> Dict:
+        """POST a score (and optionally its binary replay) and return the stored record.
 
+        With an outbox configured, network failures, 429 and 5xx responses
+        queue the score locally instead of raising. The client-generated id
+        is queued with it, so a POST that landed before failing is not
+        inserted twice when the outbox retries it.
+        """
+        record_id = str(uuid.uuid4())
+        body = {"id": record_id, "name": name, "score": int(score)}
+        if replay is not None:
+            body["replay"] = _encode_replay(replay)
+        try:
+            response = await self.client.post(
+                LEADERBOARD_PATH,
+                json=body,
+                # Keep the replay out of the echoed representation
+                params={"select": LEADERBOARD_FIELDS},
+                headers={"Prefer": "return=representation"},
+            )
+        except httpx.TransportError:
+            if self.outbox is None:
+                raise
+            return self._enqueue(name, score, replay, record_id)
+        if self.outbox is not None and (
+            response.status_code == 429 or response.status_code >= 500
+        ):
+            return self._enqueue(name, score, replay, record_id)
+        response.raise_for_status()
+        # A new score can reorder any cached page
+        self.cache.invalidate()
+        data = response.json()
+        # PostgREST returns a list for return=representation
+        record = data[0] if isinstance(data, list) else data
+        self.rank_index.add(record)
+        return record
 
+    async def sync_outbox(self) -> int:
+        """Upload queued scores (call on reconnect); returns how many landed."""
+        if self.outbox is None:
+            return 0
+        delivered = await self.outbox.drain(self.client)
+        if delivered:
+            self.cache.invalidate()
+        return delivered
@@ -0,0 +1,386 @@
+"""In-process stand-in for the Supabase ``/rest/v1/leaderboard`` endpoint.
+
+Implements the GET/POST contract from specs/001-title-rialo-bird/contracts on an
+SQLite table with a score index, including validation, check-constraint and
+RLS-style errors and 429 rate limiting. Use ``transport()`` to point a
+SupabaseClient at it without sockets, or ``serve()`` to expose it over HTTP
+(``SUPABASE_REST_URL=http://127.0.0.1:<port>/rest/v1``) for the contract tests.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import httpx
+
+COLUMNS = ("id", "name", "score", "created_at", "replay")
+MAX_LIMIT = 50
+FILTER_OPS = {"eq": "=", "neq": "!=", "gt": ">", "gte": ">=", "lt": "<", "lte": "<="}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS leaderboard (
+  id TEXT PRIMARY KEY,
+  name TEXT NOT NULL CHECK (length(name) <= 16),
+  score INTEGER NOT NULL CHECK (score >= 0 AND score <= 1000000),
+  created_at TEXT NOT NULL,
+  replay TEXT
+);
+CREATE INDEX IF NOT EXISTS leaderboard_rank_idx
+  ON leaderboard (score DESC, created_at, id);
+"""
+
+
+class PostgrestError(Exception):
+    def __init__(self, status: int, code: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+
+class _Windows:
+    # Synchronous sliding-window counter used for the server-side 429s
+    def __init__(self, windows: Sequence[Tuple[int, float]]) -> None:
+        self.windows = tuple(windows)
+        self._sent: Dict[str, List[deque]] = {}
+
+    def allow(self, key: str, now: float) -> bool:
+        sent = self._sent.setdefault(key, [deque() for _ in self.windows])
+        for (limit, period), times in zip(self.windows, sent):
+            while times and now - times[0] >= period:
+                times.popleft()
+            if len(times) >= limit:
+                return False
+        for times in sent:
+            times.append(now)
+        return True
+
+
+class LocalPostgrest:
+    def __init__(
+        self,
+        anon_key: Optional[str] = None,
+        database: str = ":memory:",
+        rate_limits: Optional[Sequence[Tuple[int, float]]] = None,
+        clock=time.monotonic,
+    ) -> None:
+        self.anon_key = anon_key
+        self._db = sqlite3.connect(database, check_same_thread=False)
+        self._db.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self._limits = _Windows(rate_limits) if rate_limits else None
+        self._clock = clock
+        self.requests = 0
+
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self.handle)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        try:
+            self._authorize(request)
+            if not request.url.path.rstrip("/").endswith("/leaderboard"):
+                raise PostgrestError(
+                    404, "42P01", f"relation {request.url.path!r} does not exist"
+                )
+            if request.method == "GET":
+                return self._get(request)
+            if request.method == "POST":
+                return self._post(request)
+            raise PostgrestError(
+                405, "PGRST105", f"method {request.method} not allowed"
+            )
+        except PostgrestError as e:
+            return httpx.Response(
+                e.status,
+                json={
+                    "code": e.code,
+                    "message": e.message,
+                    "details": None,
+                    "hint": None,
+                },
+            )
+
+    def _authorize(self, request: httpx.Request) -> None:
+        apikey = request.headers.get("apikey", "")
+        if self.anon_key is not None and apikey != self.anon_key:
+            raise PostgrestError(401, "PGRST301", "Invalid API key")
+        if self._limits is not None and not self._limits.allow(apikey, self._clock()):
+            raise PostgrestError(429, "PGRST429", "Too many requests")
+
+    # -- GET -------------------------------------------------------------
+
+    @staticmethod
+    def _select(request: httpx.Request) -> List[str]:
+        select = [c.strip() for c in request.url.params.get("select", "*").split(",")]
+        if select == ["*"]:
+            select = list(COLUMNS)
+        for column in select:
+            _check_column(column)
+        return select
+
+    def _get(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        select = self._select(request)
+
+        where, args = [], []
+        for key, value in params.multi_items():
+            if key in ("select", "order", "limit", "offset"):
+                continue
+            if key in ("or", "and"):
+                clause, clause_args = _logic(key, value)
+            else:
+                clause, clause_args = _filter(key, value)
+            where.append(clause)
+            args.extend(clause_args)
+
+        order = []
+        for term in params.get("order", "score.desc").split(","):
+            column, _, direction = term.partition(".")
+            _check_column(column)
+            if direction not in ("", "asc", "desc"):
+                raise PostgrestError(
+                    400, "PGRST100", f"invalid order direction {direction!r}"
+                )
+            order.append(f"{column} {direction.upper() or 'ASC'}")
+
+        limit = _int_param(params.get("limit", "10"), "limit")
+        offset = _int_param(params.get("offset", "0"), "offset")
+        if not 1 <= limit <= MAX_LIMIT:
+            raise PostgrestError(
+                400, "PGRST100", f"limit must be between 1 and {MAX_LIMIT}"
+            )
+
+        sql = f"SELECT {', '.join(select)} FROM leaderboard"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += f" ORDER BY {', '.join(order)} LIMIT ? OFFSET ?"
+        with self._lock:
+            rows = self._db.execute(sql, args + [limit, offset]).fetchall()
+            total = None
+            if "count=exact" in request.headers.get("Prefer", ""):
+                count_sql = "SELECT COUNT(*) FROM leaderboard" + (
+                    " WHERE " + " AND ".join(where) if where else ""
+                )
+                total = self._db.execute(count_sql, args).fetchone()[0]
+        body = [dict(zip(select, row)) for row in rows]
+        headers = {}
+        if total is not None:
+            end = offset + len(body) - 1
+            headers["Content-Range"] = (
+                f"{offset}-{end}/{total}" if body else f"*/{total}"
+            )
+        return httpx.Response(200, json=body, headers=headers)
+
+    # -- POST ------------------------------------------------------------
+
+    def _post(self, request: httpx.Request) -> httpx.Response:
+        try:
+            body = json.loads(request.content or b"null")
+        except json.JSONDecodeError:
+            raise PostgrestError(400, "PGRST102", "Invalid JSON body")
+        rows = body if isinstance(body, list) else [body]
+        if not rows or not all(isinstance(r, dict) for r in rows):
+            raise PostgrestError(
+                400, "PGRST102", "Body must be an object or an array of objects"
+            )
+        # A bulk insert names its columns once, from the objects' shared keys
+        if any(row.keys() != rows[0].keys() for row in rows):
+            raise PostgrestError(400, "PGRST102", "All object keys must match")
+        records = [self._validate(row) for row in rows]
+        # ?select= shapes the return=representation body, as in PostgREST
+        select = self._select(request)
+
+        prefer = request.headers.get("Prefer", "")
+        ignore_duplicates = "resolution=ignore-duplicates" in prefer
+        verb = "INSERT OR IGNORE" if ignore_duplicates else "INSERT"
+        with self._lock:
+            try:
+                with self._db:
+                    inserted = []
+                    for record in records:
+                        cursor = self._db.execute(
+                            f"{verb} INTO leaderboard"
+                            " (id, name, score, created_at, replay)"
+                            " VALUES (?, ?, ?, ?, ?)",
+                            (
+                                record["id"],
+                                record["name"],
+                                record["score"],
+                                record["created_at"],
+                                record["replay"],
+                            ),
+                        )
+                        if cursor.rowcount:
+                            inserted.append(record)
+            except sqlite3.IntegrityError as e:
+                if "UNIQUE" in str(e):
+                    raise PostgrestError(
+                        409, "23505", "duplicate key value violates unique constraint"
+                    )
+                raise PostgrestError(
+                    400, "23514", f"new row violates check constraint: {e}"
+                )
+        if "return=representation" in prefer:
+            return httpx.Response(
+                201, json=[{c: r[c] for c in select} for r in inserted]
+            )
+        return httpx.Response(201)
+
+    @staticmethod
+    def _validate(row: Dict) -> Dict:
+        unknown = set(row) - set(COLUMNS)
+        if unknown:
+            raise PostgrestError(
+                400, "PGRST204", f"Could not find column {sorted(unknown)[0]!r}"
+            )
+        name, score = row.get("name"), row.get("score")
+        if name is None or score is None:
+            raise PostgrestError(
+                400, "23502", "null value violates not-null constraint"
+            )
+        if (
+            not isinstance(name, str)
+            or isinstance(score, bool)
+            or not isinstance(score, int)
+        ):
+            raise PostgrestError(400, "22P02", "invalid input syntax")
+        if len(name) > 16 or not 0 <= score <= 1_000_000:
+            raise PostgrestError(
+                400,
+                "23514",
+                'new row for relation "leaderboard" violates check constraint',
+            )
+        # Anonymous insert policy (RLS) adds the lower bound on the name
+        if len(name) < 1:
+            raise PostgrestError(
+                403,
+                "42501",
+                'new row violates row-level security policy for table "leaderboard"',
+            )
+        created_at = row.get("created_at") or datetime.now(timezone.utc).isoformat(
+            timespec="microseconds"
+        )
+        replay = row.get("replay")
+        if replay is not None and not isinstance(replay, str):
+            raise PostgrestError(400, "22P02", "invalid input syntax")
+        return {
+            "id": str(row.get("id") or uuid.uuid4()),
+            "name": name,
+            "score": score,
+            "created_at": created_at,
+            "replay": replay,
+        }
+
+    # -- HTTP ------------------------------------------------------------
+
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> ThreadingHTTPServer:
+        """Serve over HTTP on a background thread; returns the started server."""
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _dispatch(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                request = httpx.Request(
+                    self.command,
+                    f"http://{host}{self.path}",
+                    headers=dict(self.headers.items()),
+                    content=self.rfile.read(length) if length else b"",
+                )
+                response = stand_in.handle(request)
+                self.send_response(response.status_code)
+                for key, value in response.headers.items():
+                    if key.lower() not in ("content-length", "transfer-encoding"):
+                        self.send_header(key, value)
+                self.send_header("Content-Length", str(len(response.content)))
+                self.end_headers()
+                self.wfile.write(response.content)
+
+            do_GET = do_POST = _dispatch
+
+            def log_message(self, *args) -> None:
+                pass
+
+        server = ThreadingHTTPServer((host, port), Handler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        return server
+
+
+def _check_column(column: str) -> None:
+    if column not in COLUMNS:
+        raise PostgrestError(
+            400, "42703", f"column leaderboard.{column} does not exist"
+        )
+
+
+def _int_param(value: str, name: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        raise PostgrestError(400, "PGRST100", f"invalid {name} {value!r}")
+
+
+def _filter(column: str, expression: str) -> Tuple[str, List]:
+    _check_column(column)
+    op, _, value = expression.partition(".")
+    if op not in FILTER_OPS:
+        raise PostgrestError(400, "PGRST100", f"unsupported filter operator {op!r}")
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        value = value[1:-1]
+    if column == "score":
+        value = _int_param(value, column)
+    return f"{column} {FILTER_OPS[op]} ?", [value]
+
+
+def _split_top_level(text: str) -> List[str]:
+    # Split on commas outside parentheses and double quotes
+    parts, depth, quoted, start = [], 0, False, 0
+    for i, ch in enumerate(text):
+        if ch == '"':
+            quoted = not quoted
+        elif not quoted and ch == "(":
+            depth += 1
+        elif not quoted and ch == ")":
+            depth -= 1
+        elif not quoted and ch == "," and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return parts
+
+
+def _logic(operator: str, expression: str) -> Tuple[str, List]:
+    """Translate ``or=(a.gt.1,and(b.eq.2,c.lt.3))`` style filters to SQL."""
+    if not (expression.startswith("(") and expression.endswith(")")):
+        raise PostgrestError(400, "PGRST100", f"invalid logic tree {expression!r}")
+    clauses, args = [], []
+    for term in _split_top_level(expression[1:-1]):
+        head = term.split("(", 1)[0]
+        if head in ("or", "and"):
+            clause, term_args = _logic(head, term[len(head) :])
+        else:
+            column, _, rest = term.partition(".")
+            clause, term_args = _filter(column, rest)
+        clauses.append(clause)
+        args.extend(term_args)
+    return "(" + f" {operator.upper()} ".join(clauses) + ")", args
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run the local leaderboard stand-in")
+    parser.add_argument("--port", type=int, default=54321)
+    parser.add_argument("--anon-key", default=None)
+    args = parser.parse_args()
+    httpd = LocalPostgrest(anon_key=args.anon_key).serve(port=args.port)
+    print(
+        f"🗄️  Local leaderboard at http://127.0.0.1:{httpd.server_address[1]}/rest/v1"
+    )
+    threading.Event().wait()
@@ -0,0 +1,66 @@
+import json
+import os
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+DATA_DIR_ENV = "RIALO_BIRD_DATA_DIR"
+
+
+class LocalStorage:
+    """Small JSON files in the game's data directory.
+
+    Defaults to ``$RIALO_BIRD_DATA_DIR`` or ``~/.rialo_bird``; in the pygbag build
+    this directory is persisted to IndexedDB.
+    """
+
+    def __init__(self, root: Optional[str] = None) -> None:
+        root = (
+            root or os.getenv(DATA_DIR_ENV) or os.path.join(Path.home(), ".rialo_bird")
+        )
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path(self, name: str) -> Path:
+        return self.root / name
+
+    def load_json(self, name: str, default: Any = None) -> Any:
+        try:
+            with open(self.path(name)) as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return default
+
+    def save_json(self, name: str, data: Any) -> None:
+        # Write then rename so a crash never leaves a half-written file
+        tmp = self.path(name + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump(data, f)
+        os.replace(tmp, self.path(name))
+
+    def append_line(self, name: str, line: str) -> None:
+        with open(self.path(name), "ab+") as f:
+            # A crash mid-append leaves a torn last line that read_lines skips;
+            # end it first so this line is not glued onto the fragment
+            end = f.seek(0, os.SEEK_END)
+            if end:
+                f.seek(end - 1)
+                if f.read(1) != b"\n":
+                    f.write(b"\n")
+            f.write(line.encode("utf-8") + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def read_lines(self, name: str) -> Iterator[str]:
+        try:
+            with open(self.path(name)) as f:
+                for line in f:
+                    if line.endswith("\n"):
+                        yield line.rstrip("\n")
+        except FileNotFoundError:
+            return
+
+    def remove(self, name: str) -> None:
+        try:
+            os.remove(self.path(name))
+        except FileNotFoundError:
+            pass
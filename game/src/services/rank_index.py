@@ -0,0 +1,62 @@
+from bisect import bisect_right, insort
+from typing import Dict, Iterable, List, Optional
+
+
+class RankIndex:
+    """Local rank and percentile lookups built from leaderboard snapshots.
+
+    Known scores live in one ascending sorted list, so rank queries are a
+    single bisect. Rows are keyed by id and can be fed incrementally from
+    ``fetch_top``/keyset pages and new submissions. When ``total`` (the server's
+    row count) exceeds the rows seen, scores below the lowest known one are
+    assumed spread evenly down to 0 to estimate ranks past the snapshot.
+    """
+
+    def __init__(self) -> None:
+        self._scores: List[int] = []
+        self._by_id: Dict[str, int] = {}
+        self.total: Optional[int] = None
+        self._anonymous = 0
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def add(self, row: Dict) -> None:
+        row_id = row.get("id")
+        if row_id is None:
+            self._anonymous += 1
+            row_id = f"local-{self._anonymous}"
+        score = int(row["score"])
+        old = self._by_id.get(row_id)
+        if old == score:
+            return
+        if old is not None:
+            del self._scores[bisect_right(self._scores, old) - 1]
+        self._by_id[row_id] = score
+        insort(self._scores, score)
+
+    def update(self, rows: Iterable[Dict]) -> None:
+        for row in rows:
+            self.add(row)
+
+    @property
+    def population(self) -> int:
+        return max(len(self._scores), self.total or 0)
+
+    def rank(self, score: int) -> int:
+        """1-based rank ``score`` would hold (ties share the better rank)."""
+        scores = self._scores
+        higher = len(scores) - bisect_right(scores, score)
+        unseen = self.population - len(scores)
+        if unseen and scores and score < scores[0]:
+            lowest = scores[0]
+            # Unseen rows are all below the snapshot; assume they span [0, lowest]
+            higher += round(unseen * (lowest - score) / lowest) if lowest > 0 else 0
+        return higher + 1
+
+    def percentile(self, score: int) -> float:
+        """Percentage of known or estimated players that ``score`` beats or ties."""
+        population = self.population
+        if not population:
+            return 100.0
+        return 100.0 * (population - (self.rank(score) - 1)) / population
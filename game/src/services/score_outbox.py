@@ -0,0 +1,183 @@
+import json
+import random
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+OUTBOX_FILE = "score_outbox.jsonl"
+LEADERBOARD_PATH = "/leaderboard"
+# Worth retrying later: expired or rotated keys, timeouts and rate limits
+TRANSIENT_STATUS = frozenset({401, 403, 408, 429})
+
+
+def _is_transient(response: httpx.Response) -> bool:
+    if response.status_code == 403 and _rejects_row(response):
+        return False
+    return response.status_code in TRANSIENT_STATUS or response.status_code >= 500
+
+
+def _rejects_row(response: httpx.Response) -> bool:
+    # The anonymous insert policy answers 403 for a bad row, not a bad key
+    try:
+        error = response.json()
+    except ValueError:
+        return False
+    if not isinstance(error, dict):
+        return False
+    return error.get("code") == "42501" and "row-level security" in str(
+        error.get("message")
+    )
+
+
+class ScoreOutbox:
+    """Durable, append-only queue of score submissions awaiting upload.
+
+    Every score is appended to a JSON-lines log in LocalStorage (next to
+    ``save.json``) before any network call, and acknowledged with a later log
+    line once the server has it, so queued scores survive restarts. ``drain``
+    uploads pending scores in batches with one bulk PostgREST insert each; the
+    client-generated ``id`` doubles as the primary key, so a retried batch that
+    already landed is ignored by the server instead of duplicated.
+    """
+
+    def __init__(
+        self,
+        storage,
+        batch_size: int = 50,
+        base_delay: float = 1.0,
+        max_delay: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.storage = storage
+        self.batch_size = batch_size
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self._clock = clock
+        self._rng = rng or random.Random()
+        self.failures = 0
+        self.next_attempt = 0.0
+        self._pending: "OrderedDict[str, Dict]" = OrderedDict()
+        self._replay()
+
+    def _replay(self) -> None:
+        for line in self.storage.read_lines(OUTBOX_FILE):
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("op") == "add":
+                record = entry["record"]
+                self._pending.setdefault(record["id"], record)
+            elif entry.get("op") in ("ack", "drop"):
+                for record_id in entry["ids"]:
+                    self._pending.pop(record_id, None)
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def pending(self) -> List[Dict]:
+        return list(self._pending.values())
+
+    def enqueue(
+        self,
+        name: str,
+        score: int,
+        replay: Optional[str] = None,
+        record_id: Optional[str] = None,
+    ) -> Dict:
+        """Queue a score; pass a failed direct POST's ``record_id`` so it lands once."""
+        record = {
+            "id": record_id or str(uuid.uuid4()),
+            "name": name,
+            "score": int(score),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+        }
+        if replay is not None:
+            record["replay"] = replay
+        self.storage.append_line(
+            OUTBOX_FILE, json.dumps({"op": "add", "record": record})
+        )
+        self._pending[record["id"]] = record
+        return record
+
+    def _settle(self, op: str, ids: List[str]) -> None:
+        for record_id in ids:
+            self._pending.pop(record_id, None)
+        if self._pending:
+            self.storage.append_line(OUTBOX_FILE, json.dumps({"op": op, "ids": ids}))
+        else:
+            # Everything delivered: compact the log away
+            self.storage.remove(OUTBOX_FILE)
+
+    def ready(self) -> bool:
+        return bool(self._pending) and self._clock() >= self.next_attempt
+
+    def _backoff(self) -> None:
+        self.failures += 1
+        delay = min(self.max_delay, self.base_delay * 2 ** (self.failures - 1))
+        # Full jitter keeps many reconnecting clients from retrying in lockstep
+        self.next_attempt = self._clock() + delay * self._rng.uniform(0.5, 1.0)
+
+    @staticmethod
+    def _row(record: Dict) -> Dict:
+        # Every row of a bulk insert needs the same keys (else PGRST102), and
+        # created_at is left to the server so clients cannot pick tie order
+        return {
+            "id": record["id"],
+            "name": record["name"],
+            "score": record["score"],
+            "replay": record.get("replay"),
+        }
+
+    async def _upload(self, client, batch: List[Dict]) -> Tuple[int, bool]:
+        """Send ``batch``; returns (rows delivered, False on a transient failure)."""
+        ids = [r["id"] for r in batch]
+        try:
+            response = await client.post(
+                LEADERBOARD_PATH,
+                json=[self._row(r) for r in batch],
+                params={"on_conflict": "id"},
+                headers={"Prefer": "resolution=ignore-duplicates,return=minimal"},
+            )
+        except httpx.HTTPError:
+            return 0, False
+        if _is_transient(response):
+            return 0, False
+        if response.is_success:
+            self._settle("ack", ids)
+            return len(ids), True
+        if len(batch) == 1:
+            self._settle("drop", ids)
+            return 0, True
+        # One bad row fails the whole insert: resend singly so only it is dropped
+        delivered = 0
+        for record in batch:
+            landed, ok = await self._upload(client, [record])
+            delivered += landed
+            if not ok:
+                return delivered, False
+        return delivered, True
+
+    async def drain(self, client) -> int:
+        """Upload pending scores in batches; return how many were delivered.
+
+        Stops at the first transient failure (network error, 401, 403, 408,
+        429 or 5xx) and schedules the next attempt with exponential backoff.
+        A batch rejected with another 4xx is retried one score at a time and
+        only the scores the server rejects on their own are dropped.
+        """
+        delivered = 0
+        while self.ready():
+            landed, ok = await self._upload(client, self.pending()[: self.batch_size])
+            delivered += landed
+            if not ok:
+                self._backoff()
+                break
+            self.failures = 0
+            self.next_attempt = 0.0
+        return delivered
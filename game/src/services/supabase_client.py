@@ -1,6 +1,212 @@
+import asyncio
+import math
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional, Sequence, Tuple
+
+import httpx
+
+try:
+    import h2  # noqa: F401  (enables HTTP/2 in httpx when installed)
+
+    HTTP2_AVAILABLE = True
+except Exception:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
+# Anonymous limits from contracts/supabase-api.md: 5 per 10 s burst, 10 per
+# minute and 100 per hour
+CONTRACT_RATE_LIMITS: Tuple[Tuple[int, float], ...] = (
+    (5, 10.0),
+    (10, 60.0),
+    (100, 3600.0),
+)
+
+
+class RateLimitExceeded(Exception):
+    """The limiter would have to wait longer than the caller allows."""
+
+    def __init__(self, retry_after: float) -> None:
+        super().__init__(f"rate limited; retry in {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class RateLimiter:
+    """Sliding-window limiter: waits until every (requests, seconds) window has room."""
+
+    def __init__(
+        self,
+        windows: Sequence[Tuple[int, float]],
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self.windows = tuple(windows)
+        self._clock = clock
+        self._sleep = sleep
+        self._sent = [deque() for _ in self.windows]
+        self._lock = asyncio.Lock()
+
+    def _delay(self, now: float) -> float:
+        delay = 0.0
+        for (limit, period), sent in zip(self.windows, self._sent):
+            while sent and now - sent[0] >= period:
+                sent.popleft()
+            if len(sent) >= limit:
+                delay = max(delay, sent[0] + period - now)
+        return delay
+
+    async def acquire(self, max_wait: Optional[float] = None) -> None:
+        """Wait until every window has room.
+
+        Raises RateLimitExceeded instead of waiting longer than ``max_wait``
+        seconds; None waits as long as it takes.
+        """
+        deadline = None if max_wait is None else self._clock() + max_wait
+        async with self._lock:
+            while True:
+                now = self._clock()
+                delay = self._delay(now)
+                if delay <= 0.0:
+                    for sent in self._sent:
+                        sent.append(now)
+                    return
+                if deadline is not None and now + delay > deadline:
+                    raise RateLimitExceeded(delay)
+                await self._sleep(delay)
+
+
 class SupabaseClient:
-    def __init__(self) -> None:
-        # Stub client; real implementation can be wired later
-        pass
+    """Async PostgREST client sharing one pooled, keep-alive connection set.
+
+    Credentials default to SUPABASE_URL / SUPABASE_REST_URL / SUPABASE_ANON_KEY
+    from the environment. Requests are bounded by ``max_concurrency`` and, when
+    ``rate_limits`` is set, paced to stay inside the API contract's limits; a
+    request that would wait longer than its timeout for the limiter gets a
+    local 429 with Retry-After instead. The underlying ``httpx.AsyncClient`` is
+    created on first use.
+    """
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        anon_key: Optional[str] = None,
+        *,
+        rest_url: Optional[str] = None,
+        http2: bool = True,
+        timeout: float = 10.0,
+        connect_timeout: float = 5.0,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry: float = 30.0,
+        max_concurrency: int = 4,
+        rate_limits: Optional[Sequence[Tuple[int, float]]] = CONTRACT_RATE_LIMITS,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        url = url or os.getenv("SUPABASE_URL")
+        self.anon_key = anon_key or os.getenv("SUPABASE_ANON_KEY")
+        rest_url = rest_url or os.getenv("SUPABASE_REST_URL")
+        if not rest_url and url:
+            rest_url = f"{url.rstrip('/')}/rest/v1"
+        self.rest_url = rest_url
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self.timeout = httpx.Timeout(timeout, connect=connect_timeout)
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = RateLimiter(rate_limits) if rate_limits else None
+        self._transport = transport
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(self.rest_url and self.anon_key)
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return {
+            "apikey": self.anon_key or "",
+            "Authorization": f"Bearer {self.anon_key or ''}",
+            "Accept": "application/json",
+        }
+
+    def _ensure_client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            if not self.configured:
+                raise RuntimeError(
+                    "Supabase is not configured: set SUPABASE_URL and SUPABASE_ANON_KEY"
+                )
+            self._client = httpx.AsyncClient(
+                base_url=self.rest_url,
+                headers=self.headers,
+                http2=self.http2,
+                timeout=self.timeout,
+                limits=self.limits,
+                transport=self._transport,
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._client
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Dict[str, Any]] = None,
+        json: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+    ) -> httpx.Response:
+        client = self._ensure_client()
+        if self.rate_limiter is not None:
+            # Wait outside the semaphore so paced requests hold no pool slot
+            try:
+                await self.rate_limiter.acquire(
+                    self.timeout.pool if timeout is None else timeout
+                )
+            except RateLimitExceeded as e:
+                return httpx.Response(
+                    429,
+                    headers={"Retry-After": str(math.ceil(e.retry_after))},
+                    json={
+                        "code": "PGRST429",
+                        "message": str(e),
+                        "details": None,
+                        "hint": None,
+                    },
+                    request=client.build_request(
+                        method, path, params=params, json=json, headers=headers
+                    ),
+                )
+        async with self._semaphore:
+            return await client.request(
+                method,
+                path,
+                params=params,
+                json=json,
+                headers=headers,
+                timeout=self.timeout if timeout is None else timeout,
+            )
+
+    async def get(
+        self, path: str, params: Optional[Dict[str, Any]] = None, **kwargs
+    ) -> httpx.Response:
+        return await self.request("GET", path, params=params, **kwargs)
+
+    async def post(self, path: str, json: Any = None, **kwargs) -> httpx.Response:
+        return await self.request("POST", path, json=json, **kwargs)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
 
+    async def __aenter__(self) -> "SupabaseClient":
+        self._ensure_client()
+        return self
 
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
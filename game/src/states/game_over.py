@@ -1,6 +1,30 @@
+from typing import Optional
+
+
 class GameOver:
-    def __init__(self) -> None:
+    def __init__(self, service=None) -> None:
         self.reason = ""
+        self.service = service
+        self.score = 0
+        self.rank: Optional[int] = None
+        # False while ``rank`` is the local estimate
+        self.rank_confirmed = False
+
+    def show_result(self, score: int, reason: str = "") -> None:
+        self.score = int(score)
+        self.reason = reason
+        self.rank = (
+            self.service.estimate_rank(score) if self.service is not None else None
+        )
+        self.rank_confirmed = False
+
+    async def reconcile_rank(self) -> Optional[int]:
+        """Replace the estimated rank with the server's answer."""
+        if self.service is None:
+            return None
+        self.rank = await self.service.afetch_rank(self.score)
+        self.rank_confirmed = True
+        return self.rank
 
     def on_enter(self) -> None:
         pass
@@ -13,5 +37,3 @@ class GameOver:
 
     def draw(self) -> None:
         pass
-
-
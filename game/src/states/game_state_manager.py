@@ -1,32 +1,137 @@
+from typing import Callable, Dict, Optional, Tuple
+
 from game.src.models.game_state import GameState
+from game.src.systems.profiler import PROFILER
+from game.src.ui.hud import HUD
+
+# (current state, event) -> next state; anything missing is rejected
+TRANSITIONS: Dict[Tuple[GameState, str], GameState] = {
+    (GameState.MAIN_MENU, "start"): GameState.RUNNING,
+    (GameState.GAME_OVER, "start"): GameState.RUNNING,
+    (GameState.RUNNING, "pause"): GameState.PAUSED,
+    (GameState.PAUSED, "resume"): GameState.RUNNING,
+    (GameState.RUNNING, "game_over"): GameState.GAME_OVER,
+    (GameState.MAIN_MENU, "leaderboard"): GameState.LEADERBOARD_VIEW,
+    (GameState.GAME_OVER, "leaderboard"): GameState.LEADERBOARD_VIEW,
+    (GameState.MAIN_MENU, "settings"): GameState.SETTINGS,
+    (GameState.PAUSED, "settings"): GameState.SETTINGS,
+}
+TRANSITIONS.update(
+    {
+        (state, "menu"): GameState.MAIN_MENU
+        for state in GameState
+        if state != GameState.MAIN_MENU
+    }
+)
+# "back" from these returns to whichever state they were entered from
+BACK_STATES = frozenset({GameState.SETTINGS})
+# The same table grouped by state, so a transition looks up one event name
+_EVENTS: Dict[GameState, Dict[str, GameState]] = {state: {} for state in GameState}
+for (_state, _event), _target in TRANSITIONS.items():
+    _EVENTS[_state][_event] = _target
+
+
+def _default_factories(hud: HUD) -> Dict[GameState, Callable[[], object]]:
+    # Imported here so screens' modules load only when the manager is built
+    from game.src.states.game_over import GameOver
+    from game.src.states.leaderboard_view import LeaderboardView
+    from game.src.states.main_menu import MainMenu
+    from game.src.states.paused_game import PausedGame
+    from game.src.states.running_game import RunningGame
+    from game.src.states.settings import SettingsState
+
+    return {
+        GameState.MAIN_MENU: MainMenu,
+        GameState.RUNNING: lambda: RunningGame(hud=hud),
+        GameState.PAUSED: PausedGame,
+        GameState.GAME_OVER: GameOver,
+        GameState.LEADERBOARD_VIEW: LeaderboardView,
+        GameState.SETTINGS: lambda: SettingsState(hud),
+    }
 
 
 class GameStateManager:
-    def __init__(self) -> None:
+    """Table-driven state machine that owns the screen objects.
+
+    Screens are built by their factory on first visit and cached; each
+    transition calls the outgoing screen's ``on_exit`` and the incoming
+    screen's ``on_enter``. Returning to the main menu abandons the current
+    run, so the next "start" builds a fresh RUNNING screen. One HUD is shared
+    by every screen and drawn on top of them.
+    """
+
+    def __init__(
+        self,
+        factories: Optional[Dict[GameState, Callable[[], object]]] = None,
+        hud: Optional[HUD] = None,
+    ) -> None:
+        self.hud = hud or HUD()
+        self.factories = _default_factories(self.hud)
+        self.factories.update(factories or {})
+        self.screens: Dict[GameState, object] = {}
         self.state = GameState.MAIN_MENU
+        self._events = _EVENTS[self.state]
+        self._screen = self.screen_for(self.state)
+        self._screen.on_enter()
 
-    def start_game(self) -> None:
-        self.state = GameState.RUNNING
+    def screen_for(self, state: GameState):
+        screen = self.screens.get(state)
+        if screen is None:
+            screen = self.screens[state] = self.factories[state]()
+        return screen
 
-    def pause(self) -> None:
-        if self.state == GameState.RUNNING:
-            self.state = GameState.PAUSED
+    @property
+    def screen(self):
+        return self._screen
 
-    def resume(self) -> None:
-        if self.state == GameState.PAUSED:
-            self.state = GameState.RUNNING
+    def transition(self, event: str) -> bool:
+        """Apply ``event``; returns False (and changes nothing) if not allowed."""
+        target = self._events.get(event)
+        if target is None:
+            return False
+        self._screen.on_exit()
+        events = _EVENTS[target]
+        if target in BACK_STATES:
+            events = dict(events, back=self.state)
+        if target is GameState.MAIN_MENU:
+            self.screens.pop(GameState.RUNNING, None)
+        self.state = target
+        self._events = events
+        self._screen = self.screen_for(target)
+        self._screen.on_enter()
+        return True
 
-    def game_over(self) -> None:
-        if self.state == GameState.RUNNING:
-            self.state = GameState.GAME_OVER
+    def update(self, dt: float) -> None:
+        PROFILER.mark_frame()
+        with PROFILER.scope("state.update"):
+            self.screen.update(dt)
+        self.hud.update(dt)
 
-    def to_menu(self) -> None:
-        self.state = GameState.MAIN_MENU
+    def draw(self) -> None:
+        with PROFILER.scope("state.draw"):
+            self.screen.draw()
+        self.hud.draw()
+
+    def start_game(self) -> bool:
+        return self.transition("start")
+
+    def pause(self) -> bool:
+        return self.transition("pause")
+
+    def resume(self) -> bool:
+        return self.transition("resume")
+
+    def game_over(self) -> bool:
+        return self.transition("game_over")
 
-    def to_leaderboard(self) -> None:
-        self.state = GameState.LEADERBOARD_VIEW
+    def to_menu(self) -> bool:
+        return self.transition("menu")
 
-    def to_settings(self) -> None:
-        self.state = GameState.SETTINGS
+    def to_leaderboard(self) -> bool:
+        return self.transition("leaderboard")
 
+    def to_settings(self) -> bool:
+        return self.transition("settings")
 
+    def back(self) -> bool:
+        return self.transition("back")
@@ -1,17 +1,45 @@
+import asyncio
+
+
 class LeaderboardView:
-    def __init__(self) -> None:
+    def __init__(self, service=None, limit: int = 10) -> None:
         self.entries = []
+        self.service = service
+        self.limit = limit
+        self._refresh = None
 
     def on_enter(self) -> None:
-        pass
+        if self.service is None:
+            return
+        # Open instantly from cache, then revalidate in the background
+        self.entries = self.service.fetch_top(self.limit)
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        self._refresh = loop.create_task(self.service.afetch_top(self.limit))
+        self._refresh.add_done_callback(self._on_refreshed)
+
+    def _on_refreshed(self, task) -> None:
+        if not task.cancelled() and task.exception() is None:
+            self.entries = task.result()
+
+    async def load_more(self) -> int:
+        """Append the next keyset page after the last visible entry."""
+        if self.service is None:
+            return 0
+        after = self.entries[-1] if self.entries else None
+        page = await self.service.afetch_page(self.limit, after)
+        self.entries = self.entries + page
+        return len(page)
 
     def on_exit(self) -> None:
-        pass
+        if self._refresh is not None:
+            self._refresh.cancel()
+            self._refresh = None
 
     def update(self, dt: float) -> None:
         pass
 
     def draw(self) -> None:
         pass
-
-
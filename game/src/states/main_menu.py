@@ -1,17 +1,21 @@
 class MainMenu:
-    def __init__(self) -> None:
+    def __init__(self, assets=None) -> None:
         self.title = "Rialo Bird"
+        self.assets = assets
 
     def on_enter(self) -> None:
-        pass
+        if self.assets is None:
+            return
+        # Block only on what the menu draws; gameplay assets stream behind it
+        self.assets.preload()
+        self.assets.stream()
 
     def on_exit(self) -> None:
         pass
 
     def update(self, dt: float) -> None:
-        pass
+        if self.assets is not None:
+            self.assets.pump()
 
     def draw(self) -> None:
         pass
-
-
@@ -1,17 +1,52 @@
+from typing import Optional
+
+from game.src.systems.profiler import PROFILER
+from game.src.systems.replay import ReplayRecorder
+from game.src.systems.simulation import Simulation
+
+
 class RunningGame:
-    def __init__(self) -> None:
+    def __init__(self, seed: int = 0, difficulty: str = "normal", hud=None) -> None:
         self.is_active = True
+        self.seed = seed
+        self.difficulty = difficulty
+        self.hud = hud
+        self.alpha = 0.0
+        self._simulation: Optional[Simulation] = None
+        self.recorder: Optional[ReplayRecorder] = None
+
+    @property
+    def simulation(self) -> Simulation:
+        # Built on first use, so passing through this screen stays cheap
+        if self._simulation is None:
+            self._new_run()
+        return self._simulation
+
+    def _new_run(self) -> None:
+        # Every run is recorded so its score can be verified and replayed
+        self._simulation = Simulation(seed=self.seed, difficulty=self.difficulty)
+        self.recorder = ReplayRecorder.for_simulation(self._simulation)
+        PROFILER.watch_simulation(self._simulation)
+        if self.hud is not None:
+            self.hud.watch(self._simulation)
+
+    @property
+    def replay(self) -> Optional[bytes]:
+        """The finished run's replay, or None while it is still in progress."""
+        return self.recorder.data if self.recorder is not None else None
 
     def on_enter(self) -> None:
-        pass
+        if self._simulation is not None and not self._simulation.alive:
+            # The next update starts a fresh run
+            self._simulation = None
 
     def on_exit(self) -> None:
         pass
 
     def update(self, dt: float) -> None:
-        pass
+        self.alpha = self.simulation.advance(dt)
+        if self.hud is not None:
+            self.hud.set_score(self.simulation.score.current_score)
 
     def draw(self) -> None:
         pass
-
-
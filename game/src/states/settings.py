@@ -1,6 +1,17 @@
 class SettingsState:
-    def __init__(self) -> None:
-        self.options = {}
+    def __init__(self, hud=None) -> None:
+        self.options = {"show_perf_overlay": False}
+        self.hud = hud
+
+    def set_option(self, name: str, value) -> None:
+        self.options[name] = value
+        if name == "show_perf_overlay" and self.hud is not None:
+            self.hud.set_perf_overlay(bool(value))
+
+    def toggle_perf_overlay(self) -> bool:
+        enabled = not self.options["show_perf_overlay"]
+        self.set_option("show_perf_overlay", enabled)
+        return enabled
 
     def on_enter(self) -> None:
         pass
@@ -13,5 +24,3 @@ class SettingsState:
 
     def draw(self) -> None:
         pass
-
-
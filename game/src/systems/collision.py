@@ -1,4 +1,167 @@
+from bisect import bisect_left, bisect_right
+from typing import Optional
+
+import numpy as np
+
+from game.src.entities.bird_batch import BirdBatch
+from game.src.entities.pipe_batch import PipeBatch
+
+# Broad-phase edges may differ from the pipes' own positions by float rounding
+_SLACK = 1e-6
+
+
+class _PipeEntry:
+    __slots__ = ("pipe", "left", "right", "key", "solids")
+
+    def __init__(self, pipe, left: float, right: float) -> None:
+        self.pipe = pipe
+        self.left = left
+        self.right = right
+        # Solids as of the pipe's (x, gap_y, gap_size) in ``key``
+        self.key = None
+        self.solids = None
+
+    def current_solids(self):
+        pipe = self.pipe
+        key = (pipe.position.x, pipe.gap_y, pipe.gap_size)
+        if key != self.key:
+            self.key = key
+            self.solids = _pipe_solids(pipe)
+        return self.solids
+
+
+class PipeIndex:
+    """Broad phase for pipe collisions: a sweep list sorted by left edge.
+
+    The game keeps it up to date incrementally: ``insert`` on spawn,
+    ``remove`` on recycle and ``scroll(dx)`` once per tick. Edges are stored
+    relative to the shared scroll ``offset``, so uniform scrolling touches no
+    entry and a query costs O(log n) however many pipes are live. ``sync``
+    instead rebuilds it from an arbitrary list of pipes. ``candidates`` returns
+    the overlapping pipes' solids, cached per pipe until it moves or its gap
+    changes, so every query of a tick shares them.
+    """
+
+    def __init__(self) -> None:
+        self.offset = 0.0
+        self._sorted = []
+        self._lefts = []
+        self._max_width = 0.0
+
+    def __len__(self) -> int:
+        return len(self._sorted)
+
+    def clear(self) -> None:
+        self.offset = 0.0
+        self._sorted = []
+        self._lefts = []
+        self._max_width = 0.0
+
+    def scroll(self, dx: float) -> None:
+        """Every indexed pipe moved ``-dx`` along x."""
+        self.offset += dx
+
+    def insert(self, pipe) -> None:
+        left = pipe.position.x - pipe.width / 2 + self.offset
+        i = bisect_right(self._lefts, left)
+        self._lefts.insert(i, left)
+        self._sorted.insert(i, _PipeEntry(pipe, left, left + pipe.width))
+        if pipe.width > self._max_width:
+            self._max_width = pipe.width
+
+    def remove(self, pipe) -> bool:
+        # Recycled pipes are the leftmost, so the scan normally stops at once
+        for i, entry in enumerate(self._sorted):
+            if entry.pipe is pipe:
+                del self._sorted[i]
+                del self._lefts[i]
+                return True
+        return False
+
+    def sync(self, pipes) -> "PipeIndex":
+        """Rebuild from ``pipes``; for ad-hoc lists outside the game loop."""
+        self.clear()
+        entries = []
+        for pipe in pipes:
+            left = pipe.position.x - pipe.width / 2
+            entries.append(_PipeEntry(pipe, left, left + pipe.width))
+            if pipe.width > self._max_width:
+                self._max_width = pipe.width
+        entries.sort(key=lambda e: e.left)
+        self._sorted = entries
+        self._lefts = [e.left for e in entries]
+        return self
+
+    def candidates(self, left: float, right: float):
+        """Yield solids of pipes whose x-range may overlap ``(left, right)``."""
+        left += self.offset - _SLACK
+        right += self.offset + _SLACK
+        lefts = self._lefts
+        lo = bisect_right(lefts, left - self._max_width)
+        hi = bisect_left(lefts, right)
+        for entry in self._sorted[lo:hi]:
+            if entry.right > left:
+                yield from entry.current_solids()
+
+
+def _scan(pipes, left: float, right: float):
+    # A one-off query over a plain list: a linear pass beats building an index
+    for pipe in pipes:
+        half = pipe.width / 2
+        if pipe.position.x - half < right and pipe.position.x + half > left:
+            yield from _pipe_solids(pipe)
+
+
+def _bird_boxes(birds):
+    # (n, 4) array of left, right, bottom, top, matching CollisionSystem._bird_bbox
+    if isinstance(birds, BirdBatch):
+        x, y, width, height = birds.x, birds.y, birds.width, birds.height
+    else:
+        birds = list(birds)
+        x = np.array([b.position.x for b in birds], dtype=np.float64)
+        y = np.array([b.position.y for b in birds], dtype=np.float64)
+        width = np.array([b.width for b in birds], dtype=np.float64)
+        height = np.array([b.height for b in birds], dtype=np.float64)
+    half_w = width / 2
+    half_h = height / 2
+    return np.stack((x - half_w, x + half_w, y - half_h, y + half_h), axis=1)
+
+
+def _pipe_solid_array(pipes):
+    # (m, 2, 4) array of the top and bottom solids, matching _pipe_solids
+    if isinstance(pipes, PipeBatch):
+        x, width, height = pipes.x, pipes.width, pipes.height
+        gap_y, gap_size = pipes.gap_y, pipes.gap_size
+    else:
+        cols = np.array(
+            [(p.position.x, p.width, p.gap_y, p.gap_size, p.height) for p in pipes],
+            dtype=np.float64,
+        ).reshape(-1, 5)
+        x, width, gap_y, gap_size, height = cols.T
+    solids = np.empty((len(x), 2, 4), dtype=np.float64)
+    solids[:, :, 0] = (x - width / 2)[:, None]
+    solids[:, :, 1] = (x + width / 2)[:, None]
+    solids[:, 0, 2] = gap_y + gap_size / 2
+    solids[:, 0, 3] = height
+    solids[:, 1, 2] = 0.0
+    solids[:, 1, 3] = gap_y - gap_size / 2
+    return solids
+
+
+def _pipe_solids(pipe):
+    # Two solid rectangles: top above gap, bottom below gap
+    left = pipe.position.x - pipe.width / 2
+    right = pipe.position.x + pipe.width / 2
+    top_rect = (left, right, pipe.gap_y + pipe.gap_size / 2, pipe.height)
+    bottom_rect = (left, right, 0.0, pipe.gap_y - pipe.gap_size / 2)
+    return [top_rect, bottom_rect]
+
+
 class CollisionSystem:
+    def __init__(self) -> None:
+        # Kept incrementally by the pipe generator of the owning Simulation
+        self.index = PipeIndex()
+
     def _bird_bbox(self, bird):
         # Axis-aligned bounding box centered at position
         half_w = bird.width / 2
@@ -10,12 +173,7 @@ class CollisionSystem:
         return left, right, bottom, top
 
     def _pipe_solids(self, pipe):
-        # Two solid rectangles: top above gap, bottom below gap
-        left = pipe.position.x - pipe.width / 2
-        right = pipe.position.x + pipe.width / 2
-        top_rect = (left, right, pipe.gap_y + pipe.gap_size / 2, pipe.height)
-        bottom_rect = (left, right, 0.0, pipe.gap_y - pipe.gap_size / 2)
-        return [top_rect, bottom_rect]
+        return _pipe_solids(pipe)
 
     @staticmethod
     def _overlap(a, b):
@@ -24,11 +182,102 @@ class CollisionSystem:
         return (al < br) and (ar > bl) and (ab < bt) and (at > bb)
 
     def check_bird_pipe(self, bird, pipes):
+        """True when ``bird`` overlaps any pipe solid.
+
+        ``pipes`` may be a list of Pipe, scanned linearly, or a PipeIndex kept
+        up to date as pipes spawn, scroll and recycle, which answers in
+        O(log n) and lets many birds share one broad phase.
+        """
         bird_bb = self._bird_bbox(bird)
-        for pipe in pipes:
-            for solid in self._pipe_solids(pipe):
-                if self._overlap(bird_bb, solid):
-                    return True
+        if isinstance(pipes, PipeIndex):
+            solids = pipes.candidates(bird_bb[0], bird_bb[1])
+        else:
+            solids = _scan(pipes, bird_bb[0], bird_bb[1])
+        for solid in solids:
+            if self._overlap(bird_bb, solid):
+                return True
         return False
 
+    def sweep_bird_pipe(
+        self, bird, previous, pipes, pipe_dx: float = 0.0
+    ) -> Optional[float]:
+        """Swept AABB test for the bird's movement over one step.
+
+        The bird moved from ``previous`` (an (x, y) pair) to its current position
+        while the pipes moved ``pipe_dx`` along x. Returns the earliest time of
+        impact in [0, 1] against any pipe solid, or None when the path is clear.
+        """
+        px, py = previous
+        # Work in the pipes' end-of-step frame by shifting the start box along with them
+        end = self._bird_bbox(bird)
+        dx = bird.position.x - (px + pipe_dx)
+        dy = bird.position.y - py
+        start = (end[0] - dx, end[1] - dx, end[2] - dy, end[3] - dy)
+        left, right = min(start[0], end[0]), max(start[1], end[1])
+        if isinstance(pipes, PipeIndex):
+            solids = pipes.candidates(left, right)
+        else:
+            solids = _scan(pipes, left, right)
+        best = None
+        for solid in solids:
+            toi = self._sweep(start, dx, dy, solid)
+            if toi is not None and (best is None or toi < best):
+                best = toi
+                if toi == 0.0:
+                    break
+        return best
+
+    @staticmethod
+    def _sweep(box, dx, dy, solid):
+        al, ar, ab, at = box
+        bl, br, bb, bt = solid
+        if dx > 0:
+            entry_x, exit_x = (bl - ar) / dx, (br - al) / dx
+        elif dx < 0:
+            entry_x, exit_x = (br - al) / dx, (bl - ar) / dx
+        elif al < br and ar > bl:
+            entry_x, exit_x = float("-inf"), float("inf")
+        else:
+            return None
+        if dy > 0:
+            entry_y, exit_y = (bb - at) / dy, (bt - ab) / dy
+        elif dy < 0:
+            entry_y, exit_y = (bt - ab) / dy, (bb - at) / dy
+        elif ab < bt and at > bb:
+            entry_y, exit_y = float("-inf"), float("inf")
+        else:
+            return None
+        entry = max(entry_x, entry_y)
+        exit_ = min(exit_x, exit_y)
+        # Touching edges is not a hit, matching _overlap
+        if entry >= exit_ or entry > 1.0 or exit_ <= 0.0:
+            return None
+        return max(entry, 0.0)
+
+    def check_many(self, birds, pipes, return_index: bool = False):
+        """Test many birds against many pipes in one vectorized overlap pass.
 
+        ``birds`` is a list of Bird or a BirdBatch and ``pipes`` a list of Pipe or
+        a PipeBatch; batches are read column-wise with no per-entity loop.
+        Returns a boolean hit mask with one entry per bird; with ``return_index``
+        also returns the index of the first pipe (in ``pipes`` order) each bird
+        hits, or -1.
+        """
+        if not isinstance(pipes, PipeBatch):
+            pipes = list(pipes)
+        boxes = _bird_boxes(birds)[:, None, None, :]
+        solids = _pipe_solid_array(pipes)[None, :, :, :]
+        overlap = (
+            (boxes[..., 0] < solids[..., 1])
+            & (boxes[..., 1] > solids[..., 0])
+            & (boxes[..., 2] < solids[..., 3])
+            & (boxes[..., 3] > solids[..., 2])
+        )
+        pipe_hits = overlap.any(axis=2)
+        hits = pipe_hits.any(axis=1)
+        if not return_index:
+            return hits
+        if not len(pipes):
+            return hits, np.full(hits.shape, -1)
+        first = np.where(hits, pipe_hits.argmax(axis=1), -1)
+        return hits, first
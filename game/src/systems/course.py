@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CourseProfile:
+    gap_start: float
+    gap_min: float
+    gap_shrink: float
+    speed_start: float
+    speed_max: float
+    speed_ramp: float
+
+
+# Per-pipe difficulty curves: gaps shrink and speed rises with pipes passed (FR-016)
+DIFFICULTY_PROFILES: Dict[str, CourseProfile] = {
+    "easy": CourseProfile(200.0, 150.0, 0.5, 140.0, 200.0, 1.0),
+    "normal": CourseProfile(170.0, 120.0, 1.0, 160.0, 260.0, 2.0),
+    "hard": CourseProfile(150.0, 100.0, 1.5, 190.0, 300.0, 3.0),
+}
+
+CHUNK_SIZE = 256
+
+
+class Course:
+    """Seeded pipe course generated lazily in fixed-size chunks.
+
+    Pipe ``i`` always gets the same gap centre, gap size and scroll speed for a
+    given (seed, difficulty), so every player and every replay sees the same
+    course. Each chunk is drawn with one vectorized RNG call from its own seed,
+    which keeps chunks independent and spawning free of RNG work.
+    """
+
+    def __init__(
+        self,
+        seed: int,
+        difficulty: str = "normal",
+        world_height: float = 600.0,
+        gap_margin: float = 60.0,
+    ) -> None:
+        if difficulty not in DIFFICULTY_PROFILES:
+            raise ValueError(f"Unknown difficulty: {difficulty!r}")
+        self.seed = seed
+        self.difficulty = difficulty
+        self.profile = DIFFICULTY_PROFILES[difficulty]
+        self.world_height = world_height
+        self.gap_margin = gap_margin
+        self._difficulty_id = sorted(DIFFICULTY_PROFILES).index(difficulty)
+        self._chunks: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+    def chunk(self, k: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return (gap_y, gap_size, speed) arrays for pipes in chunk ``k``."""
+        arrays = self._chunks.get(k)
+        if arrays is None:
+            p = self.profile
+            index = np.arange(k * CHUNK_SIZE, (k + 1) * CHUNK_SIZE, dtype=np.float64)
+            gap_size = np.maximum(p.gap_min, p.gap_start - p.gap_shrink * index)
+            speed = np.minimum(p.speed_max, p.speed_start + p.speed_ramp * index)
+            rng = np.random.default_rng([self.seed, self._difficulty_id, k])
+            low = self.gap_margin + gap_size / 2
+            high = self.world_height - self.gap_margin - gap_size / 2
+            gap_y = low + (high - low) * rng.random(CHUNK_SIZE)
+            arrays = (gap_y, gap_size, speed)
+            for array in arrays:
+                array.flags.writeable = False
+            self._chunks[k] = arrays
+        return arrays
+
+    def entry(self, i: int) -> Tuple[float, float, float]:
+        """Return (gap_y, gap_size, speed) for pipe ``i`` as Python floats."""
+        gap_y, gap_size, speed = self.chunk(i // CHUNK_SIZE)
+        j = i % CHUNK_SIZE
+        return float(gap_y[j]), float(gap_size[j]), float(speed[j])
+
+    def speed(self, i: int) -> float:
+        return float(self.chunk(i // CHUNK_SIZE)[2][i % CHUNK_SIZE])
+
+    def __iter__(self) -> Iterator[Tuple[float, float, float]]:
+        k = 0
+        while True:
+            yield from zip(*(a.tolist() for a in self.chunk(k)))
+            k += 1
+
+
+@lru_cache(maxsize=64)
+def get_course(
+    seed: int,
+    difficulty: str = "normal",
+    world_height: float = 600.0,
+    gap_margin: float = 60.0,
+) -> Course:
+    """Shared Course for (seed, difficulty); simulations reuse its chunks."""
+    return Course(seed, difficulty, world_height, gap_margin)
@@ -0,0 +1,110 @@
+"""Headless game sessions for bots, fuzzing and difficulty measurement."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from typing import Callable, Iterable, List, NamedTuple, Optional
+
+from game.src.systems.simulation import Simulation
+
+
+class Observation(NamedTuple):
+    tick: int
+    bird_y: float
+    bird_vy: float
+    pipe_dx: float
+    gap_y: float
+    gap_size: float
+
+
+Policy = Callable[[Observation], bool]
+
+
+@dataclass
+class SessionResult:
+    seed: int
+    score: int
+    ticks: int
+    cause: str
+
+
+def follow_gap(obs: Observation) -> bool:
+    """Reference policy: flap when falling below the next gap's centre."""
+    return obs.bird_vy < 0.0 and obs.bird_y < obs.gap_y - obs.gap_size / 4
+
+
+def observe(sim: Simulation) -> Observation:
+    bird = sim.bird
+    left = bird.position.x - bird.width / 2
+    for pipe in sim.pipes:
+        if pipe.position.x + pipe.width / 2 >= left:
+            dx = pipe.position.x - bird.position.x
+            return Observation(
+                sim.tick_count,
+                bird.position.y,
+                bird.velocity.y,
+                dx,
+                pipe.gap_y,
+                pipe.gap_size,
+            )
+    # No pipe ahead yet: aim for the middle of the screen
+    return Observation(
+        sim.tick_count,
+        bird.position.y,
+        bird.velocity.y,
+        sim.world_width,
+        sim.world_height / 2,
+        0.0,
+    )
+
+
+def run_session(
+    seed: int,
+    policy: Policy = follow_gap,
+    difficulty: str = "normal",
+    max_ticks: int = 60 * 60 * 10,
+    tick_rate: int = 60,
+) -> SessionResult:
+    """Play one seeded game to the end, asking ``policy`` every tick whether to flap."""
+    sim = Simulation(seed=seed, difficulty=difficulty, tick_rate=tick_rate)
+    while sim.alive and sim.tick_count < max_ticks:
+        if policy(observe(sim)):
+            sim.flap()
+        sim.tick()
+    cause = sim.cause_of_death if not sim.alive else "timeout"
+    return SessionResult(seed, sim.score.current_score, sim.tick_count, cause)
+
+
+def _run_chunk(seeds: List[int], **kwargs) -> List[SessionResult]:
+    return [run_session(seed, **kwargs) for seed in seeds]
+
+
+def run_sessions(
+    seeds: Iterable[int],
+    policy: Policy = follow_gap,
+    difficulty: str = "normal",
+    max_ticks: int = 60 * 60 * 10,
+    tick_rate: int = 60,
+    workers: Optional[int] = None,
+    chunk_size: int = 64,
+) -> List[SessionResult]:
+    """Run independent seeded sessions across a process pool, in seed order.
+
+    ``policy`` must be picklable (a module-level function). Seeds are sent in
+    chunks so each worker plays many games per round trip; ``workers=0`` runs
+    everything in this process.
+    """
+    seeds = list(seeds)
+    chunks = [seeds[i : i + chunk_size] for i in range(0, len(seeds), chunk_size)]
+    run = partial(
+        _run_chunk,
+        policy=policy,
+        difficulty=difficulty,
+        max_ticks=max_ticks,
+        tick_rate=tick_rate,
+    )
+    if workers == 0:
+        return [result for chunk in chunks for result in run(chunk)]
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        return [result for results in executor.map(run, chunks) for result in results]
@@ -1,5 +1,9 @@
 from dataclasses import dataclass
 
+import numpy as np
+
+MAX_ROTATION_DEG = 90.0
+
 
 @dataclass
 class PhysicsSystem:
@@ -8,6 +12,8 @@ class PhysicsSystem:
     terminal_velocity: float = 900.0
 
     def update(self, entity, dt: float) -> None:
+        # Scalar twin of update_batch: same operations in the same order, so a
+        # single Bird and a one-row BirdBatch produce bit-identical results.
         # Apply gravity (down is negative y)
         entity.velocity.y -= self.gravity * dt
         # Clamp terminal velocity
@@ -16,10 +22,29 @@ class PhysicsSystem:
         # Integrate position
         entity.position.y += entity.velocity.y * dt
         # Simple rotation based on velocity (-90..90)
-        max_deg = 90.0
-        entity.rotation = max(-max_deg, min(max_deg, (entity.velocity.y / self.terminal_velocity) * max_deg))
+        max_deg = MAX_ROTATION_DEG
+        entity.rotation = max(
+            -max_deg,
+            min(max_deg, (entity.velocity.y / self.terminal_velocity) * max_deg),
+        )
 
     def flap(self, entity) -> None:
         entity.velocity.y += self.flap_impulse
 
+    def update_batch(self, batch, dt: float) -> None:
+        """Advance every bird in a BirdBatch by ``dt`` in one vectorized step."""
+        vy = batch.vy
+        vy -= self.gravity * dt
+        np.maximum(vy, -self.terminal_velocity, out=vy)
+        batch.y += vy * dt
+        rotation = batch.rotation
+        np.divide(vy, self.terminal_velocity, out=rotation)
+        rotation *= MAX_ROTATION_DEG
+        np.clip(rotation, -MAX_ROTATION_DEG, MAX_ROTATION_DEG, out=rotation)
 
+    def flap_batch(self, batch, mask=None) -> None:
+        """Apply the flap impulse to every bird, or only where ``mask`` is True."""
+        if mask is None:
+            batch.vy += self.flap_impulse
+        else:
+            np.add(batch.vy, self.flap_impulse, out=batch.vy, where=mask)
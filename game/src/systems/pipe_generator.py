@@ -1,8 +1,10 @@
-from dataclasses import dataclass
-from typing import List
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 from game.src.entities.pipe import Pipe
-from game.src.models.vector import Vector2
+from game.src.systems.collision import PipeIndex
+from game.src.systems.course import Course
+from game.src.systems.pipe_pool import PipePool, PipeRing
 
 
 @dataclass
@@ -12,22 +14,86 @@ class PipeGenerator:
     pipe_width: float = 80.0
     pipe_height: float = 600.0
     last_spawn_time: float = 0.0
+    pool_size: int = 8
+    # Far more than fit on screen; reaching it means pipes are never recycled
+    max_live: int = 1024
+    course: Optional[Course] = None
+    spawned: int = 0
+    # Broad-phase index kept in step with ``live``; see Simulation
+    index: Optional[PipeIndex] = None
+    pool: PipePool = field(init=False, repr=False)
+    live: PipeRing = field(init=False, repr=False)
 
-    def spawn_if_needed(self, elapsed_time: float, x: float, gap_y: float) -> List[Pipe]:
+    def __post_init__(self) -> None:
+        self.pool = PipePool(self.pool_size)
+        self.live = PipeRing(min(self.pool_size, self.max_live), limit=self.max_live)
+
+    def spawn_due(self, elapsed_time: float) -> bool:
+        return elapsed_time - self.last_spawn_time >= self.spawn_interval
+
+    def spawn_if_needed(
+        self, elapsed_time: float, x: float, gap_y: Optional[float] = None
+    ) -> List[Pipe]:
         """Return a list with a new Pipe when interval elapsed; otherwise empty list.
 
-        This is a minimal utility to satisfy T023; gameplay tuning can evolve later.
+        Pipes come from the pool and are tracked in ``live`` until
+        ``recycle_offscreen`` hands them back, so callers must recycle every
+        tick and must not keep a pipe after it is recycled; spawning with
+        ``max_live`` pipes still live raises RuntimeError. Without ``gap_y``
+        the gap comes from the seeded ``course``, so one of them is required.
         """
-        if elapsed_time - self.last_spawn_time >= self.spawn_interval:
+        if gap_y is None and self.course is None:
+            raise ValueError("gap_y required without a course")
+        if self.spawn_due(elapsed_time):
+            if gap_y is None:
+                gap_y, gap_size, _ = self.course.entry(self.spawned)
+            else:
+                gap_size = self.pipe_gap
+            pipe = self.pool.acquire()
+            try:
+                # The ring enforces max_live only when it has to grow, so the
+                # limit costs nothing on the common path
+                self.live.append(pipe)
+            except OverflowError:
+                self.pool.release(pipe)
+                raise RuntimeError(
+                    f"{len(self.live)} live pipes were never recycled; "
+                    "call recycle_offscreen() every tick"
+                ) from None
             self.last_spawn_time = elapsed_time
-            pipe = Pipe(
-                position=Vector2(x, 0.0),
-                gap_y=gap_y,
-                gap_size=self.pipe_gap,
-                width=self.pipe_width,
-                height=self.pipe_height,
-            )
+            self.spawned += 1
+            pipe.position.x = x
+            pipe.position.y = 0.0
+            pipe.gap_y = gap_y
+            pipe.gap_size = gap_size
+            pipe.width = self.pipe_width
+            pipe.height = self.pipe_height
+            if self.index is not None:
+                self.index.insert(pipe)
             return [pipe]
         return []
 
+    def recycle_offscreen(self, min_x: float = 0.0) -> int:
+        """Return pipes whose right edge is left of ``min_x`` to the pool."""
+        live, index = self.live, self.index
+        recycled = 0
+        while live and live[0].position.x + live[0].width / 2 < min_x:
+            pipe = live.popleft()
+            if index is not None:
+                index.remove(pipe)
+            self.pool.release(pipe)
+            recycled += 1
+        return recycled
+
+    def _release(self, pipe: Pipe) -> None:
+        if self.index is not None:
+            self.index.remove(pipe)
+        self.pool.release(pipe)
 
+    def reset(self) -> None:
+        while self.live:
+            self._release(self.live.popleft())
+        if self.index is not None:
+            self.index.clear()
+        self.last_spawn_time = 0.0
+        self.spawned = 0
@@ -0,0 +1,92 @@
+from typing import Iterator, List, Optional
+
+from game.src.entities.pipe import Pipe
+
+
+class PipePool:
+    """Free list of preallocated Pipe objects.
+
+    ``hits`` counts acquisitions served from the pool and ``misses`` counts the
+    ones that had to allocate, so a correctly sized pool shows zero misses.
+    """
+
+    def __init__(self, capacity: int = 8) -> None:
+        self.capacity = capacity
+        self._free: List[Pipe] = [Pipe() for _ in range(capacity)]
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def acquire(self) -> Pipe:
+        if self._free:
+            self.hits += 1
+            return self._free.pop()
+        self.misses += 1
+        return Pipe()
+
+    def release(self, pipe: Pipe) -> None:
+        # Beyond capacity the pipe is simply dropped for the GC to reclaim
+        if len(self._free) < self.capacity:
+            self._free.append(pipe)
+
+
+class PipeRing:
+    """Fixed-size ring buffer of live pipes in spawn (left-to-right) order.
+
+    A full ring doubles, up to ``limit`` pipes; appending beyond that raises
+    OverflowError and leaves the ring unchanged.
+    """
+
+    def __init__(self, capacity: int = 8, limit: Optional[int] = None) -> None:
+        self._slots: List[Optional[Pipe]] = [None] * capacity
+        self._head = 0
+        self._size = 0
+        self.limit = limit
+        self.grows = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Pipe]:
+        slots = self._slots
+        capacity = len(slots)
+        for i in range(self._size):
+            yield slots[(self._head + i) % capacity]
+
+    def __getitem__(self, i: int) -> Pipe:
+        if i < 0:
+            i += self._size
+        if not 0 <= i < self._size:
+            raise IndexError("pipe ring index out of range")
+        return self._slots[(self._head + i) % len(self._slots)]
+
+    def append(self, pipe: Pipe) -> None:
+        capacity = len(self._slots)
+        if self._size == capacity:
+            # Only reached when the ring was sized too small; keep order on grow
+            if self.limit is not None and capacity >= self.limit:
+                raise OverflowError(f"pipe ring is full at {self.limit} pipes")
+            grown = (
+                capacity * 2 if self.limit is None else min(capacity * 2, self.limit)
+            )
+            self._slots = list(self) + [None] * (grown - capacity)
+            self._head = 0
+            capacity = grown
+            self.grows += 1
+        self._slots[(self._head + self._size) % capacity] = pipe
+        self._size += 1
+
+    def popleft(self) -> Pipe:
+        if not self._size:
+            raise IndexError("pop from empty pipe ring")
+        pipe = self._slots[self._head]
+        self._slots[self._head] = None
+        self._head = (self._head + 1) % len(self._slots)
+        self._size -= 1
+        return pipe
+
+    def clear(self) -> None:
+        while self._size:
+            self.popleft()
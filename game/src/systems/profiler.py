@@ -0,0 +1,254 @@
+"""Frame-time profiler with named per-system timing scopes.
+
+Disabled (the default) it costs next to nothing: ``scope()`` hands back a
+shared no-op context manager and no system method is wrapped. Enabled, each
+scope name keeps a fixed-size ring of recent durations for percentile stats,
+and every sample also lands in a trace ring that exports as Chrome-trace JSON
+(open it in chrome://tracing or Perfetto).
+
+The rings are plain preallocated lists written by a single game thread with
+no locks; readers copy a snapshot, so a sample racing a read is at worst
+missing from that one report.
+"""
+
+import json
+import threading
+import time
+import weakref
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+FRAME = "frame"
+# Systems wrapped by instrument_simulation: (attribute path, scope name)
+SIMULATION_SCOPES = (
+    ("", "tick", "Simulation.tick"),
+    ("physics", "update", "PhysicsSystem.update"),
+    ("collision", "check_bird_pipe", "CollisionSystem.check_bird_pipe"),
+    ("collision", "sweep_bird_pipe", "CollisionSystem.sweep_bird_pipe"),
+    ("pipe_generator", "spawn_if_needed", "PipeGenerator.spawn_if_needed"),
+    ("", "_score_passed_pipes", "Simulation._score_passed_pipes"),
+)
+
+
+class SampleRing:
+    """Fixed-capacity ring of the latest samples; one writer, lock-free readers."""
+
+    __slots__ = ("capacity", "count", "_data")
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.count = 0
+        self._data = [0] * capacity
+
+    def append(self, value) -> None:
+        self._data[self.count % self.capacity] = value
+        self.count += 1
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def snapshot(self) -> list:
+        """Held samples, oldest first."""
+        count, data = self.count, list(self._data)
+        if count <= self.capacity:
+            return data[:count]
+        start = count % self.capacity
+        return data[start:] + data[:start]
+
+
+class _NullScope:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        return False
+
+
+_NULL_SCOPE = _NullScope()
+
+
+class _Scope:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler: "Profiler", name: str) -> None:
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = self.profiler.clock()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        self.profiler.record(self.name, self.start, self.profiler.clock())
+        return False
+
+
+class Profiler:
+    """Collects durations (in clock nanoseconds) per scope name."""
+
+    def __init__(
+        self,
+        capacity: int = 1024,
+        trace_capacity: int = 65536,
+        enabled: bool = False,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ) -> None:
+        self.capacity = capacity
+        self.enabled = enabled
+        self.clock = clock
+        self.rings: Dict[str, SampleRing] = {}
+        self.trace = SampleRing(trace_capacity)
+        self.origin = clock()
+        self._last_frame: Optional[int] = None
+        self._wrapped: List[Tuple[weakref.ref, str]] = []
+        self._simulation: Optional[weakref.ref] = None
+
+    def enable(self) -> None:
+        self.enabled = True
+        sim = self._simulation() if self._simulation is not None else None
+        if sim is not None:
+            self.instrument_simulation(sim)
+
+    def disable(self) -> None:
+        """Stop collecting and unwrap everything instrumented; samples are kept."""
+        self.enabled = False
+        self._last_frame = None
+        self.uninstrument()
+
+    def reset(self) -> None:
+        self.rings.clear()
+        self.trace = SampleRing(self.trace.capacity)
+        self.origin = self.clock()
+        self._last_frame = None
+
+    def _ring(self, name: str) -> SampleRing:
+        ring = self.rings.get(name)
+        if ring is None:
+            ring = self.rings[name] = SampleRing(self.capacity)
+        return ring
+
+    def record(self, name: str, start: int, end: int) -> None:
+        self._ring(name).append(end - start)
+        self.trace.append((name, start, end - start, threading.get_ident()))
+
+    def scope(self, name: str):
+        """``with profiler.scope("HUD.draw"):`` times the block when enabled."""
+        if not self.enabled:
+            return _NULL_SCOPE
+        return _Scope(self, name)
+
+    def mark_frame(self) -> None:
+        """Call once per rendered frame; records the time since the last call."""
+        if not self.enabled:
+            return
+        now = self.clock()
+        if self._last_frame is not None:
+            self.record(FRAME, self._last_frame, now)
+        self._last_frame = now
+
+    def timed(self, fn: Callable, name: str) -> Callable:
+        record, clock = self.record, self.clock
+
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, start, clock())
+
+        wrapper.__wrapped__ = fn
+        return wrapper
+
+    def instrument(self, obj, method: str, name: Optional[str] = None) -> None:
+        """Time ``obj.method`` by shadowing it with a wrapper on the instance.
+
+        Only instrumented objects pay for timing, and ``uninstrument`` deletes
+        the wrapper again, so the class itself is never touched.
+        """
+        if method in vars(obj):
+            return
+        name = name or f"{type(obj).__name__}.{method}"
+        func, ref = getattr(type(obj), method), weakref.ref(obj)
+
+        # Reach the instance weakly: a bound method stored on it would form a
+        # cycle and keep finished runs alive until the cyclic GC ran
+        def call(*args, **kwargs):
+            return func(ref(), *args, **kwargs)
+
+        setattr(obj, method, self.timed(call, name))
+        # Objects of finished runs are gone; forget them
+        self._wrapped = [(r, m) for r, m in self._wrapped if r() is not None]
+        self._wrapped.append((ref, method))
+
+    def instrument_simulation(self, sim) -> None:
+        for owner, method, name in SIMULATION_SCOPES:
+            self.instrument(getattr(sim, owner) if owner else sim, method, name)
+
+    def watch_simulation(self, sim) -> None:
+        """Follow the live run: instrumented now if enabled, else on ``enable``."""
+        self._simulation = weakref.ref(sim)
+        if self.enabled:
+            self.instrument_simulation(sim)
+
+    def uninstrument(self) -> None:
+        for ref, method in self._wrapped:
+            obj = ref()
+            if obj is not None:
+                vars(obj).pop(method, None)
+        self._wrapped.clear()
+
+    def samples(self, name: str) -> np.ndarray:
+        """Recent durations of ``name`` in milliseconds."""
+        ring = self.rings.get(name)
+        values = ring.snapshot() if ring is not None else []
+        return np.asarray(values, dtype=np.float64) / 1e6
+
+    def percentiles(
+        self, name: str, qs: Sequence[float] = (50, 95, 99)
+    ) -> Dict[str, float]:
+        samples = self.samples(name)
+        if not len(samples):
+            return {f"p{q:g}": 0.0 for q in qs}
+        return {f"p{q:g}": float(v) for q, v in zip(qs, np.percentile(samples, qs))}
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Per scope: sample count, mean, p50/p95/p99 and max, all in ms."""
+        report = {}
+        for name in sorted(self.rings):
+            samples = self.samples(name)
+            if not len(samples):
+                continue
+            report[name] = {
+                "count": len(samples),
+                "mean": float(samples.mean()),
+                **self.percentiles(name),
+                "max": float(samples.max()),
+            }
+        return report
+
+    def chrome_trace(self) -> Dict:
+        # Complete ("X") events with microsecond timestamps from the origin
+        events = [
+            {
+                "name": name,
+                "cat": "frame" if name == FRAME else "system",
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": duration / 1000,
+                "pid": 1,
+                "tid": tid,
+            }
+            for name, start, duration, tid in self.trace.snapshot()
+        ]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f)
+
+
+# Shared by the game's screens and systems; enable it from a debug setting
+PROFILER = Profiler()
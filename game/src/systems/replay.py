@@ -0,0 +1,278 @@
+"""Compact binary input replays.
+
+Layout (integers are unsigned LEB128 varints)::
+
+    magic "RBRP" | version u8
+    seed | difficulty (length + utf-8) | tick_rate | flags u8
+    parameters, each ``2 * value`` when it is a small whole number,
+        otherwise ``1`` followed by a little-endian float64
+    flap deltas: tick - previous flap tick (previous starts at -1, so >= 1)
+    0 (end of flaps) | final tick | final score
+    CRC32 of everything above, u32 little-endian
+
+Default settings cost about 30 header bytes and most flaps one byte, so a
+whole game fits in a few hundred bytes.
+"""
+
+import io
+import struct
+import zlib
+from dataclasses import dataclass
+from typing import BinaryIO, Iterator, Optional
+
+from game.src.systems.collision import CollisionSystem
+from game.src.systems.physics import PhysicsSystem
+from game.src.systems.pipe_generator import PipeGenerator
+from game.src.systems.simulation import Simulation
+
+MAGIC = b"RBRP"
+VERSION = 1
+FLAG_SWEPT = 1
+FLAG_FIXED_SPEED = 2
+# Whole-number parameters below this are stored as varints
+_SMALL_LIMIT = 1 << 32
+_F64 = struct.Struct("<d")
+_U32 = struct.Struct("<I")
+
+
+class ReplayError(ValueError):
+    """Malformed, truncated or corrupted replay data."""
+
+
+def encode_varint(value: int, out: bytearray) -> None:
+    if value < 0:
+        raise ValueError("varints are unsigned")
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _encode_param(value: float, out: bytearray) -> None:
+    if float(value).is_integer() and 0 <= value < _SMALL_LIMIT:
+        encode_varint(2 * int(value), out)
+    else:
+        out.append(1)
+        out += _F64.pack(value)
+
+
+@dataclass(frozen=True)
+class ReplayHeader:
+    """Everything besides the inputs that a run's outcome depends on."""
+
+    seed: int
+    difficulty: str = "normal"
+    tick_rate: int = 60
+    swept_collision: bool = False
+    scroll_speed: Optional[float] = None
+    world_width: float = 480.0
+    world_height: float = 600.0
+    gap_margin: float = 60.0
+    gravity: float = 900.0
+    flap_impulse: float = 300.0
+    terminal_velocity: float = 900.0
+    spawn_interval: float = 1.5
+    pipe_width: float = 80.0
+    pipe_height: float = 600.0
+
+    @classmethod
+    def from_simulation(cls, sim: Simulation) -> "ReplayHeader":
+        physics, generator = sim.physics, sim.pipe_generator
+        return cls(
+            seed=sim.seed,
+            difficulty=sim.difficulty,
+            tick_rate=sim.tick_rate,
+            swept_collision=sim.swept_collision,
+            # A speed that follows the course is re-derived from the seed
+            scroll_speed=None if sim._course_speed else sim.scroll_speed,
+            world_width=sim.world_width,
+            world_height=sim.world_height,
+            gap_margin=sim.gap_margin,
+            gravity=physics.gravity,
+            flap_impulse=physics.flap_impulse,
+            terminal_velocity=physics.terminal_velocity,
+            spawn_interval=generator.spawn_interval,
+            pipe_width=generator.pipe_width,
+            pipe_height=generator.pipe_height,
+        )
+
+    def simulation(self) -> Simulation:
+        """A fresh Simulation configured exactly like the recorded one."""
+        return Simulation(
+            physics=PhysicsSystem(
+                self.gravity, self.flap_impulse, self.terminal_velocity
+            ),
+            pipe_generator=PipeGenerator(
+                spawn_interval=self.spawn_interval,
+                pipe_width=self.pipe_width,
+                pipe_height=self.pipe_height,
+            ),
+            collision=CollisionSystem(),
+            tick_rate=self.tick_rate,
+            seed=self.seed,
+            difficulty=self.difficulty,
+            scroll_speed=self.scroll_speed,
+            world_width=self.world_width,
+            world_height=self.world_height,
+            gap_margin=self.gap_margin,
+            swept_collision=self.swept_collision,
+        )
+
+    def params(self):
+        speed = () if self.scroll_speed is None else (self.scroll_speed,)
+        return speed + (
+            self.world_width,
+            self.world_height,
+            self.gap_margin,
+            self.gravity,
+            self.flap_impulse,
+            self.terminal_velocity,
+            self.spawn_interval,
+            self.pipe_width,
+            self.pipe_height,
+        )
+
+    def encode(self) -> bytearray:
+        out = bytearray(MAGIC)
+        out.append(VERSION)
+        encode_varint(self.seed, out)
+        name = self.difficulty.encode("utf-8")
+        encode_varint(len(name), out)
+        out += name
+        encode_varint(self.tick_rate, out)
+        flags = (FLAG_SWEPT if self.swept_collision else 0) | (
+            0 if self.scroll_speed is None else FLAG_FIXED_SPEED
+        )
+        out.append(flags)
+        for value in self.params():
+            _encode_param(value, out)
+        return out
+
+
+class ReplayRecorder:
+    """Appends a running game's flaps to an in-memory replay.
+
+    Attach with ``for_simulation`` before the first tick; the simulation calls
+    ``record_flap`` whenever a flap is applied and ``finish`` when the bird dies.
+    """
+
+    def __init__(self, header: ReplayHeader) -> None:
+        self.header = header
+        self.buffer = header.encode()
+        self.flaps = 0
+        self.data: Optional[bytes] = None
+        self._last_tick = -1
+
+    @classmethod
+    def for_simulation(cls, sim: Simulation) -> "ReplayRecorder":
+        if sim.tick_count:
+            raise ValueError("recording must start before the first tick")
+        recorder = cls(ReplayHeader.from_simulation(sim))
+        sim.recorder = recorder
+        return recorder
+
+    def record_flap(self, tick: int) -> None:
+        if self.data is not None:
+            raise ValueError("replay already finished")
+        if tick <= self._last_tick:
+            raise ValueError("flap ticks must increase")
+        encode_varint(tick - self._last_tick, self.buffer)
+        self._last_tick = tick
+        self.flaps += 1
+
+    def finish(self, final_tick: int, score: int) -> bytes:
+        if self.data is None:
+            self.buffer.append(0)
+            encode_varint(final_tick, self.buffer)
+            encode_varint(score, self.buffer)
+            self.buffer += _U32.pack(zlib.crc32(self.buffer))
+            self.data = bytes(self.buffer)
+        return self.data
+
+
+class ReplayReader:
+    """Streams a replay from a binary file object.
+
+    The header is parsed on construction; iterating yields flap ticks one at a
+    time without reading ahead, then checks the footer CRC and sets
+    ``final_tick`` and ``final_score``.
+    """
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self.stream = stream
+        self._crc = 0
+        self.final_tick: Optional[int] = None
+        self.final_score: Optional[int] = None
+        if self._read(len(MAGIC)) != MAGIC:
+            raise ReplayError("not a replay")
+        version = self._read(1)[0]
+        if version != VERSION:
+            raise ReplayError(f"unsupported replay version {version}")
+        seed = self._varint()
+        difficulty = self._read(self._varint()).decode("utf-8")
+        tick_rate = self._varint()
+        flags = self._read(1)[0]
+        speed = (self._param(),) if flags & FLAG_FIXED_SPEED else (None,)
+        self.header = ReplayHeader(
+            seed,
+            difficulty,
+            tick_rate,
+            bool(flags & FLAG_SWEPT),
+            *speed,
+            *(self._param() for _ in range(9)),
+        )
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "ReplayReader":
+        return cls(io.BytesIO(data))
+
+    def _read(self, n: int) -> bytes:
+        data = self.stream.read(n)
+        if len(data) != n:
+            raise ReplayError("truncated replay")
+        self._crc = zlib.crc32(data, self._crc)
+        return data
+
+    def _varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self._read(1)[0]
+            value |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def _param(self) -> float:
+        tag = self._varint()
+        if tag == 1:
+            return _F64.unpack(self._read(8))[0]
+        return float(tag // 2)
+
+    def __iter__(self) -> Iterator[int]:
+        tick = -1
+        while True:
+            delta = self._varint()
+            if delta == 0:
+                break
+            tick += delta
+            yield tick
+        self.final_tick = self._varint()
+        self.final_score = self._varint()
+        expected = self._crc
+        (crc,) = _U32.unpack(self._read(4))
+        if crc != expected:
+            raise ReplayError("replay checksum mismatch")
+
+
+def play(reader: ReplayReader) -> Simulation:
+    """Re-run a replay headlessly and return the finished Simulation."""
+    sim = reader.header.simulation()
+    for flap_tick in reader:
+        while sim.alive and sim.tick_count < flap_tick:
+            sim.tick()
+        if sim.alive:
+            sim.flap()
+    # The footer has been read once the flaps run out
+    while sim.alive and sim.tick_count < reader.final_tick:
+        sim.tick()
+    return sim
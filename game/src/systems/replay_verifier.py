@@ -0,0 +1,239 @@
+"""Anti-cheat verification of claimed scores by re-simulating their replays."""
+
+import os
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from typing import Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from game.src.entities.bird_batch import BirdBatch
+from game.src.systems.course import DIFFICULTY_PROFILES, get_course
+from game.src.systems.replay import ReplayHeader, ReplayReader
+
+MAX_SCORE = 1_000_000
+# One hour at 60 ticks per second
+MAX_REPLAY_TICKS = 60 * 60 * 60
+# Everything but seed and difficulty must match the shipped game
+STANDARD_RULES = ReplayHeader(seed=0)
+
+
+class Verdict(NamedTuple):
+    accepted: bool
+    reason: str
+    # First tick at which the re-simulation disagrees with the replay
+    divergence_tick: Optional[int] = None
+    # Score the re-simulation reached, when it got that far
+    score: Optional[int] = None
+
+
+class _Run(NamedTuple):
+    index: int
+    flaps: List[int]
+    final_tick: int
+    final_score: int
+    claimed: int
+
+
+ACCEPTED = "ok"
+DIED_EARLY = "bird died before the replay ends"
+OUTLIVED = "bird still alive when the replay ends"
+OVER_CLAIM = "score passed the claimed score"
+SCORE_MISMATCH = "final score differs from the claim"
+
+
+def _check_rules(header: ReplayHeader, rules: ReplayHeader) -> Optional[str]:
+    if header.difficulty not in DIFFICULTY_PROFILES:
+        return f"unknown difficulty {header.difficulty!r}"
+    if replace(header, seed=0, difficulty="normal") != replace(
+        rules, seed=0, difficulty="normal"
+    ):
+        return "non-standard game settings"
+    return None
+
+
+def _parse(
+    index: int, data: bytes, claimed: int
+) -> Tuple[Optional[_Run], Optional[Verdict]]:
+    try:
+        reader = ReplayReader.from_bytes(data)
+        flaps = list(reader)
+    except ValueError as e:
+        return None, Verdict(False, f"malformed replay: {e}")
+    if not 0 <= claimed <= MAX_SCORE:
+        return None, Verdict(False, "claimed score out of range")
+    if reader.final_score != claimed:
+        return None, Verdict(False, "claimed score differs from the replay")
+    if reader.final_tick > MAX_REPLAY_TICKS:
+        return None, Verdict(False, "replay too long")
+    if flaps and flaps[-1] >= reader.final_tick:
+        return None, Verdict(
+            False, "flap after the end of the replay", reader.final_tick
+        )
+    return _Run(index, flaps, reader.final_tick, reader.final_score, claimed), None
+
+
+def _judge_death(run: _Run, tick: int, score: int) -> Verdict:
+    if tick < run.final_tick:
+        return Verdict(False, DIED_EARLY, tick, score)
+    if score != run.claimed:
+        return Verdict(False, SCORE_MISMATCH, tick, score)
+    return Verdict(True, ACCEPTED, None, score)
+
+
+def verify_scalar(header: ReplayHeader, run: _Run) -> Verdict:
+    """Reference check of one run with a plain Simulation (any settings)."""
+    sim = header.simulation()
+    flaps = iter(run.flaps)
+    next_flap = next(flaps, None)
+    while sim.alive:
+        if sim.tick_count >= run.final_tick:
+            return Verdict(False, OUTLIVED, sim.tick_count, sim.score.current_score)
+        if next_flap == sim.tick_count:
+            sim.flap()
+            next_flap = next(flaps, None)
+        sim.tick()
+        if sim.alive and sim.score.current_score > run.claimed:
+            return Verdict(False, OVER_CLAIM, sim.tick_count, sim.score.current_score)
+    return _judge_death(run, sim.tick_count, sim.score.current_score)
+
+
+def verify_lockstep(header: ReplayHeader, runs: Sequence[_Run]) -> List[Verdict]:
+    """Check many runs of one course together.
+
+    The pipe timeline does not depend on the bird, so it is stepped once while
+    the birds advance as a BirdBatch with the same arithmetic as the scalar
+    path. Each run drops out at its first divergence and the loop stops once
+    every run has a verdict.
+    """
+    if header.swept_collision:
+        return [verify_scalar(header, run) for run in runs]
+    world = header.simulation()
+    bird = world.bird
+    n = len(runs)
+    batch = BirdBatch(n, bird.position.x, bird.position.y, bird.width, bird.height)
+    physics, collision, step = world.physics, world.collision, world.step
+
+    flaps_at = defaultdict(list)
+    for i, run in enumerate(runs):
+        for tick in run.flaps:
+            flaps_at[tick].append(i)
+    ends = np.array([run.final_tick for run in runs])
+    claims = np.array([run.claimed for run in runs])
+    alive = np.ones(n, dtype=bool)
+    mask = np.zeros(n, dtype=bool)
+    verdicts: List[Optional[Verdict]] = [None] * n
+
+    def settle(rows, reason=None):
+        nonlocal next_end, min_claim
+        alive[rows] = False
+        for i in rows.tolist():
+            if reason is None:
+                verdicts[i] = _judge_death(runs[i], tick, score)
+            else:
+                verdicts[i] = Verdict(False, reason, tick, score)
+        if alive.any():
+            next_end, min_claim = ends[alive].min(), claims[alive].min()
+
+    next_end, min_claim = ends.min(), claims.min()
+    while alive.any():
+        flappers = flaps_at.get(world.tick_count)
+        if flappers:
+            mask[:] = False
+            mask[flappers] = True
+            physics.flap_batch(batch, mask)
+        physics.update_batch(batch, step)
+        world.advance_world()
+        tick, score = world.tick_count, world.score.current_score
+
+        # Ground and ceiling, as in Simulation._resolve
+        dead = batch.y - batch.height / 2 <= 0.0
+        dead |= batch.y + batch.height / 2 >= world.world_height
+        # All birds share one x, so only pipes level with it can be hit
+        near = [
+            p
+            for p in world.pipes
+            if abs(p.position.x - bird.position.x) <= (p.width + bird.width) / 2 + 1.0
+        ]
+        if near:
+            dead |= collision.check_many(batch, near)
+        dead &= alive
+        if dead.any():
+            settle(np.flatnonzero(dead))
+
+        world._score_passed_pipes()
+        score = world.score.current_score
+        # Cheap scalar guards skip the per-bird scans on almost every tick
+        if score > min_claim:
+            settle(np.flatnonzero(alive & (claims < score)), OVER_CLAIM)
+        if tick >= next_end:
+            settle(np.flatnonzero(alive & (ends <= tick)), OUTLIVED)
+    return verdicts
+
+
+def _verify_task(task) -> List[Tuple[int, Verdict]]:
+    header, items = task
+    results, runs = [], []
+    for index, data, claimed in items:
+        run, verdict = _parse(index, data, claimed)
+        if verdict is not None:
+            results.append((index, verdict))
+        else:
+            runs.append(run)
+    if runs:
+        results.extend(
+            (run.index, verdict)
+            for run, verdict in zip(runs, verify_lockstep(header, runs))
+        )
+    return results
+
+
+def verify_batch(
+    items: Iterable[Tuple[bytes, int]],
+    workers: Optional[int] = None,
+    chunk_size: int = 512,
+    rules: ReplayHeader = STANDARD_RULES,
+) -> List[Verdict]:
+    """Verify ``(replay bytes, claimed score)`` pairs; verdicts keep input order.
+
+    Replays are grouped by course and sorted by (seed, difficulty) so each
+    task re-simulates up to ``chunk_size`` runs of one course in lockstep.
+    Courses are generated before the pool starts so forked workers share
+    them. ``workers=0`` runs in this process.
+    """
+    verdicts: List[Optional[Verdict]] = []
+    groups = defaultdict(list)
+    for index, (data, claimed) in enumerate(items):
+        verdicts.append(None)
+        try:
+            header = ReplayReader.from_bytes(data).header
+        except ValueError as e:
+            verdicts[index] = Verdict(False, f"malformed replay: {e}")
+            continue
+        problem = _check_rules(header, rules)
+        if problem is not None:
+            verdicts[index] = Verdict(False, problem)
+            continue
+        groups[header].append((index, data, int(claimed)))
+
+    headers = sorted(groups, key=lambda h: (h.seed, h.difficulty))
+    tasks = [
+        (header, groups[header][i : i + chunk_size])
+        for header in headers
+        for i in range(0, len(groups[header]), chunk_size)
+    ]
+    for header in headers[:64]:
+        get_course(
+            header.seed, header.difficulty, header.world_height, header.gap_margin
+        ).chunk(0)
+
+    if workers == 0 or len(tasks) <= 1:
+        results = [_verify_task(task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as pool:
+            results = list(pool.map(_verify_task, tasks))
+    for task_results in results:
+        for index, verdict in task_results:
+            verdicts[index] = verdict
+    return verdicts
@@ -0,0 +1,192 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+from game.src.entities.bird import Bird
+from game.src.entities.pipe import Pipe
+from game.src.entities.score import Score
+from game.src.systems.collision import CollisionSystem
+from game.src.systems.course import Course, get_course
+from game.src.systems.physics import PhysicsSystem
+from game.src.systems.pipe_generator import PipeGenerator
+from game.src.systems.scoring import ScoringSystem
+
+
+@dataclass
+class Simulation:
+    """Fixed-timestep game core driven by an accumulator.
+
+    Rendering calls ``advance(frame_dt)`` once per frame; the simulation runs
+    as many whole ticks of ``1 / tick_rate`` seconds as the accumulated time
+    allows and returns the interpolation alpha for drawing between the last two
+    ticks. Game state depends only on the course seed and the ticks at which
+    flaps were queued, never on frame timing, so runs are bit-identical.
+    """
+
+    physics: PhysicsSystem = field(default_factory=PhysicsSystem)
+    pipe_generator: PipeGenerator = field(default_factory=PipeGenerator)
+    collision: CollisionSystem = field(default_factory=CollisionSystem)
+    scoring: ScoringSystem = field(default_factory=ScoringSystem)
+    score: Score = field(default_factory=Score)
+    tick_rate: int = 60
+    max_ticks_per_frame: int = 8
+    seed: int = 0
+    difficulty: str = "normal"
+    course: Optional[Course] = None
+    scroll_speed: Optional[float] = None
+    world_width: float = 480.0
+    world_height: float = 600.0
+    gap_margin: float = 60.0
+    swept_collision: bool = False
+    bird: Optional[Bird] = None
+    tick_count: int = 0
+    accumulator: float = 0.0
+    alive: bool = True
+    cause_of_death: str = ""
+    # Optional ReplayRecorder; see ReplayRecorder.for_simulation
+    recorder: Optional[object] = None
+
+    def __post_init__(self) -> None:
+        self.step = 1.0 / self.tick_rate
+        if self.course is None:
+            self.course = get_course(
+                self.seed, self.difficulty, self.world_height, self.gap_margin
+            )
+        self.pipe_generator.course = self.course
+        self.pipe_generator.index = self.collision.index
+        # Without an explicit scroll speed, follow the course's speed curve
+        self._course_speed = self.scroll_speed is None
+        if self._course_speed:
+            self.scroll_speed = self.course.speed(0)
+        self._flap_queued = False
+        self._pipes_scored = 0
+        if self.bird is None:
+            self.bird = Bird()
+            self.bird.position.x = self.world_width / 4
+            self.bird.position.y = self.world_height / 2
+        self.previous_bird_y = self.bird.position.y
+
+    @property
+    def pipes(self):
+        # Live pipes are owned by the generator's ring buffer, oldest first
+        return self.pipe_generator.live
+
+    @property
+    def elapsed_time(self) -> float:
+        return self.tick_count * self.step
+
+    def flap(self) -> None:
+        # Inputs are applied at the start of the next tick, never mid-step
+        self._flap_queued = True
+
+    def advance(self, frame_dt: float) -> float:
+        """Run the ticks owed for ``frame_dt`` seconds and return the alpha."""
+        self.accumulator += frame_dt
+        ticks = 0
+        while self.alive and self.accumulator >= self.step:
+            if ticks == self.max_ticks_per_frame:
+                # Too far behind to catch up: drop the backlog rather than
+                # spiral, keeping only the partial tick for interpolation.
+                self.accumulator %= self.step
+                break
+            self.tick()
+            self.accumulator -= self.step
+            ticks += 1
+        return self.alpha
+
+    @property
+    def alpha(self) -> float:
+        return min(1.0, self.accumulator / self.step)
+
+    def tick(self) -> None:
+        """Advance the game by exactly one fixed step."""
+        step = self.step
+        bird = self.bird
+        self.previous_bird_y = bird.position.y
+        if self._flap_queued:
+            self._flap_queued = False
+            self.physics.flap(bird)
+            if self.recorder is not None:
+                self.recorder.record_flap(self.tick_count)
+        self.physics.update(bird, step)
+        dx = self.advance_world(recycle=False)
+        if self.alive:
+            self._resolve(bird, dx)
+        # Only now, so the sweep saw pipes that left the screen this tick
+        self.pipe_generator.recycle_offscreen(0.0)
+
+    def _resolve(self, bird: Bird, dx: float) -> None:
+        # Collisions, then scoring, for the tick just stepped
+        if self.swept_collision:
+            # Catch pipes crossed within the step when ticks are coarse or fast
+            previous = (bird.position.x, self.previous_bird_y)
+            toi = self.collision.sweep_bird_pipe(
+                bird, previous, self.collision.index, pipe_dx=-dx
+            )
+            if toi is not None:
+                bird.position.y = (
+                    self.previous_bird_y
+                    + (bird.position.y - self.previous_bird_y) * toi
+                )
+                self._die("pipe")
+                return
+        elif self.collision.check_bird_pipe(bird, self.collision.index):
+            self._die("pipe")
+            return
+        if bird.position.y - bird.height / 2 <= 0.0:
+            self._die("ground")
+            return
+        # Pipes end at the top of the screen, so flying above it is a death too
+        if bird.position.y + bird.height / 2 >= self.world_height:
+            self._die("ceiling")
+            return
+        self._score_passed_pipes()
+
+    def advance_world(self, recycle: bool = True) -> float:
+        """Scroll, spawn and recycle pipes for one tick; returns the scroll distance.
+
+        The pipe timeline never depends on the bird, so batch verifiers can
+        step it once for many birds. ``tick`` recycles only after collisions,
+        since a fast pipe can pass the bird and leave the screen in one step.
+        """
+        dx = self.scroll_speed * self.step
+        for pipe in self.pipes:
+            pipe.position.x -= dx
+        self.collision.index.scroll(dx)
+        self.tick_count += 1
+
+        generator = self.pipe_generator
+        if generator.spawn_due(self.elapsed_time):
+            spawn_x = self.world_width + generator.pipe_width / 2
+            generator.spawn_if_needed(self.elapsed_time, spawn_x)
+            if self._course_speed:
+                self.scroll_speed = self.course.speed(generator.spawned - 1)
+        if recycle:
+            generator.recycle_offscreen(0.0)
+        return dx
+
+    def _score_passed_pipes(self) -> None:
+        # Pipes are scored in spawn order once their centre is behind the bird
+        generator = self.pipe_generator
+        live = generator.live
+        first_live = generator.spawned - len(live)
+        while self._pipes_scored < generator.spawned:
+            i = self._pipes_scored - first_live
+            if i >= 0 and live[i].position.x >= self.bird.position.x:
+                break
+            self.scoring.add_pipe_pass(self.score)
+            self._pipes_scored += 1
+
+    def _die(self, cause: str) -> None:
+        self.alive = False
+        self.cause_of_death = cause
+        self.scoring.on_game_over(self.score)
+        if self.recorder is not None:
+            self.recorder.finish(self.tick_count, self.score.current_score)
+
+    def interpolated_bird_y(self, alpha: float) -> float:
+        prev = self.previous_bird_y
+        return prev + (self.bird.position.y - prev) * alpha
+
+    def interpolated_pipe_x(self, pipe: Pipe, alpha: float) -> float:
+        # Pipes scroll at a constant rate, so the previous x is one step right
+        return pipe.position.x + self.scroll_speed * self.step * (1.0 - alpha)
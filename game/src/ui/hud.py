@@ -1,11 +1,39 @@
+from typing import Optional
+
+from game.src.systems.profiler import PROFILER
+from game.src.ui.perf_overlay import PerfOverlay
+
+
 class HUD:
     def __init__(self) -> None:
         self.score_text = "0"
+        # Debug performance overlay, shown while the setting is on
+        self.overlay: Optional[PerfOverlay] = None
+        self.simulation = None
 
     def set_score(self, score: int) -> None:
         self.score_text = str(int(score))
 
-    def draw(self) -> None:
-        pass
+    def set_perf_overlay(self, enabled: bool) -> None:
+        if enabled and self.overlay is None:
+            self.overlay = PerfOverlay()
+            if self.simulation is not None:
+                self.overlay.watch(self.simulation)
+            self.overlay.attach()
+        elif not enabled and self.overlay is not None:
+            self.overlay.detach()
+            self.overlay = None
+
+    def watch(self, simulation) -> None:
+        self.simulation = simulation
+        if self.overlay is not None:
+            self.overlay.watch(simulation)
 
+    def update(self, dt: float) -> None:
+        if self.overlay is not None:
+            self.overlay.update(dt)
 
+    def draw(self) -> None:
+        with PROFILER.scope("HUD.draw"):
+            if self.overlay is not None:
+                self.overlay.draw()
@@ -1,4 +1,6 @@
 from typing import List
+
+from game.src.systems.profiler import PROFILER
 from game.src.ui.button import Button
 
 
@@ -10,7 +12,6 @@ class Menu:
         self.buttons.append(button)
 
     def draw(self) -> None:
-        for btn in self.buttons:
-            btn.draw()
-
-
+        with PROFILER.scope("Menu.draw"):
+            for btn in self.buttons:
+                btn.draw()
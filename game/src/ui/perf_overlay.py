@@ -0,0 +1,141 @@
+"""Debug overlay showing where frame time goes, readable on a phone."""
+
+import gc
+import time
+from collections import deque
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from game.src.systems.profiler import FRAME, PROFILER, Profiler, SampleRing
+
+# Frame-time histogram bucket edges in ms: 120/60/30/20 fps and slower
+HISTOGRAM_EDGES = (0.0, 8.4, 16.7, 33.4, 50.0, float("inf"))
+HISTOGRAM_LABELS = ("<8ms", "<17ms", "<33ms", "<50ms", "50ms+")
+GC_SCOPE = "gc"
+
+
+class PerfOverlay:
+    """Rolling FPS, frame-time histogram, per-system costs, entity and GC stats.
+
+    ``attach`` enables the profiler and hooks ``gc.callbacks``; ``detach``
+    undoes both, leaving the profiler on if it was already enabled. The
+    text is rebuilt at most every ``refresh`` seconds so the overlay does not
+    skew the frames it measures.
+    """
+
+    def __init__(
+        self, profiler: Profiler = PROFILER, window: int = 120, refresh: float = 0.25
+    ) -> None:
+        self.profiler = profiler
+        self.frame_times = deque(maxlen=window)
+        self.refresh = refresh
+        self.simulation = None
+        self.lines: List[str] = []
+        self.gc_collections = [0, 0, 0]
+        self.gc_collected = 0
+        self.gc_pauses = SampleRing(256)
+        self.gc_pause_total = 0
+        self._gc_start: Optional[int] = None
+        self._since_refresh = refresh
+        self.attached = False
+        self._enabled_profiler = False
+
+    def attach(self) -> None:
+        if not self.attached:
+            # Leave a profiler someone else switched on running after detach
+            self._enabled_profiler = not self.profiler.enabled
+            self.profiler.enable()
+            gc.callbacks.append(self._on_gc)
+            self.attached = True
+            if self.simulation is not None:
+                self.profiler.instrument_simulation(self.simulation)
+
+    def detach(self) -> None:
+        if self.attached:
+            gc.callbacks.remove(self._on_gc)
+            if self._enabled_profiler:
+                self.profiler.disable()
+            self.attached = False
+
+    def watch(self, simulation) -> None:
+        """Report entity and pool counts for ``simulation`` and time its systems."""
+        self.simulation = simulation
+        if self.attached:
+            self.profiler.instrument_simulation(simulation)
+
+    def _on_gc(self, phase: str, info: Dict) -> None:
+        now = time.perf_counter_ns()
+        if phase == "start":
+            self._gc_start = now
+            return
+        if self._gc_start is None:
+            return
+        start, self._gc_start = self._gc_start, None
+        self.gc_collections[info["generation"]] += 1
+        self.gc_collected += info["collected"]
+        self.gc_pauses.append(now - start)
+        self.gc_pause_total += now - start
+        # Shows up next to the systems and as a slice in the Chrome trace
+        self.profiler.record(GC_SCOPE, start, now)
+
+    def update(self, dt: float) -> None:
+        if dt > 0:
+            self.frame_times.append(dt)
+        self._since_refresh += dt
+
+    @property
+    def fps(self) -> float:
+        total = sum(self.frame_times)
+        return len(self.frame_times) / total if total else 0.0
+
+    def histogram(self) -> Dict[str, int]:
+        counts, _ = np.histogram(
+            np.asarray(self.frame_times) * 1000, bins=HISTOGRAM_EDGES
+        )
+        return dict(zip(HISTOGRAM_LABELS, counts.tolist()))
+
+    def entity_counts(self) -> Dict[str, int]:
+        sim = self.simulation
+        if sim is None:
+            return {}
+        generator = sim.pipe_generator
+        return {
+            "pipes": len(generator.live),
+            "pool_free": len(generator.pool),
+            "pool_capacity": generator.pool.capacity,
+            "pool_misses": generator.pool.misses,
+            "ring_grows": generator.live.grows,
+        }
+
+    def gc_stats(self) -> Dict[str, float]:
+        pauses = np.asarray(self.gc_pauses.snapshot(), dtype=np.float64) / 1e6
+        return {
+            "gen0": self.gc_collections[0],
+            "gen1": self.gc_collections[1],
+            "gen2": self.gc_collections[2],
+            "collected": self.gc_collected,
+            "pause_total_ms": self.gc_pause_total / 1e6,
+            "pause_max_ms": float(pauses.max()) if len(pauses) else 0.0,
+        }
+
+    def build_lines(self) -> List[str]:
+        lines = [f"FPS {self.fps:5.1f}"]
+        lines.append(" ".join(f"{label}:{n}" for label, n in self.histogram().items()))
+        for name, stats in self.profiler.stats().items():
+            if name != FRAME:
+                lines.append(f"{name} p50 {stats['p50']:.2f} p99 {stats['p99']:.2f} ms")
+        entities = self.entity_counts()
+        if entities:
+            lines.append(" ".join(f"{k}:{v}" for k, v in entities.items()))
+        g = self.gc_stats()
+        lines.append(
+            f"GC {g['gen0']}/{g['gen1']}/{g['gen2']} "
+            f"pause {g['pause_total_ms']:.1f} ms (max {g['pause_max_ms']:.2f})"
+        )
+        return lines
+
+    def draw(self) -> None:
+        if self._since_refresh >= self.refresh:
+            self._since_refresh = 0.0
+            self.lines = self.build_lines()
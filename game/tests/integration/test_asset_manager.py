@@ -0,0 +1,95 @@
+import json
+import threading
+from pathlib import Path
+
+import pytest
+
+REPO_ASSETS = Path(__file__).resolve().parents[3] / "assests"
+
+
+@pytest.mark.integration
+def test_asset_manager_contract(tmp_path, monkeypatch):
+    """
+    The build writes preload.json; AssetManager loads only the menu group
+    (the menu's own atlas page) before MainMenu is shown, streams the rest,
+    gameplay sprites included, by priority (threads or pump()), serves packed
+    sprites from the atlas, and keeps decoded assets in an LRU cache bounded
+    by decoded bytes.
+    """
+    pytest.importorskip("PIL")
+    import shutil
+
+    from game import build
+    from game.src.services.asset_manager import AssetManager
+    from game.src.states.main_menu import MainMenu
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "assets" / "sounds").mkdir(parents=True)
+    for path in REPO_ASSETS.glob("*.png"):
+        shutil.copy(path, tmp_path / "assets" / path.name)
+    (tmp_path / "assets" / "sounds" / "flap.ogg").write_bytes(b"ogg" * 100)
+    (tmp_path / "assets" / "credits.txt").write_bytes(b"thanks")
+    (tmp_path / "assets" / "license.txt").write_bytes(b"x" * 10)
+    build.optimize_assets(workers=0)
+    root = tmp_path / "build" / "web" / "assets"
+    preload = json.loads((root / "preload.json").read_text())
+    assert [e["priority"] for e in preload["assets"]] == sorted(
+        e["priority"] for e in preload["assets"]
+    )
+
+    fetched = []
+
+    def fetch(file):
+        fetched.append(file)
+        return (root / file).read_bytes()
+
+    # No threads (as under pygbag): nothing loads until pump()
+    assets = AssetManager(threaded=False, fetch=fetch)
+    assets.load_manifest()
+    menu = MainMenu(assets)
+    menu.on_enter()
+    # Only the menu's own atlas page is decoded; the pipes' page streams later
+    assert set(assets.cache) == {"atlas.json", "atlas_0.png"}
+    assert assets.entries["atlas_1.png"]["group"] == "gameplay"
+    page, rect = assets.sprite("bird_up")
+    assert page.size == (1024, 1024) and rect["w"] == 408
+    order = []
+    assets.request("credits.txt").add_done_callback(
+        lambda f: order.append("credits.txt")
+    )
+    assets.request("sounds/flap.ogg").add_done_callback(
+        lambda f: order.append("sounds/flap.ogg")
+    )
+    while assets.pump(budget=0.0):
+        menu.update(0.016)
+    assert order == ["sounds/flap.ogg", "credits.txt"]
+    assert assets.get("sounds/flap.ogg") == b"ogg" * 100
+    loads = assets.loads
+    assets.get("credits.txt")
+    assert assets.loads == loads
+    page, rect = assets.sprite("pipe_top")
+    assert page.size == (1024, 4096) and "atlas_1.png" in assets.cache
+
+    # LRU bound on decoded bytes: the least recently used asset goes first
+    small = AssetManager(max_bytes=310, threaded=False, fetch=fetch)
+    small.load_manifest()
+    small.get("sounds/flap.ogg")
+    small.get("credits.txt")
+    small.get("sounds/flap.ogg")
+    small.get("license.txt")
+    assert (
+        list(small.cache) == ["sounds/flap.ogg", "license.txt"]
+        and small.cached_bytes == 310
+    )
+    # An atlas page (4 MiB decoded) alone exceeds the bound and evicts the rest
+    small.get("atlas_0.png")
+    assert list(small.cache) == ["atlas_0.png"] and small.evictions == 3
+
+    # Threaded: streamed loads complete on workers
+    threaded = AssetManager(workers=2, fetch=fetch)
+    threaded.load_manifest()
+    threaded.preload()
+    futures = [threaded.request(name) for name in threaded.entries]
+    assert {f.result(timeout=10) is not None for f in futures} == {True}
+    assert threading.active_count() >= 3
+    threaded.close()
@@ -0,0 +1,69 @@
+from pathlib import Path
+
+import pytest
+
+REPO_ASSETS = Path(__file__).resolve().parents[3] / "assests"
+
+
+@pytest.mark.integration
+def test_atlas_packer_contract(tmp_path):
+    """
+    build.pack_sprites places sprites without overlap on power-of-two pages,
+    and build_atlases writes pages (one set per sprite group) plus a manifest
+    whose rects and UVs reproduce each source sprite within the visually
+    lossless PSNR bound.
+    """
+    Image = pytest.importorskip("PIL.Image")
+    from game.build import (
+        QUANTIZE_MIN_PSNR,
+        _psnr,
+        build_atlases,
+        pack_sprites,
+        sprite_name,
+    )
+
+    sizes = {f"s{i}": (10 + 3 * i, 40 - i) for i in range(30)}
+    pages = pack_sprites(sizes, max_size=128, padding=1)
+    assert len(pages) > 1
+    assert sorted(n for page in pages for n in page["sprites"]) == sorted(sizes)
+    for page in pages:
+        w, h = page["width"], page["height"]
+        assert w & (w - 1) == 0 and h & (h - 1) == 0
+        rects = list(page["sprites"].values())
+        for i, (x, y, rw, rh) in enumerate(rects):
+            assert x >= 1 and y >= 1 and x + rw + 1 <= w and y + rh + 1 <= h
+            for ox, oy, ow, oh in rects[i + 1 :]:
+                assert (
+                    x + rw + 1 <= ox - 1
+                    or ox + ow + 1 <= x - 1
+                    or y + rh + 1 <= oy - 1
+                    or oy + oh + 1 <= y - 1
+                )
+    with pytest.raises(ValueError):
+        pack_sprites({"huge": (200, 10)}, max_size=128)
+
+    sprites = sorted(REPO_ASSETS.glob("*.png"))
+    manifest = build_atlases(sprites, tmp_path, workers=0)
+    assert set(manifest["sprites"]) == {sprite_name(p) for p in sprites}
+    assert "bg_sky" in manifest["sprites"]
+    # Menu sprites get their own page so the menu never waits on gameplay art
+    assert [page["group"] for page in manifest["atlases"]] == ["menu", "gameplay"]
+    pages = {
+        entry["atlas"]
+        for name, entry in manifest["sprites"].items()
+        if name.startswith("pipe_")
+    }
+    assert pages == {1}
+    assert {manifest["sprites"][name]["atlas"] for name in ("bg_sky", "bird_up")} == {0}
+    for path in sprites:
+        entry = manifest["sprites"][sprite_name(path)]
+        atlas = Image.open(
+            tmp_path / manifest["atlases"][entry["atlas"]]["file"]
+        ).convert("RGBA")
+        x, y, w, h = entry["x"], entry["y"], entry["w"], entry["h"]
+        assert entry["u0"] * atlas.width == x and entry["v1"] * atlas.height == y + h
+        assert (
+            _psnr(atlas.crop((x, y, x + w, y + h)), Image.open(path).convert("RGBA"))
+            >= QUANTIZE_MIN_PSNR
+        )
+    assert (tmp_path / manifest["file"]).exists()
@@ -0,0 +1,37 @@
+import pytest
+
+
+@pytest.mark.integration
+def test_batch_physics_matches_scalar_contract():
+    """
+    PhysicsSystem.update_batch/flap_batch must advance a BirdBatch with results
+    bit-identical to calling update/flap on each Bird individually.
+    """
+    from game.src.entities.bird import Bird
+    from game.src.entities.bird_batch import BirdBatch
+    from game.src.systems.physics import PhysicsSystem
+
+    physics = PhysicsSystem(gravity=900.0, flap_impulse=300.0, terminal_velocity=900.0)
+    birds = [Bird() for _ in range(16)]
+    for i, bird in enumerate(birds):
+        bird.position.y = 100.0 + i * 7.5
+        bird.velocity.y = -50.0 * i
+    batch = BirdBatch.from_birds(birds)
+
+    for tick in range(240):
+        dt = (1.0, 0.016, 1 / 60, 0.05)[tick % 4]
+        mask = [(tick + i) % 9 == 0 for i in range(len(birds))]
+        for bird, flap in zip(birds, mask):
+            if flap:
+                physics.flap(bird)
+            physics.update(bird, dt)
+        physics.flap_batch(batch, mask)
+        physics.update_batch(batch, dt)
+
+    assert batch.y.tolist() == [b.position.y for b in birds]
+    assert batch.vy.tolist() == [b.velocity.y for b in birds]
+    assert batch.rotation.tolist() == [b.rotation for b in birds]
+
+    copies = [Bird() for _ in birds]
+    batch.write_back(copies)
+    assert [c.position.y for c in copies] == [b.position.y for b in birds]
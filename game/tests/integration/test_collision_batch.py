@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+
+@pytest.mark.integration
+def test_check_many_matches_check_bird_pipe_contract():
+    """
+    CollisionSystem.check_many(birds, pipes) returns a hit mask (and optionally
+    the first pipe index hit) that agrees exactly with check_bird_pipe per bird.
+    """
+    from game.src.entities.bird import Bird
+    from game.src.entities.bird_batch import BirdBatch
+    from game.src.entities.pipe import Pipe
+    from game.src.systems.collision import CollisionSystem
+
+    rng = random.Random(9)
+    system = CollisionSystem()
+    pipes = []
+    for i in range(30):
+        pipe = Pipe()
+        pipe.position.x = 100.0 * i
+        pipe.gap_y = rng.uniform(150, 450)
+        pipes.append(pipe)
+    birds = []
+    for _ in range(400):
+        bird = Bird()
+        bird.position.x = rng.choice(
+            [rng.uniform(-100, 3100), 100.0 * rng.randrange(30) + 72.0]
+        )
+        bird.position.y = rng.uniform(0, 600)
+        birds.append(bird)
+
+    hits, first = system.check_many(birds, pipes, return_index=True)
+    assert hits.tolist() == [system.check_bird_pipe(b, pipes) for b in birds]
+    for bird, idx in zip(birds, first.tolist()):
+        expected = next(
+            (i for i, p in enumerate(pipes) if system.check_bird_pipe(bird, [p])), -1
+        )
+        assert idx == expected
+
+    batch_hits = system.check_many(BirdBatch.from_birds(birds), pipes)
+    assert batch_hits.tolist() == hits.tolist()
+
+    empty_hits, empty_first = system.check_many(birds, [], return_index=True)
+    assert not empty_hits.any() and (empty_first == -1).all()
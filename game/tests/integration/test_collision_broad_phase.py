@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+
+def _brute_force(system, bird, pipes):
+    bird_bb = system._bird_bbox(bird)
+    return any(
+        system._overlap(bird_bb, s) for p in pipes for s in system._pipe_solids(p)
+    )
+
+
+@pytest.mark.integration
+def test_broad_phase_matches_linear_scan_contract():
+    """
+    CollisionSystem.check_bird_pipe narrows pipes through a sorted sweep index
+    and must agree with a linear scan over every pipe's solids, both for
+    ad-hoc lists and for an index kept up to date with insert, scroll and
+    remove, whose cached solids follow moved pipes and changed gaps.
+    """
+    from game.src.entities.bird import Bird
+    from game.src.entities.pipe import Pipe
+    from game.src.systems.collision import CollisionSystem, PipeIndex
+
+    rng = random.Random(5)
+    system = CollisionSystem()
+    pipes = []
+    for _ in range(200):
+        pipe = Pipe()
+        pipe.position.x = rng.uniform(-500, 5000)
+        pipe.gap_y = rng.uniform(150, 450)
+        pipe.width = rng.choice([40.0, 80.0, 160.0])
+        pipes.append(pipe)
+
+    for _ in range(500):
+        bird = Bird()
+        bird.position.x = rng.uniform(-600, 5100)
+        bird.position.y = rng.uniform(0, 600)
+        assert system.check_bird_pipe(bird, pipes) is _brute_force(system, bird, pipes)
+
+    # Kept incrementally, scrolling moves the offset instead of the entries
+    index = PipeIndex()
+    for pipe in pipes:
+        index.insert(pipe)
+    for step in range(50):
+        dx = rng.uniform(0.0, 40.0)
+        for pipe in pipes:
+            pipe.position.x -= dx
+        index.scroll(dx)
+        if step % 10 == 0:
+            assert index.remove(pipes[step]) and not index.remove(pipes[step])
+        live = [p for i, p in enumerate(pipes) if not (i % 10 == 0 and i <= step)]
+        for _ in range(20):
+            bird = Bird()
+            bird.position.x = rng.uniform(-2000, 5100)
+            bird.position.y = rng.uniform(0, 600)
+            assert system.check_bird_pipe(bird, index) is _brute_force(
+                system, bird, live
+            )
+    assert len(index) == len(pipes) - 5
+
+    # Solids are cached until the pipe moves or a reused pipe gets a new gap
+    lone = Pipe()
+    lone.position.x = 100.0
+    single = PipeIndex()
+    single.insert(lone)
+    bird = Bird()
+    bird.position.x, bird.position.y = 100.0, lone.gap_y
+    assert not system.check_bird_pipe(bird, single)
+    entry = single._sorted[0]
+    assert entry.current_solids() is entry.current_solids()
+    lone.gap_y += 200.0
+    assert system.check_bird_pipe(bird, single)
+    lone.position.x -= 200.0
+    single.scroll(200.0)
+    assert not system.check_bird_pipe(bird, single)
+
+    from game.src.systems.simulation import Simulation
+
+    sim = Simulation(seed=2)
+    for _ in range(2000):
+        sim.tick()
+        assert [e.pipe for e in sim.collision.index._sorted] == list(sim.pipes)
@@ -0,0 +1,41 @@
+import itertools
+
+import pytest
+
+
+@pytest.mark.integration
+def test_seeded_course_contract():
+    """
+    A Course keyed by (seed, difficulty) yields the same gap_y, gap_size and
+    speed for every pipe index no matter how it is accessed, and PipeGenerator
+    spawns from it when no gap_y is passed.
+    """
+    from game.src.systems.course import CHUNK_SIZE, Course, get_course
+    from game.src.systems.pipe_generator import PipeGenerator
+
+    a = Course(seed=42)
+    b = Course(seed=42)
+    # Random access into a later chunk matches sequential streaming
+    late = b.entry(CHUNK_SIZE + 3)
+    streamed = list(itertools.islice(a, CHUNK_SIZE + 4))
+    assert streamed[-1] == late
+    assert streamed[:10] != list(itertools.islice(Course(seed=43), 10))
+    assert streamed[:10] != list(
+        itertools.islice(Course(seed=42, difficulty="hard"), 10)
+    )
+
+    for gap_y, gap_size, speed in streamed:
+        assert 60.0 + gap_size / 2 <= gap_y <= 600.0 - 60.0 - gap_size / 2
+    sizes = [e[1] for e in streamed]
+    speeds = [e[2] for e in streamed]
+    assert sizes == sorted(sizes, reverse=True) and speeds == sorted(speeds)
+
+    assert get_course(42, "normal") is get_course(42, "normal")
+    with pytest.raises(ValueError):
+        Course(seed=1, difficulty="impossible")
+
+    gen = PipeGenerator(spawn_interval=1.0, course=a)
+    spawned = [gen.spawn_if_needed(float(t), x=500.0)[0] for t in range(1, 4)]
+    assert [(p.gap_y, p.gap_size) for p in spawned] == [e[:2] for e in streamed[:3]]
+    with pytest.raises(ValueError, match="gap_y required"):
+        PipeGenerator().spawn_if_needed(5.0, x=500.0)
@@ -0,0 +1,35 @@
+import pytest
+
+
+@pytest.mark.integration
+def test_headless_runner_contract():
+    """
+    run_session plays a complete seeded game (physics, pipes, collision and
+    scoring) with a flap policy and reports score, ticks survived and cause of
+    death; run_sessions returns the same results from a process pool. Flying
+    over the pipes is not a way through: leaving the top of the screen kills.
+    """
+    from game.src.systems.headless import follow_gap, run_session, run_sessions
+
+    never = run_session(seed=1, policy=_never_flap)
+    assert never.cause == "ground"
+    assert never.score == 0
+
+    blind = run_session(seed=1, policy=_flap_every_20_ticks)
+    assert (blind.cause, blind.score) == ("ceiling", 0)
+
+    results = [run_session(seed, policy=follow_gap) for seed in range(6)]
+    assert all(r.cause in ("pipe", "ground", "ceiling", "timeout") for r in results)
+    assert max(r.score for r in results) >= 1
+    assert max(r.ticks for r in results) > never.ticks
+
+    assert run_session(seed=3, max_ticks=10).cause == "timeout"
+    assert run_sessions(range(6), policy=follow_gap, workers=2, chunk_size=2) == results
+
+
+def _never_flap(obs):
+    return False
+
+
+def _flap_every_20_ticks(obs):
+    return obs.tick % 20 == 0
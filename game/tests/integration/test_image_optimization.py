@@ -0,0 +1,54 @@
+import io
+import shutil
+from pathlib import Path
+
+import pytest
+
+REPO_ASSETS = Path(__file__).resolve().parents[3] / "assests"
+
+
+@pytest.mark.integration
+def test_image_optimization_contract(tmp_path, monkeypatch):
+    """
+    optimize_image strips metadata, palettizes losslessly where it can,
+    honours target resolutions and never grows a file; optimize_images gives
+    the same bytes on a process pool as in-process; optimize_assets fails
+    once the output exceeds the size budget.
+    """
+    Image = pytest.importorskip("PIL.Image")
+    PngImagePlugin = pytest.importorskip("PIL.PngImagePlugin")
+    from game import build
+
+    image = Image.new("RGBA", (64, 64), (0, 0, 0, 0))
+    for i in range(4):
+        image.paste((255, 40 * i, 0, 255), (i * 16, 0, i * 16 + 16, 64))
+    info = PngImagePlugin.PngInfo()
+    info.add_text("Comment", "x" * 4096)
+    raw = io.BytesIO()
+    image.save(raw, "PNG", pnginfo=info)
+
+    data = build.optimize_image(raw.getvalue())
+    assert len(data) < len(raw.getvalue())
+    optimized = Image.open(io.BytesIO(data))
+    assert "Comment" not in optimized.info
+    assert optimized.convert("RGBA").tobytes() == image.tobytes()
+    assert Image.open(
+        io.BytesIO(build.optimize_image(raw.getvalue(), (16, 32)))
+    ).size == (16, 32)
+
+    tight = build.optimize_image(data)
+    assert len(tight) <= len(data)
+
+    jobs = {
+        p.name: (p.read_bytes(), None) for p in sorted(REPO_ASSETS.glob("bird_*.png"))
+    }
+    assert build.optimize_images(jobs, workers=2) == build.optimize_images(
+        jobs, workers=0
+    )
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "assets").mkdir()
+    shutil.copy(REPO_ASSETS / "bg_sky.png.png", tmp_path / "assets" / "bg_sky.png.png")
+    with pytest.raises(build.AssetBudgetExceeded):
+        build.optimize_assets(workers=0, budget=1024)
+    assert build.optimize_assets(workers=0)
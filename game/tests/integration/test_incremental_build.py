@@ -0,0 +1,101 @@
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+
+REPO_ASSETS = Path(__file__).resolve().parents[3] / "assests"
+
+
+@pytest.mark.integration
+def test_incremental_asset_build_contract(tmp_path, monkeypatch):
+    """
+    optimize_assets writes content-hashed outputs plus an asset manifest,
+    skips stages whose inputs are unchanged on the next run, and replaces
+    (and prunes) only the outputs whose sources changed.
+    """
+    pytest.importorskip("PIL")
+    from game import build
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "assets" / "sounds").mkdir(parents=True)
+    for name in ("bird_up.png", "bird_down.png"):
+        shutil.copy(REPO_ASSETS / name, tmp_path / "assets" / name)
+    (tmp_path / "assets" / "sounds" / "flap.ogg").write_bytes(b"flap-v1")
+    out = tmp_path / "build" / "web" / "assets"
+
+    first = build.optimize_assets()
+    assert set(first) == {"atlas.json", "sounds/flap.ogg"}
+    assert first["sounds/flap.ogg"] == "sounds/" + build.hashed_name(
+        "flap.ogg", build.hash_file(Path("assets/sounds/flap.ogg"))
+    )
+    assert json.loads((out / build.ASSET_MANIFEST).read_text()) == first
+    atlas_manifest = json.loads((out / first["atlas.json"]).read_text())
+    page = out / atlas_manifest["atlases"][0]["file"]
+    stamp = page.stat().st_mtime_ns
+
+    # Nothing changed: same names, atlas stage not re-run
+    assert build.optimize_assets() == first
+    assert page.stat().st_mtime_ns == stamp
+
+    # One source changes: only its output is renamed, the stale file pruned
+    (tmp_path / "assets" / "sounds" / "flap.ogg").write_bytes(b"flap-v2")
+    second = build.optimize_assets()
+    assert second["atlas.json"] == first["atlas.json"]
+    assert second["sounds/flap.ogg"] != first["sounds/flap.ogg"]
+    assert not (out / first["sounds/flap.ogg"]).exists()
+    assert page.stat().st_mtime_ns == stamp
+
+    shutil.copy(
+        REPO_ASSETS / "bird_neutral.png", tmp_path / "assets" / "bird_neutral.png"
+    )
+    third = build.optimize_assets()
+    assert third["atlas.json"] != first["atlas.json"]
+    assert not page.exists() and not (out / first["atlas.json"]).exists()
+    assert (
+        "bird_neutral" in json.loads((out / third["atlas.json"]).read_text())["sprites"]
+    )
+
+
+@pytest.mark.integration
+def test_web_build_rebuilds_on_any_input_contract(tmp_path, monkeypatch):
+    """
+    The pygbag stage is skipped only while the sources, pygbag.toml, the icon
+    and assets and the installed pygbag version are all unchanged.
+    """
+    from game import build
+
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("print('hi')\n")
+    (tmp_path / "pygbag.toml").write_text("[web]\ntitle = 'A'\n")
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "icon.png").write_bytes(b"icon-v1")
+
+    runs = []
+
+    def fake_pygbag(cmd, **kwargs):
+        runs.append(cmd)
+        (tmp_path / "build" / "web").mkdir(parents=True, exist_ok=True)
+        (tmp_path / "build" / "web" / "index.html").write_text("<html>")
+        return build.subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(build.subprocess, "run", fake_pygbag)
+    version = {"pygbag": "0.9.0"}
+    monkeypatch.setattr(build, "package_version", lambda name: version[name])
+    cache = {"version": build.BUILD_CACHE_VERSION, "stages": {}}
+
+    def rebuilt() -> bool:
+        before = len(runs)
+        build.build_web(cache)
+        return len(runs) > before
+
+    assert rebuilt() and not rebuilt()
+    (tmp_path / "pygbag.toml").write_text("[web]\ntitle = 'B'\n")
+    assert rebuilt() and not rebuilt()
+    (tmp_path / "assets" / "icon.png").write_bytes(b"icon-v2")
+    assert rebuilt() and not rebuilt()
+    version["pygbag"] = "0.9.1"
+    assert rebuilt() and not rebuilt()
+    (tmp_path / "src" / "main.py").write_text("print('bye')\n")
+    assert rebuilt()
@@ -0,0 +1,79 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.integration
+def test_leaderboard_cache_contract():
+    """
+    LeaderboardService.afetch_top caches per (limit, offset, filters) with a TTL,
+    serves stale entries while one background refresh runs, coalesces concurrent
+    callers into one request, and submit invalidates the cache, including
+    reads already in flight, so the next read sees the write. The sync
+    fetch_top returns cached rows instantly.
+    """
+    import httpx
+
+    from game.src.services.cache import SWRCache
+    from game.src.services.leaderboard_service import LeaderboardService
+    from game.src.services.supabase_client import SupabaseClient
+    from game.src.states.leaderboard_view import LeaderboardView
+
+    gets = []
+    board = [{"id": "1", "name": "Ann", "score": 5, "created_at": "t"}]
+
+    async def handler(request):
+        if request.method == "POST":
+            board.append({"id": "2", "name": "Bo", "score": 9, "created_at": "t"})
+            return httpx.Response(201, json=[board[-1]])
+        gets.append(request)
+        rows = sorted(board, key=lambda r: -r["score"])
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=rows)
+
+    now = {"t": 0.0}
+    client = SupabaseClient(
+        "https://x.supabase.co",
+        "k",
+        rate_limits=None,
+        transport=httpx.MockTransport(handler),
+    )
+    service = LeaderboardService(
+        client, SWRCache(ttl=10.0, stale_ttl=60.0, clock=lambda: now["t"])
+    )
+
+    async def scenario():
+        assert service.fetch_top(10) == []
+        results = await asyncio.gather(*(service.afetch_top(10) for _ in range(20)))
+        assert len(gets) == 1 and all(r == results[0] for r in results)
+        assert service.fetch_top(10) == results[0]
+
+        await service.afetch_top(10)
+        assert len(gets) == 1
+        await service.afetch_top(10, filters={"score": "gte.3"})
+        assert len(gets) == 2
+
+        now["t"] = 30.0
+        stale = await service.afetch_top(10)
+        assert stale == results[0]
+        await asyncio.sleep(0.05)
+        assert len(gets) == 3
+
+        # A read already in flight when the score lands is not joined afterwards
+        now["t"] = 200.0
+        before = asyncio.ensure_future(service.afetch_top(10))
+        await asyncio.sleep(0.005)
+        await service.asubmit_score("Bo", 9)
+        assert service.fetch_top(10) == []
+        fresh = await service.afetch_top(10)
+        assert fresh[0]["name"] == "Bo"
+        assert (await before)[0]["name"] == "Ann"
+        assert service.fetch_top(10) == fresh
+
+        view = LeaderboardView(service)
+        view.on_enter()
+        assert view.entries == fresh
+        await asyncio.sleep(0.05)
+        view.on_exit()
+
+    asyncio.run(scenario())
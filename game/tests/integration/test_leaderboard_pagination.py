@@ -0,0 +1,84 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.integration
+def test_keyset_pagination_contract():
+    """
+    LeaderboardService pages the board with (score, created_at, id) keyset
+    cursors, streams every row exactly once in rank order, and serves windows
+    around a score or a rank. The top page uses the same total order, so
+    paging on from it neither skips nor repeats tied rows.
+    """
+    from game.src.services.leaderboard_service import LeaderboardService
+    from game.src.services.local_postgrest import LocalPostgrest
+    from game.src.services.supabase_client import SupabaseClient
+    from game.src.states.leaderboard_view import LeaderboardView
+
+    import httpx
+
+    from game.src.services.leaderboard_service import KEYSET_ORDER
+
+    server = LocalPostgrest()
+    orders = []
+
+    def handler(request):
+        if request.method == "GET":
+            orders.append(request.url.params.get("order"))
+        return server.handle(request)
+
+    client = SupabaseClient(
+        "http://stand-in", "k", rate_limits=None, transport=httpx.MockTransport(handler)
+    )
+    service = LeaderboardService(client)
+
+    async def scenario():
+        async with client:
+            # Heavy ties on score and identical timestamps exercise every tiebreak
+            rows = [
+                {
+                    "id": f"id-{i:03d}",
+                    "name": f"P{i}",
+                    "score": (i * 7) % 13,
+                    "created_at": f"2025-01-01T00:00:0{i % 3}Z",
+                }
+                for i in range(120)
+            ]
+            assert (await client.post("/leaderboard", json=rows)).status_code == 201
+            expected = sorted(
+                rows, key=lambda r: (-r["score"], r["created_at"], r["id"])
+            )
+
+            streamed = []
+            async for page in service.aiter_leaderboard(page_size=7):
+                assert len(page) <= 7
+                streamed.extend(page)
+            assert [r["id"] for r in streamed] == [r["id"] for r in expected]
+
+            window = await service.afetch_around_score(6, above=3, below=2)
+            ids = [r["id"] for r in expected]
+            first_at_or_below = next(
+                i for i, r in enumerate(expected) if r["score"] <= 6
+            )
+            assert [r["id"] for r in window] == ids[
+                first_at_or_below - 3 : first_at_or_below + 2
+            ]
+
+            around = await service.afetch_around_rank(50, radius=2)
+            assert [r["id"] for r in around] == ids[47:52]
+            assert [
+                r["id"] for r in await service.afetch_around_rank(1, radius=2)
+            ] == ids[:3]
+
+            # The first page comes from afetch_top and must use the keyset's
+            # total order, or ties make the cursor skip or repeat rows
+            view = LeaderboardView(service, limit=10)
+            view.on_enter()
+            await view._refresh
+            assert orders[-1] == KEYSET_ORDER
+            assert await view.load_more() == 10
+            assert await view.load_more() == 10
+            assert [r["id"] for r in view.entries] == ids[:30]
+
+    asyncio.run(scenario())
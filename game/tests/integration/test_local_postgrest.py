@@ -0,0 +1,129 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.integration
+def test_local_postgrest_contract():
+    """
+    LocalPostgrest implements the leaderboard GET/POST contract offline:
+    ordering, limit/offset/select, validation and RLS-style errors, duplicate
+    handling for bulk inserts, 401 for bad keys and 429 rate limiting.
+    """
+    import httpx
+
+    from game.src.services.leaderboard_service import LeaderboardService
+    from game.src.services.local_postgrest import LocalPostgrest
+    from game.src.services.supabase_client import SupabaseClient
+
+    server = LocalPostgrest(anon_key="anon")
+    client = SupabaseClient(
+        "http://stand-in", "anon", rate_limits=None, transport=server.transport()
+    )
+    service = LeaderboardService(client)
+
+    async def scenario():
+        async with client:
+            for i, score in enumerate([5, 40, 12, 40]):
+                record = await service.asubmit_score(f"Player {i}", score)
+                assert set(record) == {"id", "name", "score", "created_at"}
+            top = await service.afetch_top(limit=3)
+            assert [r["score"] for r in top] == [40, 40, 12]
+            assert [r["name"] for r in top[:2]] == ["Player 1", "Player 3"]
+
+            params = {
+                "select": "name",
+                "order": "score.asc,created_at.asc",
+                "limit": 2,
+                "offset": 1,
+            }
+            get = await client.get("/leaderboard", params=params)
+            assert get.json() == [{"name": "Player 2"}, {"name": "Player 1"}]
+            assert (
+                await client.get("/leaderboard", params={"limit": 51})
+            ).status_code == 400
+            assert (
+                await client.get("/leaderboard", params={"order": "secret.desc"})
+            ).status_code == 400
+
+            too_long = await client.post(
+                "/leaderboard", json={"name": "X" * 100, "score": -1}
+            )
+            assert too_long.status_code == 400 and too_long.json()["code"] == "23514"
+            empty = await client.post("/leaderboard", json={"name": "", "score": 1})
+            assert empty.status_code == 403 and empty.json()["code"] == "42501"
+            # The insert policy only bounds the length; any characters are fine
+            dashed = await client.post(
+                "/leaderboard", json={"name": "Test-Player!", "score": 1}
+            )
+            assert dashed.status_code == 201
+
+            mixed = [
+                {"name": "Mixed", "score": 1},
+                {"name": "Mixed", "score": 2, "replay": None},
+            ]
+            mismatch = await client.post("/leaderboard", json=mixed)
+            assert mismatch.status_code == 400 and mismatch.json()["code"] == "PGRST102"
+
+            rows = [
+                {"id": "a", "name": "Bulk", "score": 1},
+                {"id": "b", "name": "Bulk", "score": 2},
+            ]
+            assert (await client.post("/leaderboard", json=rows)).status_code == 201
+            assert (await client.post("/leaderboard", json=rows)).status_code == 409
+            dup = await client.post(
+                "/leaderboard",
+                json=rows,
+                headers={
+                    "Prefer": "resolution=ignore-duplicates,return=representation"
+                },
+            )
+            assert dup.status_code == 201 and dup.json() == []
+
+    asyncio.run(scenario())
+
+    bad_key = httpx.Request(
+        "GET", "http://stand-in/rest/v1/leaderboard", headers={"apikey": "nope"}
+    )
+    assert server.handle(bad_key).status_code == 401
+    limited = LocalPostgrest(rate_limits=((5, 10.0),), clock=lambda: 0.0)
+    statuses = [
+        limited.handle(httpx.Request("GET", "http://x/rest/v1/leaderboard")).status_code
+        for _ in range(7)
+    ]
+    assert statuses == [200] * 5 + [429] * 2
+
+    httpd = server.serve()
+    try:
+        url = f"http://127.0.0.1:{httpd.server_address[1]}/rest/v1/leaderboard"
+        assert (
+            httpx.get(url, params={"limit": 1}, headers={"apikey": "anon"}).json()[0][
+                "score"
+            ]
+            == 40
+        )
+        assert httpx.get(url, headers={"apikey": "wrong"}).status_code == 401
+    finally:
+        httpd.shutdown()
+
+
+@pytest.mark.performance
+def test_leaderboard_load_generator_contract():
+    """The load generator reports p50/p99 latency and throughput per operation."""
+    from game.src.services.local_postgrest import LocalPostgrest
+    from game.src.services.supabase_client import SupabaseClient
+    from game.tests.performance.load_leaderboard import run_load
+
+    client = SupabaseClient(
+        "http://stand-in", "k", rate_limits=None, transport=LocalPostgrest().transport()
+    )
+
+    async def scenario():
+        async with client:
+            return await run_load(client, requests=100, concurrency=8)
+
+    report = asyncio.run(scenario())
+    assert report["total"]["errors"] == 0
+    assert report["fetch_top"]["count"] + report["submit_score"]["count"] == 100
+    for op in ("fetch_top", "submit_score"):
+        assert report[op]["p99_ms"] >= report[op]["p50_ms"] >= 0.0
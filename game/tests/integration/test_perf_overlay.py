@@ -0,0 +1,65 @@
+import gc
+
+import pytest
+
+
+@pytest.mark.integration
+def test_perf_overlay_contract():
+    """
+    The overlay toggle in the game's own SettingsState attaches a PerfOverlay
+    to the shared HUD, which enables the profiler, hooks gc.callbacks and
+    watches each new run. It reports rolling FPS, a frame-time histogram,
+    per-system costs, pipe and pool counts and GC collections with pause
+    times; toggling again detaches everything, but a profiler that was
+    already on stays on.
+    """
+    from game.src.states.game_state_manager import GameStateManager
+    from game.src.systems.profiler import PROFILER, Profiler
+    from game.src.ui.perf_overlay import PerfOverlay
+
+    manager = GameStateManager()
+    hud = manager.hud
+    assert manager.to_settings()
+    settings = manager.screen
+    try:
+        assert settings.toggle_perf_overlay() is True
+        overlay = hud.overlay
+        assert overlay is not None and PROFILER.enabled
+        assert overlay._on_gc in gc.callbacks
+
+        assert manager.back() and manager.start_game()
+        sim = manager.screen.simulation
+        assert overlay.simulation is sim
+        for i in range(60):
+            manager.update(1 / 25 if i % 10 == 0 else 1 / 60)
+            manager.draw()
+        gc.collect()
+        assert 50 < overlay.fps < 58
+        assert overlay.histogram() == {
+            "<8ms": 0,
+            "<17ms": 54,
+            "<33ms": 0,
+            "<50ms": 6,
+            "50ms+": 0,
+        }
+        assert (
+            overlay.entity_counts()["pool_capacity"] == sim.pipe_generator.pool.capacity
+        )
+        gc_stats = overlay.gc_stats()
+        assert gc_stats["gen2"] >= 1 and gc_stats["pause_max_ms"] > 0
+
+        lines = overlay.build_lines()
+        assert lines[0].startswith("FPS")
+        assert any(line.startswith("PhysicsSystem.update") for line in lines)
+        assert any(line.startswith("gc ") for line in lines)
+    finally:
+        settings.toggle_perf_overlay()
+    assert hud.overlay is None and not PROFILER.enabled
+    assert overlay._on_gc not in gc.callbacks
+    assert "update" not in vars(sim.physics)
+
+    profiler = Profiler(enabled=True)
+    other = PerfOverlay(profiler)
+    other.attach()
+    other.detach()
+    assert profiler.enabled
@@ -0,0 +1,45 @@
+import pytest
+
+
+@pytest.mark.integration
+def test_pipe_pool_recycles_pipes_contract():
+    """
+    PipeGenerator spawns pipes from a fixed-size PipePool into a PipeRing of
+    live pipes; recycle_offscreen returns pipes that left the screen, so a
+    normal session reuses pipes without allocating (zero pool misses). A
+    caller that never recycles hits ``max_live`` instead of growing forever.
+    """
+    from game.src.systems.pipe_generator import PipeGenerator
+    from game.src.systems.pipe_pool import PipeRing
+    from game.src.systems.simulation import Simulation
+
+    gen = PipeGenerator(spawn_interval=1.0, pool_size=2)
+    first = gen.spawn_if_needed(1.0, x=-100.0, gap_y=300.0)[0]
+    assert gen.spawn_if_needed(1.5, x=0.0, gap_y=300.0) == []
+    assert gen.recycle_offscreen(0.0) == 1
+    assert len(gen.live) == 0
+    again = gen.spawn_if_needed(2.0, x=500.0, gap_y=250.0)[0]
+    assert again is first
+    assert (again.position.x, again.gap_y) == (500.0, 250.0)
+    assert (gen.pool.hits, gen.pool.misses) == (2, 0)
+
+    leaky = PipeGenerator(spawn_interval=1.0, max_live=3)
+    for t in range(3):
+        leaky.spawn_if_needed(float(t + 1), x=500.0, gap_y=300.0)
+    with pytest.raises(RuntimeError, match="recycle_offscreen"):
+        leaky.spawn_if_needed(4.0, x=500.0, gap_y=300.0)
+
+    # Two minutes of ticks; tick() keeps stepping pipes even after a crash
+    sim = Simulation(seed=4)
+    for _ in range(60 * 120):
+        sim.tick()
+    generator = sim.pipe_generator
+    assert generator.pool.hits > 50
+    assert generator.pool.misses == 0
+    assert generator.live.grows == 0
+
+    ring = PipeRing(2)
+    for item in ("a", "b", "c"):
+        ring.append(item)
+    assert ring.popleft() == "a"
+    assert list(ring) == ["b", "c"] and ring[-1] == "c" and ring.grows == 1
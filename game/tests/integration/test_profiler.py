@@ -0,0 +1,83 @@
+import gc
+import json
+
+import pytest
+
+
+@pytest.mark.integration
+def test_profiler_scopes_contract(tmp_path):
+    """
+    A disabled Profiler records nothing and wraps nothing. Enabled, it times
+    named scopes and instrumented Simulation systems into bounded rings,
+    reports p50/p95/p99 per scope in milliseconds, exports Chrome-trace JSON,
+    removes every wrapper on disable and re-instruments the watched run on
+    enable.
+    """
+    from game.src.systems.profiler import SIMULATION_SCOPES, Profiler
+    from game.src.systems.simulation import Simulation
+
+    now = [0]
+
+    def clock():
+        now[0] += 1_000_000
+        return now[0]
+
+    profiler = Profiler(capacity=8, clock=clock)
+    with profiler.scope("HUD.draw"):
+        pass
+    profiler.mark_frame()
+    assert profiler.rings == {}
+
+    profiler.enable()
+    for _ in range(20):
+        with profiler.scope("HUD.draw"):
+            pass
+    ring = profiler.rings["HUD.draw"]
+    assert ring.count == 20 and len(ring) == 8
+    assert profiler.percentiles("HUD.draw") == {"p50": 1.0, "p95": 1.0, "p99": 1.0}
+
+    sim = Simulation(seed=3)
+    profiler.instrument_simulation(sim)
+    for _ in range(120):
+        sim.tick()
+    stats = profiler.stats()
+    for name in (
+        "Simulation.tick",
+        "PhysicsSystem.update",
+        "CollisionSystem.check_bird_pipe",
+        "PipeGenerator.spawn_if_needed",
+        "Simulation._score_passed_pipes",
+    ):
+        assert stats[name]["count"] > 0
+        assert stats[name]["p99"] >= stats[name]["p50"] > 0
+
+    path = tmp_path / "trace.json"
+    profiler.export_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+    assert events and {e["ph"] for e in events} == {"X"}
+    assert all(e["dur"] > 0 and e["ts"] >= 0 for e in events)
+
+    profiler.disable()
+    assert "tick" not in vars(sim) and "update" not in vars(sim.physics)
+    sim.tick()
+    assert profiler.rings["Simulation.tick"].count == 120
+
+    # The watched live run is wrapped again on every enable
+    profiler.watch_simulation(sim)
+    profiler.enable()
+    sim.tick()
+    assert profiler.rings["Simulation.tick"].count == 121
+    profiler.disable()
+    profiler.enable()
+    sim.tick()
+    assert profiler.rings["Simulation.tick"].count == 122
+
+    # Finished runs are freed at once and do not pile up in the wrapper list
+    gc.disable()
+    try:
+        for seed in range(5):
+            profiler.watch_simulation(Simulation(seed=seed))
+    finally:
+        gc.enable()
+    assert len(profiler._wrapped) == 2 * len(SIMULATION_SCOPES)
+    profiler.disable()
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.integration
+def test_rank_index_contract():
+    """
+    RankIndex answers rank and percentile from local snapshots, dedupes rows
+    by id, and extrapolates past the snapshot once the server total is known.
+    GameOver shows the estimate instantly and reconciles it with the server.
+    """
+    from game.src.services.leaderboard_service import LeaderboardService
+    from game.src.services.local_postgrest import LocalPostgrest
+    from game.src.services.rank_index import RankIndex
+    from game.src.services.supabase_client import SupabaseClient
+    from game.src.states.game_over import GameOver
+
+    index = RankIndex()
+    index.update(
+        [{"id": "a", "score": 50}, {"id": "b", "score": 30}, {"id": "c", "score": 30}]
+    )
+    index.add({"id": "a", "score": 40})  # same row re-fetched with a new score
+    assert len(index) == 3
+    assert index.rank(100) == 1
+    assert index.rank(40) == 1
+    assert index.rank(30) == 2
+    assert index.rank(35) == 2
+    assert index.percentile(40) == 100.0
+    index.total = 103
+    # 100 unseen rows assumed spread over [0, 30]: half of them beat 15
+    assert index.rank(15) == 3 + 50 + 1
+
+    server = LocalPostgrest()
+    client = SupabaseClient(
+        "http://stand-in", "k", rate_limits=None, transport=server.transport()
+    )
+    service = LeaderboardService(client)
+
+    async def scenario():
+        async with client:
+            rows = [
+                {
+                    "id": f"id-{i:03d}",
+                    "name": f"P{i}",
+                    "score": i,
+                    "created_at": "2025-01-01T00:00:00Z",
+                }
+                for i in range(200)
+            ]
+            assert (await client.post("/leaderboard", json=rows)).status_code == 201
+            await service.afetch_top(limit=20)
+            assert len(service.rank_index) == 20
+
+            screen = GameOver(service)
+            screen.show_result(190, reason="pipe")
+            assert screen.rank == 10 and not screen.rank_confirmed
+            assert await screen.reconcile_rank() == 10
+            assert screen.rank_confirmed
+            assert service.rank_index.total == 200
+
+            # Below the snapshot the estimate extrapolates from the server total
+            screen.show_result(90)
+            estimate = screen.rank
+            assert abs(estimate - 110) <= 5
+            assert await screen.reconcile_rank() == 110
+
+            await service.asubmit_score("new", 250)
+            assert service.estimate_rank(240) == 2
+
+    asyncio.run(scenario())
@@ -0,0 +1,100 @@
+import asyncio
+import base64
+import io
+
+import pytest
+
+
+@pytest.mark.integration
+def test_replay_roundtrip_contract(tmp_path):
+    """
+    A recorded run encodes to a few hundred bytes, streams back through
+    ReplayReader flap by flap, replays to the identical tick and score, and
+    rejects corrupted or truncated data. Replays are submitted with scores.
+    """
+    from game.src.states.running_game import RunningGame
+    from game.src.systems.headless import follow_gap, observe
+    from game.src.systems.replay import ReplayError, ReplayReader, play
+
+    game = RunningGame(seed=11, difficulty="hard")
+    sim = game.simulation
+    assert game.replay is None
+    while sim.alive and sim.tick_count < 60 * 120:
+        if follow_gap(observe(sim)):
+            sim.flap()
+            sim.flap()  # a second flap in the same tick is not a second input
+        sim.tick()
+    assert not sim.alive and sim.score.current_score > 0
+    data = game.replay
+    assert data is not None
+    assert len(data) < 40 + 2 * game.recorder.flaps
+
+    reader = ReplayReader(io.BytesIO(data))
+    assert reader.header.seed == 11 and reader.header.difficulty == "hard"
+    flaps = iter(reader)
+    first = next(flaps)
+    assert reader.final_tick is None  # nothing read past the first flap
+    assert first >= 0
+    rest = list(flaps)
+    assert len(rest) + 1 == game.recorder.flaps
+    assert (reader.final_tick, reader.final_score) == (
+        sim.tick_count,
+        sim.score.current_score,
+    )
+
+    replayed = play(ReplayReader.from_bytes(data))
+    assert (
+        replayed.tick_count,
+        replayed.score.current_score,
+        replayed.cause_of_death,
+    ) == (
+        sim.tick_count,
+        sim.score.current_score,
+        sim.cause_of_death,
+    )
+    assert replayed.bird.position.y == sim.bird.position.y
+
+    corrupt = bytearray(data)
+    corrupt[len(corrupt) // 2] ^= 0x01
+    with pytest.raises(ReplayError):
+        list(ReplayReader.from_bytes(bytes(corrupt)))
+    with pytest.raises(ReplayError):
+        list(ReplayReader.from_bytes(data[:-3]))
+    with pytest.raises(ReplayError):
+        ReplayReader.from_bytes(b"nope")
+
+    # The replay rides along with the score submission
+    from game.src.services.leaderboard_service import LeaderboardService
+    from game.src.services.local_postgrest import LocalPostgrest
+    from game.src.services.local_storage import LocalStorage
+    from game.src.services.score_outbox import ScoreOutbox
+    from game.src.services.supabase_client import SupabaseClient
+
+    server = LocalPostgrest()
+    client = SupabaseClient(
+        "http://stand-in", "k", rate_limits=None, transport=server.transport()
+    )
+
+    async def submit():
+        async with client:
+            record = await LeaderboardService(client).asubmit_score(
+                "Ghost", sim.score.current_score, replay=data
+            )
+            assert "replay" not in record
+            # Queued scores carry their replay through the outbox too
+            service = LeaderboardService(
+                client, outbox=ScoreOutbox(LocalStorage(str(tmp_path)))
+            )
+            queued = service.submit_score(
+                "Queued", sim.score.current_score, replay=data
+            )
+            assert await service.sync_outbox() == 1
+            replays = []
+            for row_id in (record["id"], queued["id"]):
+                response = await client.get(
+                    "/leaderboard", params={"select": "replay", "id": f"eq.{row_id}"}
+                )
+                replays.append(base64.b64decode(response.json()[0]["replay"]))
+            return replays
+
+    assert asyncio.run(submit()) == [data, data]
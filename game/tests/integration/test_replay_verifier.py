@@ -0,0 +1,97 @@
+import random
+
+import pytest
+
+
+def _record(seed, noise=0.0, **sim_kwargs):
+    from game.src.systems.headless import follow_gap, observe
+    from game.src.systems.replay import ReplayRecorder
+    from game.src.systems.simulation import Simulation
+
+    rng = random.Random(seed)
+    sim = Simulation(seed=seed, **sim_kwargs)
+    recorder = ReplayRecorder.for_simulation(sim)
+    while sim.alive:
+        assert sim.tick_count < 60 * 300
+        if follow_gap(observe(sim)) or rng.random() < noise:
+            sim.flap()
+        sim.tick()
+    data = recorder.finish(sim.tick_count, sim.score.current_score)
+    return data, sim.score.current_score
+
+
+def _record_over_the_pipes(seed):
+    # Recorded with standard rules but no ceiling: flap blindly over every
+    # pipe for a minute, then drop to the ground
+    from game.src.systems.replay import ReplayRecorder
+    from game.src.systems.simulation import Simulation
+
+    sim = Simulation(seed=seed)
+    recorder = ReplayRecorder.for_simulation(sim)
+    sim.world_height = float("inf")
+    while sim.alive:
+        if sim.tick_count % 20 == 0 and sim.tick_count < 60 * 60:
+            sim.flap()
+        sim.tick()
+    return recorder.data, sim.score.current_score
+
+
+@pytest.mark.integration
+def test_replay_verifier_contract():
+    """
+    verify_batch accepts honest (replay, score) pairs, rejects forged or
+    mismatched ones with the first divergent tick (including runs that only
+    score by flying over the pipes), and gives the same verdicts in
+    lockstep, scalar and process-pool modes.
+    """
+    from game.src.systems.physics import PhysicsSystem
+    from game.src.systems.replay import ReplayReader, ReplayRecorder
+    from game.src.systems.replay_verifier import (
+        DIED_EARLY,
+        OUTLIVED,
+        _parse,
+        verify_batch,
+        verify_scalar,
+    )
+
+    honest = [_record(seed % 4, noise=0.01 * (seed % 3)) for seed in range(12)]
+    items = list(honest)
+
+    # Same flaps, inflated footer: the bird dies long before the claimed end
+    reader = ReplayReader.from_bytes(honest[0][0])
+    flaps = list(reader)
+    forged = ReplayRecorder(reader.header)
+    for tick in flaps:
+        forged.record_flap(tick)
+    items.append((forged.finish(reader.final_tick + 600, 50), 50))
+    # Footer cut short: the bird is still flying when the replay stops
+    short = ReplayRecorder(reader.header)
+    items.append((short.finish(10, 0), 0))
+    items.append((honest[1][0], honest[1][1] + 1))
+    items.append((b"junk", 3))
+    cheat, cheat_score = _record(2, physics=PhysicsSystem(gravity=500.0))
+    items.append((cheat, cheat_score))
+    over, over_score = _record_over_the_pipes(1)
+    items.append((over, over_score))
+
+    verdicts = verify_batch(items, workers=0, chunk_size=5)
+    assert all(v.accepted for v in verdicts[:12])
+    assert [v.score for v in verdicts[:12]] == [score for _, score in honest]
+    assert (
+        verdicts[12].reason == DIED_EARLY
+        and verdicts[12].divergence_tick == reader.final_tick
+    )
+    assert verdicts[13].reason == OUTLIVED and verdicts[13].divergence_tick == 10
+    assert not verdicts[14].accepted and "differs" in verdicts[14].reason
+    assert verdicts[15].reason.startswith("malformed")
+    assert verdicts[16].reason == "non-standard game settings"
+    assert over_score > 0
+    assert verdicts[17].reason == DIED_EARLY and verdicts[17].score == 0
+
+    for index in [*range(14), 17]:
+        data, claimed = items[index]
+        run, _ = _parse(index, data, claimed)
+        assert (
+            verify_scalar(ReplayReader.from_bytes(data).header, run) == verdicts[index]
+        )
+    assert verify_batch(items, workers=2, chunk_size=5) == verdicts
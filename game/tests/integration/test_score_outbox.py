@@ -0,0 +1,160 @@
+import asyncio
+import json
+
+import pytest
+
+
+@pytest.mark.integration
+def test_offline_score_outbox_contract(tmp_path):
+    """
+    Scores submitted while offline are appended to a durable outbox in the same
+    LocalStorage as SaveData, survive a restart, and drain in bulk inserts keyed
+    by client ids once the network is back, backing off on failures. A
+    torn last line from a crash does not swallow the next queued score.
+    """
+    import httpx
+
+    from game.src.models.save_data import SaveData
+    from game.src.services.leaderboard_service import LeaderboardService
+    from game.src.services.local_storage import LocalStorage
+    from game.src.services.score_outbox import ScoreOutbox
+    from game.src.services.supabase_client import SupabaseClient
+
+    storage = LocalStorage(str(tmp_path))
+    SaveData(high_score=12).save(storage)
+    assert SaveData.load(storage).high_score == 12
+
+    online = {"up": False}
+    bodies = []
+    stored = {}
+
+    def handler(request):
+        if not online["up"]:
+            raise httpx.ConnectError("offline")
+        body = json.loads(request.content)
+        bodies.append(body)
+        for row in body if isinstance(body, list) else [body]:
+            stored.setdefault(row.get("id"), row)
+        return httpx.Response(201)
+
+    now = {"t": 0.0}
+
+    def make_service():
+        client = SupabaseClient(
+            "https://x.supabase.co",
+            "k",
+            rate_limits=None,
+            transport=httpx.MockTransport(handler),
+        )
+        outbox = ScoreOutbox(storage, batch_size=2, clock=lambda: now["t"])
+        return LeaderboardService(client, outbox=outbox)
+
+    async def offline_session():
+        service = make_service()
+        await service.asubmit_score("Ann", 3)
+        service.submit_score("Bo", 5)
+        service.submit_score("Cy", 8)
+        assert await service.sync_outbox() == 0
+        assert service.outbox.failures == 1 and service.outbox.next_attempt > 0
+        return [r["id"] for r in service.outbox.pending()]
+
+    queued_ids = asyncio.run(offline_session())
+    assert len(queued_ids) == 3
+
+    async def reconnect():
+        # A fresh process replays the outbox from disk
+        service = make_service()
+        assert [r["id"] for r in service.outbox.pending()] == queued_ids
+        online["up"] = True
+        now["t"] = 1000.0
+        return await service.sync_outbox()
+
+    assert asyncio.run(reconnect()) == 3
+    assert [len(b) for b in bodies] == [2, 1]
+    assert list(stored) == queued_ids
+    assert all(set(row) == {"id", "name", "score", "replay"} for row in stored.values())
+    assert len(make_service().outbox) == 0
+    assert not storage.path("score_outbox.jsonl").exists()
+
+    # A crash mid-append tears the last line; the next score must still land whole
+    outbox = ScoreOutbox(storage)
+    outbox.enqueue("Ann", 1)
+    with open(storage.path("score_outbox.jsonl"), "a") as f:
+        f.write('{"op": "add", "record": {"id": "torn", "na')
+    ScoreOutbox(storage).enqueue("Bo", 2)
+    assert [r["name"] for r in ScoreOutbox(storage).pending()] == ["Ann", "Bo"]
+
+
+@pytest.mark.integration
+def test_score_outbox_keeps_scores_on_rejection_contract(tmp_path):
+    """
+    An expired key (401) keeps every queued score for a later retry. A batch
+    the server rejects because of one bad row is resent score by score, so
+    only that row is dropped and the valid scores still land. A direct submit
+    that is committed before a 5xx comes back is queued under the id it was
+    sent with, so the retry does not insert it twice. Queued scores with and
+    without a replay share one bulk insert.
+    """
+    import httpx
+
+    from game.src.services.local_postgrest import LocalPostgrest
+    from game.src.services.local_storage import LocalStorage
+    from game.src.services.score_outbox import ScoreOutbox
+    from game.src.services.supabase_client import SupabaseClient
+
+    server = LocalPostgrest(anon_key="anon")
+    outbox = ScoreOutbox(LocalStorage(str(tmp_path)), clock=lambda: 0.0)
+    for name, score in [("Ann", 3), ("", 4), ("Cy", 5)]:
+        outbox.enqueue(name, score)
+
+    async def drain(key):
+        async with SupabaseClient(
+            "http://stand-in", key, rate_limits=None, transport=server.transport()
+        ) as client:
+            return await outbox.drain(client)
+
+    assert asyncio.run(drain("expired")) == 0
+    assert len(outbox) == 3 and outbox.failures == 1
+
+    outbox.next_attempt = 0.0
+    assert asyncio.run(drain("anon")) == 2
+    assert len(outbox) == 0 and outbox.failures == 0
+    rows = server.handle(
+        httpx.Request(
+            "GET", "http://stand-in/rest/v1/leaderboard", headers={"apikey": "anon"}
+        )
+    )
+    assert sorted(r["name"] for r in rows.json()) == ["Ann", "Cy"]
+
+    from game.src.services.leaderboard_service import LeaderboardService
+
+    def flaky(request):
+        # Commits the row, then the response is lost to a gateway error
+        server.handle(request)
+        return httpx.Response(502)
+
+    async def submit_then_sync():
+        transport = httpx.MockTransport(flaky)
+        async with SupabaseClient(
+            "http://stand-in", "anon", rate_limits=None, transport=transport
+        ) as client:
+            record = await LeaderboardService(client, outbox=outbox).asubmit_score(
+                "Dee", 9
+            )
+        return record, await drain("anon")
+
+    record, delivered = asyncio.run(submit_then_sync())
+    assert delivered == 1 and len(outbox) == 0
+    params = {"select": "id,created_at", "name": "eq.Dee"}
+    request = httpx.Request(
+        "GET",
+        "http://stand-in/rest/v1/leaderboard",
+        params=params,
+        headers={"apikey": "anon"},
+    )
+    assert [row["id"] for row in server.handle(request).json()] == [record["id"]]
+
+    outbox.enqueue("Eve", 6, replay="AAEC")
+    outbox.enqueue("Fay", 7)
+    before = server.requests
+    assert asyncio.run(drain("anon")) == 2 and server.requests == before + 1
@@ -0,0 +1,77 @@
+import pytest
+
+
+@pytest.mark.integration
+def test_state_machine_hooks_contract():
+    """
+    GameStateManager follows its transition table, builds screens lazily on
+    first visit, reuses them afterwards, calls on_exit/on_enter around each
+    transition, and rejects transitions missing from the table. "back" leaves
+    settings for the state it was opened from, and returning to the menu
+    discards the run so the next start is a new game.
+    """
+    from game.src.models.game_state import GameState
+    from game.src.states.game_state_manager import GameStateManager
+
+    calls = []
+    built = []
+
+    def factory(state):
+        class Screen:
+            def __init__(self):
+                built.append(state)
+
+            def on_enter(self):
+                calls.append(("enter", state))
+
+            def on_exit(self):
+                calls.append(("exit", state))
+
+        return Screen
+
+    manager = GameStateManager({state: factory(state) for state in GameState})
+    assert built == [GameState.MAIN_MENU]
+    assert calls == [("enter", GameState.MAIN_MENU)]
+
+    assert manager.start_game()
+    assert manager.pause()
+    assert manager.resume()
+    assert calls[1:] == [
+        ("exit", GameState.MAIN_MENU),
+        ("enter", GameState.RUNNING),
+        ("exit", GameState.RUNNING),
+        ("enter", GameState.PAUSED),
+        ("exit", GameState.PAUSED),
+        ("enter", GameState.RUNNING),
+    ]
+    assert built == [GameState.MAIN_MENU, GameState.RUNNING, GameState.PAUSED]
+    assert GameState.SETTINGS not in manager.screens
+
+    # Rejected transitions touch neither state nor hooks
+    before = len(calls)
+    assert not manager.resume()
+    assert not manager.to_leaderboard()
+    assert manager.state == GameState.RUNNING and len(calls) == before
+
+    assert manager.game_over() and manager.to_leaderboard() and manager.to_menu()
+    assert manager.start_game()
+    # The finished run was left for the menu, so a new RUNNING screen is built
+    assert built.count(GameState.RUNNING) == 2
+
+    # Settings opened from a pause returns to it with the run intact
+    running = manager.screen
+    assert manager.pause() and manager.to_settings() and manager.back()
+    assert manager.state == GameState.PAUSED
+    assert manager.resume() and manager.screen is running
+    # Leaving for the menu abandons the run: the next start is a new game
+    assert manager.pause() and manager.to_menu() and manager.start_game()
+    assert manager.screen is not running and built.count(GameState.RUNNING) == 3
+    assert manager.to_menu() and manager.to_settings() and manager.back()
+    assert manager.state == GameState.MAIN_MENU
+    assert not manager.back()
+
+    # Default factories build the real screens
+    real = GameStateManager()
+    assert real.to_settings()
+    assert type(real.screen).__name__ == "SettingsState"
+    assert set(real.screens) == {GameState.MAIN_MENU, GameState.SETTINGS}
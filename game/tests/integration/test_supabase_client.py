@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+
+@pytest.mark.integration
+def test_pooled_supabase_client_contract():
+    """
+    SupabaseClient reuses one pooled httpx.AsyncClient carrying the apikey and
+    Authorization headers, bounds in-flight requests with max_concurrency, and
+    LeaderboardService can read and write through it.
+    """
+    import httpx
+
+    from game.src.services.leaderboard_service import LeaderboardService
+    from game.src.services.supabase_client import SupabaseClient
+
+    seen = []
+    state = {"in_flight": 0, "peak": 0}
+
+    async def handler(request):
+        seen.append(request)
+        state["in_flight"] += 1
+        state["peak"] = max(state["peak"], state["in_flight"])
+        await asyncio.sleep(0.01)
+        state["in_flight"] -= 1
+        if request.method == "POST":
+            return httpx.Response(
+                201, json=[{"id": "1", "name": "Ann", "score": 7, "created_at": "now"}]
+            )
+        return httpx.Response(
+            200, json=[{"id": "1", "name": "Ann", "score": 7, "created_at": "now"}]
+        )
+
+    client = SupabaseClient(
+        "https://example.supabase.co",
+        "anon-key",
+        max_concurrency=3,
+        rate_limits=None,
+        transport=httpx.MockTransport(handler),
+    )
+    service = LeaderboardService(client)
+
+    async def scenario():
+        async with client:
+            pool = client._client
+            # Distinct limits so the leaderboard cache cannot coalesce them
+            tops = await asyncio.gather(
+                *(service.afetch_top(limit=n) for n in range(1, 13))
+            )
+            record = await service.asubmit_score("Ann", 7)
+            assert client._client is pool
+        return tops, record
+
+    tops, record = asyncio.run(scenario())
+    assert all(top[0]["score"] == 7 for top in tops)
+    assert record["name"] == "Ann"
+    assert state["peak"] == 3
+    first = seen[0]
+    assert str(first.url).startswith("https://example.supabase.co/rest/v1/leaderboard?")
+    assert first.headers["apikey"] == "anon-key"
+    assert first.headers["Authorization"] == "Bearer anon-key"
+    assert seen[-1].headers["Prefer"] == "return=representation"
+
+
+@pytest.mark.integration
+def test_rate_limiter_paces_requests_contract(tmp_path):
+    """
+    RateLimiter delays requests that would exceed any configured window; with
+    the contract's limits a client never goes past 100 requests an hour. A
+    request that would wait longer than its timeout gets a local 429 at once,
+    which the outbox treats as a transient failure.
+    """
+    import httpx
+
+    from game.src.services.local_storage import LocalStorage
+    from game.src.services.score_outbox import ScoreOutbox
+    from game.src.services.supabase_client import (
+        CONTRACT_RATE_LIMITS,
+        RateLimiter,
+        SupabaseClient,
+    )
+
+    now = {"t": 0.0}
+    sleeps = []
+
+    async def fake_sleep(delay):
+        sleeps.append(delay)
+        now["t"] += delay
+
+    async def scenario():
+        limiter = RateLimiter(((2, 10.0),), clock=lambda: now["t"], sleep=fake_sleep)
+        for _ in range(5):
+            await limiter.acquire()
+
+    asyncio.run(scenario())
+    assert sleeps == [10.0, 10.0]
+
+    async def paced_hour():
+        now["t"] = 0.0
+        limiter = RateLimiter(
+            CONTRACT_RATE_LIMITS, clock=lambda: now["t"], sleep=fake_sleep
+        )
+        sent = []
+        while now["t"] < 3600.0:
+            await limiter.acquire()
+            sent.append(now["t"])
+        return [t for t in sent if t < 3600.0]
+
+    assert len(asyncio.run(paced_hour())) == 100
+
+    async def spent_budget():
+        now["t"] = 0.0
+        sleeps.clear()
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        async with SupabaseClient(
+            "http://x", "k", timeout=10.0, transport=transport
+        ) as client:
+            client.rate_limiter = RateLimiter(
+                ((1, 3600.0),), clock=lambda: now["t"], sleep=fake_sleep
+            )
+            first = await client.get("/leaderboard")
+            second = await client.get("/leaderboard")
+            outbox = ScoreOutbox(LocalStorage(str(tmp_path)), clock=lambda: now["t"])
+            outbox.enqueue("Ann", 3)
+            return first, second, await outbox.drain(client), outbox
+
+    first, second, delivered, outbox = asyncio.run(spent_budget())
+    assert first.status_code == 200
+    assert second.status_code == 429 and second.headers["Retry-After"] == "3600"
+    assert sleeps == []
+    assert delivered == 0 and len(outbox) == 1 and outbox.failures == 1
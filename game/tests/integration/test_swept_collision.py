@@ -0,0 +1,69 @@
+import pytest
+
+
+@pytest.mark.integration
+def test_swept_collision_catches_tunneling_contract():
+    """
+    CollisionSystem.sweep_bird_pipe(bird, previous, pipes, pipe_dx) returns the
+    time of impact in [0, 1] for movement over a step, catching pipes that the
+    end-of-step overlap test misses.
+    """
+    from game.src.entities.bird import Bird
+    from game.src.entities.pipe import Pipe
+    from game.src.systems.collision import CollisionSystem
+    from game.src.systems.physics import PhysicsSystem
+    from game.src.systems.simulation import Simulation
+
+    system = CollisionSystem()
+    pipe = Pipe()
+    pipe.position.x = 100
+    pipe.gap_y = 300
+    pipe.gap_size = 150
+
+    # Falls from inside the gap straight through the bottom solid in one step
+    bird = Bird()
+    bird.position.x = 100
+    bird.position.y = -200
+    assert system.check_bird_pipe(bird, [pipe]) is False
+    toi = system.sweep_bird_pipe(bird, (100, 300), [pipe])
+    assert toi == pytest.approx((225 - 268) / -500)
+
+    # A thin pipe scrolls past the bird entirely within one step
+    thin = Pipe()
+    thin.position.x = -100
+    thin.width = 10
+    thin.gap_y = 500
+    bird.position.y = 200
+    assert system.check_bird_pipe(bird, [thin]) is False
+    assert system.sweep_bird_pipe(bird, (100, 200), [thin], pipe_dx=-400) is not None
+
+    # Clear paths and grazing contact report no impact
+    assert system.sweep_bird_pipe(bird, (100, 200), [thin]) is None
+    bird.position.x = 100
+    bird.position.y = 300
+    assert system.sweep_bird_pipe(bird, (100, 300), [pipe]) is None
+
+    # Already overlapping at the start of the step is an impact at t=0
+    bird.position.y = 100
+    assert system.sweep_bird_pipe(bird, (100, 100), [pipe]) == 0.0
+
+    # Coarse ticks with fast pipes tunnel through the discrete test only
+    # At 3000 the pipe also ends the step wholly off screen, where it is
+    # recycled; the sweep must still see it
+    for speed in (2750.0, 3000.0):
+        outcomes = []
+        for swept in (False, True):
+            sim = Simulation(
+                physics=PhysicsSystem(gravity=0.0),
+                seed=2,
+                tick_rate=5,
+                scroll_speed=speed,
+                swept_collision=swept,
+            )
+            sim.bird.position.y = 100.0
+            for _ in range(50):
+                sim.advance(0.2)
+            outcomes.append(sim.alive)
+        assert outcomes == [True, False] and sim.cause_of_death == "pipe"
+    # The pipe that killed the bird ended that tick past the left edge
+    assert len(sim.pipes) == 0
@@ -0,0 +1,243 @@
+"""Micro-benchmarks for the core game systems.
+
+Run ``python -m game.tests.performance.benchmarks --output bench.json`` to write
+results as JSON, and add ``--baseline game/tests/performance/baseline.json`` to
+fail (exit 1) when any benchmark is slower than the baseline by more than
+``--tolerance``.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from game.src.entities.bird import Bird
+from game.src.entities.pipe import Pipe
+from game.src.models.game_state import GameState
+from game.src.states.game_state_manager import GameStateManager
+from game.src.systems.collision import CollisionSystem
+from game.src.systems.headless import follow_gap, observe
+from game.src.systems.physics import PhysicsSystem
+from game.src.systems.pipe_generator import PipeGenerator
+from game.src.systems.replay import ReplayRecorder
+from game.src.systems.replay_verifier import verify_batch
+from game.src.systems.simulation import Simulation
+
+PIPE_COUNTS = (1, 10, 100, 1000)
+REPLAY_BATCH = 100
+
+
+def _measure(op: Callable[[], None], iterations: int, repeats: int) -> Dict:
+    # Best of several repeats keeps scheduler noise out of the number
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(iterations):
+            op()
+        best = min(best, time.perf_counter() - start)
+    return {"ops_per_sec": iterations / best, "iterations": iterations, "seconds": best}
+
+
+def _physics_update():
+    physics = PhysicsSystem()
+    bird = Bird()
+
+    def op():
+        physics.update(bird, 1 / 60)
+        if bird.position.y < -1e6:
+            bird.position.y = 0.0
+
+    return op
+
+
+def _collision(count: int):
+    system = CollisionSystem()
+    pipes = []
+    for i in range(count):
+        pipe = Pipe()
+        pipe.position.x = 240.0 * i
+        pipes.append(pipe)
+    bird = Bird()
+    bird.position.x = 120.0 * count
+    bird.position.y = 300.0
+    return lambda: system.check_bird_pipe(bird, pipes)
+
+
+def _collision_moving(count: int):
+    # Pipes scroll every tick as in the game; the index only moves its offset
+    system = CollisionSystem()
+    pipes = []
+    for i in range(count):
+        pipe = Pipe()
+        pipe.position.x = 240.0 * i
+        pipes.append(pipe)
+        system.index.insert(pipe)
+    bird = Bird()
+    bird.position.x = 120.0 * count
+    bird.position.y = 300.0
+    state = {"dx": 1.0}
+
+    def op():
+        dx = state["dx"] = -state["dx"]
+        for pipe in pipes:
+            pipe.position.x -= dx
+        system.index.scroll(dx)
+        system.check_bird_pipe(bird, system.index)
+
+    return op
+
+
+def _pipe_spawn():
+    generator = PipeGenerator(spawn_interval=0.0)
+    state = {"t": 0.0}
+
+    def op():
+        state["t"] += 1.0
+        generator.spawn_if_needed(state["t"], -100.0, 300.0)
+        generator.recycle_offscreen(0.0)
+
+    return op
+
+
+def _game_tick():
+    state = {"sim": Simulation(seed=0), "seed": 0}
+
+    def op():
+        sim = state["sim"]
+        if not sim.alive:
+            state["seed"] += 1
+            sim = state["sim"] = Simulation(seed=state["seed"])
+        if follow_gap(observe(sim)):
+            sim.flap()
+        sim.tick()
+
+    return op
+
+
+def _state_transitions():
+    manager = GameStateManager()
+
+    def op():
+        manager.start_game()
+        manager.pause()
+        manager.resume()
+        manager.game_over()
+        manager.to_menu()
+        assert manager.state == GameState.MAIN_MENU
+
+    return op
+
+
+def _record_replay(seed: int, noise: float):
+    rng = random.Random(seed)
+    sim = Simulation(seed=seed)
+    recorder = ReplayRecorder.for_simulation(sim)
+    while sim.alive:
+        if follow_gap(observe(sim)) or rng.random() < noise:
+            sim.flap()
+        sim.tick()
+    return recorder.data, sim.score.current_score
+
+
+def _replay_verify():
+    # A batch of honest replays over four courses, verified in lockstep in-process
+    runs = [_record_replay(seed % 4, 0.01 * (seed % 3)) for seed in range(20)]
+    items = runs * (REPLAY_BATCH // len(runs))
+
+    def op():
+        verdicts = verify_batch(items, workers=0)
+        assert all(v.accepted for v in verdicts)
+
+    return op
+
+
+def run_benchmarks(scale: float = 1.0, repeats: int = 3) -> Dict[str, Dict]:
+    """Run every benchmark; ``scale`` shrinks or grows the iteration counts."""
+
+    def n(iterations: int) -> int:
+        return max(1, int(iterations * scale))
+
+    results = {"physics_update": _measure(_physics_update(), n(100_000), repeats)}
+    for count in PIPE_COUNTS:
+        results[f"collision_check_{count}_pipes"] = _measure(
+            _collision(count), n(20_000), repeats
+        )
+        results[f"collision_moving_{count}_pipes"] = _measure(
+            _collision_moving(count), n(20_000), repeats
+        )
+    results["pipe_spawn"] = _measure(_pipe_spawn(), n(50_000), repeats)
+    results["game_tick"] = _measure(_game_tick(), n(20_000), repeats)
+    results["state_transitions"] = _measure(_state_transitions(), n(20_000), repeats)
+    results[f"replay_verify_{REPLAY_BATCH}_runs"] = _measure(
+        _replay_verify(), n(20), repeats
+    )
+    return results
+
+
+def compare(
+    results: Dict[str, Dict], baseline: Dict[str, Dict], tolerance: float
+) -> List[str]:
+    """Return a message for every benchmark slower than baseline beyond tolerance.
+
+    A baseline benchmark missing from ``results`` fails too, so renaming or
+    deleting one cannot slip past the gate.
+    """
+    regressions = []
+    for name, base in baseline.items():
+        current = results.get(name)
+        if current is None:
+            expected = base["ops_per_sec"]
+            regressions.append(
+                f"{name}: missing from this run (baseline {expected:.0f} ops/s)"
+            )
+            continue
+        floor = base["ops_per_sec"] * (1.0 - tolerance)
+        if current["ops_per_sec"] < floor:
+            regressions.append(
+                f"{name}: {current['ops_per_sec']:.0f} ops/s < {floor:.0f} "
+                f"(baseline {base['ops_per_sec']:.0f}, tolerance {tolerance:.0%})"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", help="write results JSON to this path")
+    parser.add_argument("--baseline", help="baseline JSON to compare against")
+    parser.add_argument(
+        "--tolerance", type=float, default=0.25, help="allowed slowdown (0.25 = 25%%)"
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="iteration count multiplier"
+    )
+    args = parser.parse_args(argv)
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "benchmarks": run_benchmarks(scale=args.scale),
+    }
+    for name, result in report["benchmarks"].items():
+        print(f"{name:32s} {result['ops_per_sec']:>14,.0f} ops/s")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["benchmarks"]
+        regressions = compare(report["benchmarks"], baseline, args.tolerance)
+        for message in regressions:
+            print(f"❌ {message}")
+        if regressions:
+            return 1
+        print("✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Load generator for the leaderboard path.
+
+Drives ``LeaderboardService.afetch_top``/``asubmit_score`` from many concurrent
+workers and reports throughput and p50/p99 latency per operation. By default it
+targets an in-process LocalPostgrest stand-in; pass ``--url`` to hit a server.
+
+    python -m game.tests.performance.load_leaderboard --concurrency 32 --requests 2000
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Dict, List
+
+from game.src.services.cache import SWRCache
+from game.src.services.leaderboard_service import LeaderboardService
+from game.src.services.local_postgrest import LocalPostgrest
+from game.src.services.supabase_client import SupabaseClient
+
+
+def percentile(samples: List[float], q: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summarize(latencies: Dict[str, List[float]], elapsed: float) -> Dict[str, Dict]:
+    report = {}
+    for op, samples in latencies.items():
+        report[op] = {
+            "count": len(samples),
+            "throughput_per_sec": len(samples) / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(samples, 0.50) * 1000,
+            "p99_ms": percentile(samples, 0.99) * 1000,
+        }
+    return report
+
+
+async def run_load(
+    client: SupabaseClient,
+    requests: int = 1000,
+    concurrency: int = 16,
+    write_ratio: float = 0.2,
+    seed: int = 0,
+) -> Dict[str, Dict]:
+    """Issue ``requests`` operations from ``concurrency`` workers and summarize."""
+    # Always-expired cache: every read reaches the server, like a cold client
+    service = LeaderboardService(client, cache=SWRCache(ttl=-1.0, stale_ttl=0.0))
+    rng = random.Random(seed)
+    plan = [
+        "submit_score" if rng.random() < write_ratio else "fetch_top"
+        for _ in range(requests)
+    ]
+    latencies: Dict[str, List[float]] = {"fetch_top": [], "submit_score": []}
+    errors = {"count": 0}
+    queue = iter(enumerate(plan))
+
+    async def worker() -> None:
+        for i, op in queue:
+            start = time.perf_counter()
+            try:
+                if op == "fetch_top":
+                    await service.afetch_top(limit=1 + i % 50)
+                else:
+                    await service.asubmit_score(
+                        f"Bot {i % 1000}", rng.randrange(1_000_001)
+                    )
+            except Exception:
+                errors["count"] += 1
+                continue
+            latencies[op].append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    report = summarize(latencies, elapsed)
+    report["total"] = {
+        "elapsed_sec": elapsed,
+        "errors": errors["count"],
+        "throughput_per_sec": requests / elapsed,
+    }
+    return report
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--url", help="Supabase project URL (default: in-process stand-in)"
+    )
+    parser.add_argument("--anon-key", default="local-anon-key")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--write-ratio", type=float, default=0.2)
+    parser.add_argument("--output", help="write the report JSON to this path")
+    args = parser.parse_args(argv)
+
+    transport = None
+    if args.url is None:
+        transport = LocalPostgrest(anon_key=args.anon_key).transport()
+    client = SupabaseClient(
+        args.url or "http://stand-in.local",
+        args.anon_key,
+        max_concurrency=args.concurrency,
+        max_connections=args.concurrency,
+        rate_limits=None,
+        transport=transport,
+    )
+
+    async def run() -> Dict[str, Dict]:
+        async with client:
+            return await run_load(
+                client, args.requests, args.concurrency, args.write_ratio
+            )
+
+    report = asyncio.run(run())
+    for op in ("fetch_top", "submit_score"):
+        r = report[op]
+        print(
+            f"{op:14s} n={r['count']:6d}  {r['throughput_per_sec']:9.1f}/s  "
+            f"p50={r['p50_ms']:.2f}ms  p99={r['p99_ms']:.2f}ms"
+        )
+    print(
+        f"total          {report['total']['throughput_per_sec']:.1f} req/s, "
+        f"errors={report['total']['errors']}"
+    )
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
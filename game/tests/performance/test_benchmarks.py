@@ -0,0 +1,32 @@
+import pytest
+
+
+@pytest.mark.performance
+def test_benchmark_suite_contract():
+    """
+    The benchmark suite measures the core hot paths, reports ops/sec per
+    benchmark, flags slowdowns beyond the tolerance and baseline benchmarks
+    that no longer run, and a full game tick fits comfortably inside a 60 FPS
+    frame (FR-017).
+    """
+    from game.tests.performance.benchmarks import PIPE_COUNTS, compare, run_benchmarks
+
+    results = run_benchmarks(scale=0.01, repeats=1)
+    expected = {"physics_update", "pipe_spawn", "game_tick", "state_transitions"}
+    expected.add("replay_verify_100_runs")
+    expected |= {f"collision_check_{n}_pipes" for n in PIPE_COUNTS}
+    expected |= {f"collision_moving_{n}_pipes" for n in PIPE_COUNTS}
+    assert set(results) == expected
+    assert all(r["ops_per_sec"] > 0 for r in results.values())
+    assert results["game_tick"]["ops_per_sec"] > 60
+
+    baseline = {name: {"ops_per_sec": r["ops_per_sec"]} for name, r in results.items()}
+    assert compare(results, baseline, tolerance=0.25) == []
+    slower = dict(
+        results, game_tick={"ops_per_sec": results["game_tick"]["ops_per_sec"] / 2}
+    )
+    regressions = compare(slower, baseline, tolerance=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("game_tick")
+    renamed = {name: r for name, r in results.items() if name != "pipe_spawn"}
+    regressions = compare(renamed, baseline, tolerance=0.25)
+    assert len(regressions) == 1 and regressions[0].startswith("pipe_spawn: missing")